@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end throughput benchmark for enrich_csv.
+
+Starts the stand-in API server (mock_server.py) in its own process,
+points the Bright Data SDK at it via BRIGHTDATA_BASE_URL and enriches
+synthetic lead files of each requested size. Every size runs in a fresh
+process, so the reported peak RSS belongs to that run alone.
+
+Reports per size: leads/sec, p50/p95/p99 per-lead latency, peak RSS of
+the enrichment process and the requests the server answered.
+
+Usage:
+    python3 benchmarks/bench_enrich.py                      # 1k, 10k, 100k rows
+    python3 benchmarks/bench_enrich.py --rows 1000 --concurrency 20
+    python3 benchmarks/bench_enrich.py --rows 10000 --serp-latency 800:0.6 \\
+        --error-rate 0.02 --burst-every 30 --burst-length 3 --json results.json
+
+The SDK throttles each client to 10 requests/second on its own; the
+benchmark lifts that cap (--sdk-rate-limit 0) so the numbers reflect this
+pipeline and the --serp-rate/--scrape-rate limiters.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "shared-scripts"))
+
+from mock_server import add_profile_arguments, company_domain, profile_from_args, serve
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000]
+
+# Share of leads whose company already appeared earlier in the file
+REPEAT_COMPANY_RATE = 0.1
+# Share of leads with a free-mail address instead of a company address
+GENERIC_EMAIL_RATE = 0.25
+
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Eva", "Felix", "Greta", "Jonas", "Lena", "Paul"]
+LAST_NAMES = ["Bauer", "Fischer", "Hoffmann", "Koch", "Meyer", "Richter", "Schmidt", "Wolf"]
+
+
+def generate_leads(path: Path, rows: int, seed: int = 0) -> None:
+    """Write a tab-delimited file of synthetic German leads."""
+    rng = random.Random(seed)
+    companies: list[str] = []
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=["full_name", "company_name", "work_phone_number", "work_email"],
+            delimiter="\t",
+        )
+        writer.writeheader()
+        for i in range(rows):
+            if companies and rng.random() < REPEAT_COMPANY_RATE:
+                company = rng.choice(companies)
+            else:
+                company = f"Benchfirma {i:06d} GmbH"
+                companies.append(company)
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            if rng.random() < GENERIC_EMAIL_RATE:
+                email = f"{first}.{last}{i}@gmail.com".lower()
+            else:
+                email = f"{first[0]}.{last}@{company_domain(company)}".lower()
+            writer.writerow({
+                "full_name": f"{first} {last}",
+                "company_name": company,
+                "work_phone_number": f"+49 30 {rng.randrange(1_000_000, 9_999_999)}",
+                "work_email": email,
+            })
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def mock_probe_url(base_url: str) -> str:
+    """enrich.DIRECT_PROBE_URL template for the mock server's /site endpoint."""
+    return f"{base_url}/site/{{domain}}"
+
+
+async def _run_enrichment(job: dict) -> dict:
+    import enrich
+    from brightdata_utils import BrightDataSession
+    from rate_limiter import AdaptiveRateLimiter
+    from serp_cache import ScrapeCache, SerpCache
+
+    latencies: list[float] = []
+    enrich_lead = enrich.enrich_lead
+
+    async def timed_enrich_lead(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await enrich_lead(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    enrich.enrich_lead = timed_enrich_lead
+
+    cache = scrape_cache = None
+    if job["cache_dir"]:
+        cache = SerpCache(Path(job["cache_dir"]))
+        scrape_cache = ScrapeCache(Path(job["cache_dir"]))
+
+    session = BrightDataSession(
+        "benchmark-api-key",
+        cache=cache,
+        serp_limiter=AdaptiveRateLimiter(job["serp_rate"]),
+        scrape_limiter=AdaptiveRateLimiter(job["scrape_rate"]),
+        scrape_cache=scrape_cache,
+    )
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        async with session:
+            summary = await enrich.enrich_csv(
+                job["input_path"],
+                job["output_path"],
+                concurrency=job["concurrency"],
+                session=session,
+                probe_concurrency=job["probe_concurrency"],
+            )
+    elapsed = time.perf_counter() - start
+
+    for c in (cache, scrape_cache):
+        if c is not None:
+            c.close()
+
+    latencies.sort()
+    return {
+        "rows": job["rows"],
+        "success": summary.get("success", False),
+        "error": summary.get("error"),
+        "seconds": round(elapsed, 2),
+        "leads_per_sec": round(job["rows"] / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "rate_limited": summary.get("rate_limited", 0),
+        "company_reuses": summary.get("company_reuses", 0),
+    }
+
+
+def run_benchmark(job: dict) -> dict:
+    """Enrich one synthetic file against the mock server (runs in a fresh process)."""
+    os.environ["BRIGHTDATA_BASE_URL"] = job["base_url"]
+    import enrich
+    from brightdata.core.engine import AsyncEngine
+
+    # 0 disables the SDK's own per-client limiter
+    AsyncEngine.DEFAULT_RATE_LIMIT = job["sdk_rate_limit"]
+    # Real probes, sent to the mock's /site endpoint
+    enrich.DIRECT_PROBE_URL = mock_probe_url(job["base_url"])
+    return asyncio.run(_run_enrichment(job))
+
+
+def server_stats(base_url: str) -> dict:
+    with urllib.request.urlopen(f"{base_url}/stats") as response:
+        return json.load(response)
+
+
+def format_table(results: list[dict]) -> str:
+    columns = [
+        ("rows", "rows"), ("leads/s", "leads_per_sec"), ("p50 ms", "p50_ms"),
+        ("p95 ms", "p95_ms"), ("p99 ms", "p99_ms"), ("peak RSS MB", "peak_rss_mb"),
+        ("SERP", "serp"), ("scrapes", "scrape"), ("429s", "server_rate_limited"),
+        ("500s", "server_errors"),
+    ]
+    widths = [max(len(title), *(len(str(r.get(key, ""))) for r in results)) for title, key in columns]
+    lines = ["  ".join(title.rjust(w) for (title, _), w in zip(columns, widths))]
+    for r in results:
+        lines.append("  ".join(str(r.get(key, "")).rjust(w) for (_, key), w in zip(columns, widths)))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Offline enrich_csv throughput benchmark against a local mock API"
+    )
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=DEFAULT_ROWS,
+        help="Synthetic input sizes (default: 1000 10000 100000)",
+    )
+    parser.add_argument("--concurrency", type=int, default=50, help="Leads in flight (default: 50)")
+    parser.add_argument(
+        "--serp-rate", type=float, default=500.0,
+        help="SERP requests per second (default: 500)",
+    )
+    parser.add_argument(
+        "--scrape-rate", type=float, default=200.0,
+        help="Scrape requests per second (default: 200)",
+    )
+    parser.add_argument(
+        "--probe-concurrency", type=int, default=50,
+        help="Parallel website probes (default: 50)",
+    )
+    parser.add_argument(
+        "--sdk-rate-limit", type=float, default=0,
+        help="SDK per-client requests per second; 0 disables it (default: 0)",
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Run with a fresh SERP and scrape cache (default: no cache)",
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this JSON file")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    context = get_context("spawn")
+    ready = context.Queue()
+    server = context.Process(
+        target=serve, args=(profile_from_args(args), "127.0.0.1", 0, ready), daemon=True
+    )
+    server.start()
+    results = []
+    try:
+        base_url = ready.get(timeout=30)
+        print(f"Mock API on {base_url}")
+
+        with tempfile.TemporaryDirectory(prefix="enrich-bench-") as tmp:
+            for rows in args.rows:
+                run_dir = Path(tmp) / str(rows)
+                run_dir.mkdir()
+                input_path = run_dir / "leads.csv"
+                generate_leads(input_path, rows, seed=args.seed)
+
+                job = {
+                    "base_url": base_url,
+                    "rows": rows,
+                    "input_path": str(input_path),
+                    "output_path": str(run_dir / "leads_enriched.csv"),
+                    "cache_dir": str(run_dir / "cache") if args.cache else None,
+                    "concurrency": args.concurrency,
+                    "serp_rate": args.serp_rate,
+                    "scrape_rate": args.scrape_rate,
+                    "probe_concurrency": args.probe_concurrency,
+                    "sdk_rate_limit": args.sdk_rate_limit,
+                }
+                print(f"Enriching {rows} synthetic leads...")
+                before = server_stats(base_url)
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    result = pool.submit(run_benchmark, job).result()
+                after = server_stats(base_url)
+
+                for key in ("serp", "scrape", "probe", "duplicate_queries"):
+                    result[key] = after[key] - before[key]
+                result["server_rate_limited"] = after["rate_limited"] - before["rate_limited"]
+                result["server_errors"] = after["errors"] - before["errors"]
+                if not result["success"]:
+                    print(f"  Failed: {result['error']}", file=sys.stderr)
+                results.append(result)
+    finally:
+        server.terminate()
+        server.join()
+
+    print()
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults: {args.json}")
+
+    if not all(r["success"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Bright Data SERP and Web Unlocker APIs.
+
+Answers the SDK's POST /request calls with synthetic results, so enrichment
+throughput can be measured without spending credits:
+- Google searches (the request URL is a google.com search) get organic
+  results derived from the query: a company website, a LinkedIn company
+  page or a LinkedIn profile
+- Any other URL is a scrape and gets a LinkedIn company page with
+  employee count, industry and followers
+- HEAD/GET /site/{domain} stands in for direct website probes
+
+Latency is drawn per request from a log-normal distribution, a fraction of
+requests fail with HTTP 500, and 429 bursts reject every request for a
+few seconds at a fixed interval.
+
+Point the SDK at the server with the BRIGHTDATA_BASE_URL environment
+variable (see brightdata_utils.create_client):
+
+    python3 benchmarks/mock_server.py --port 8765 --serp-latency 300:0.5
+    BRIGHTDATA_BASE_URL=http://127.0.0.1:8765 \\
+        python3 ../../shared-scripts/serp_search.py "Acme GmbH" DE
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import zlib
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from aiohttp import web
+
+# Share of probed domains that have a live website
+LIVE_DOMAIN_RATE = 0.8
+
+
+@dataclass(frozen=True)
+class Latency:
+    """
+    Log-normal response delay.
+
+    Args:
+        median_ms: Median delay in milliseconds (0 for none)
+        sigma: Spread of the underlying normal distribution (0 for fixed)
+    """
+
+    median_ms: float = 0.0
+    sigma: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Parse "median_ms[:sigma]", e.g. "300:0.5"."""
+        median, _, sigma = spec.partition(":")
+        return cls(float(median), float(sigma or 0.0))
+
+    def sample(self, rng: random.Random) -> float:
+        """Delay in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+@dataclass(frozen=True)
+class MockProfile:
+    """Server behavior: latency per endpoint, error rate and 429 bursts."""
+
+    serp_latency: Latency = Latency()
+    scrape_latency: Latency = Latency()
+    probe_latency: Latency = Latency()
+    error_rate: float = 0.0
+    burst_every: float = 0.0  # seconds between 429 bursts (0 for none)
+    burst_length: float = 0.0  # seconds each burst lasts
+    seed: int = 0
+
+
+@dataclass
+class MockStats:
+    """Requests served, by kind and outcome."""
+
+    serp: int = 0
+    scrape: int = 0
+    probe: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    queries: dict = field(default_factory=dict)
+
+
+def slug(name: str) -> str:
+    """Lowercase alphanumeric form of a name ("Acme 42 GmbH" -> "acme42gmbh")."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def company_domain(company_name: str) -> str:
+    """Synthetic website domain of a company, matching its email domain."""
+    words = [w for w in company_name.split() if w.lower() not in ("gmbh", "ag", "ltd", "inc")]
+    return slug(" ".join(words)) + ".de"
+
+
+def is_live_domain(domain: str) -> bool:
+    """Deterministic liveness of a probed domain."""
+    return zlib.crc32(domain.encode()) % 100 < LIVE_DOMAIN_RATE * 100
+
+
+def serp_results(query: str) -> list[dict]:
+    """Organic results the SDK's Google parser understands, derived from the query."""
+    quoted = re.findall(r'"([^"]+)"', query)
+    if "site:linkedin.com/in" in query and quoted:
+        person = quoted[0]
+        company = quoted[1] if len(quoted) > 1 else ""
+        return [{
+            "link": f"https://de.linkedin.com/in/{slug(person)}",
+            "title": f"{person} - {company} | LinkedIn",
+            "description": f"{person} works at {company}.",
+        }]
+    if "site:linkedin.com/company" in query and quoted:
+        company = quoted[0]
+        return [{
+            "link": f"https://de.linkedin.com/company/{slug(company)}",
+            "title": f"{company} | LinkedIn",
+            "description": f"{company} | 1,234 followers on LinkedIn.",
+        }]
+    if quoted and "@" in quoted[0]:
+        domain = quoted[0].rsplit("@", 1)[1]
+        return [{
+            "link": f"https://www.{domain}/impressum",
+            "title": "Impressum",
+            "description": f"Kontakt: {quoted[0]}",
+        }]
+    if quoted:
+        company = quoted[0]
+        return [
+            {
+                "link": f"https://www.{company_domain(company)}/",
+                "title": f"{company} - Startseite",
+                "description": f"Willkommen bei {company}.",
+            },
+            {
+                "link": f"https://www.northdata.de/{slug(company)}",
+                "title": f"{company} - North Data",
+                "description": "Handelsregister, Bilanzen, Netzwerk.",
+            },
+        ]
+    return []
+
+
+def company_page(url: str) -> str:
+    """LinkedIn company page HTML that enrich.extract_linkedin_company_data parses."""
+    checksum = zlib.crc32(url.encode())
+    employees = 5 + checksum % 500
+    ld_json = json.dumps({
+        "@type": "Organization",
+        "numberOfEmployees": {"value": employees},
+    })
+    return (
+        "<html><head>"
+        f'<script type="application/ld+json">{ld_json}</script>'
+        f'<meta name="description" content="{checksum % 10000} followers on LinkedIn">'
+        "</head><body>"
+        '<div data-test-id="about-us__industry"><dt>Industry</dt>'
+        "<dd>Medical Equipment Manufacturing</dd></div>"
+        "</body></html>"
+    )
+
+
+def build_app(profile: MockProfile) -> web.Application:
+    """aiohttp application implementing the stand-in endpoints."""
+    rng = random.Random(profile.seed)
+    stats = MockStats()
+    started = time.monotonic()
+
+    def in_burst() -> bool:
+        if profile.burst_every <= 0 or profile.burst_length <= 0:
+            return False
+        return (time.monotonic() - started) % profile.burst_every < profile.burst_length
+
+    async def handle_request(request: web.Request) -> web.Response:
+        payload = await request.json()
+        target = payload.get("url", "")
+        is_search = urlparse(target).hostname in ("google.com", "www.google.com")
+
+        await asyncio.sleep(
+            (profile.serp_latency if is_search else profile.scrape_latency).sample(rng)
+        )
+        if in_burst():
+            stats.rate_limited += 1
+            return web.Response(status=429, text="Too Many Requests")
+        if rng.random() < profile.error_rate:
+            stats.errors += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        if is_search:
+            stats.serp += 1
+            query = parse_qs(urlparse(target).query).get("q", [""])[0]
+            stats.queries[query] = stats.queries.get(query, 0) + 1
+            return web.json_response({"organic": serp_results(query)})
+
+        stats.scrape += 1
+        return web.Response(text=company_page(target), content_type="text/html")
+
+    async def handle_site(request: web.Request) -> web.Response:
+        await asyncio.sleep(profile.probe_latency.sample(rng))
+        stats.probe += 1
+        if is_live_domain(request.match_info["domain"]):
+            return web.Response(text="ok")
+        return web.Response(status=404)
+
+    async def handle_stats(request: web.Request) -> web.Response:
+        data = asdict(stats)
+        queries = data.pop("queries")
+        data["duplicate_queries"] = sum(n - 1 for n in queries.values())
+        return web.json_response(data)
+
+    app = web.Application()
+    app.router.add_post("/request", handle_request)
+    app.router.add_route("*", "/site/{domain}", handle_site)
+    app.router.add_get("/stats", handle_stats)
+    return app
+
+
+@asynccontextmanager
+async def running_mock_server(profile: MockProfile, host: str = "127.0.0.1", port: int = 0):
+    """
+    Serve the mock API on the running event loop.
+
+    Yields:
+        Base URL of the server, e.g. "http://127.0.0.1:41234"
+    """
+    runner = web.AppRunner(build_app(profile), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    try:
+        bound_port = runner.addresses[0][1]
+        yield f"http://{host}:{bound_port}"
+    finally:
+        await runner.cleanup()
+
+
+def serve(profile: MockProfile, host: str, port: int, ready=None) -> None:
+    """
+    Run the mock server until interrupted.
+
+    Args:
+        ready: Optional multiprocessing queue that receives the base URL
+    """
+    async def run():
+        async with running_mock_server(profile, host, port) as base_url:
+            if ready is not None:
+                ready.put(base_url)
+            else:
+                print(f"Mock Bright Data API on {base_url}", flush=True)
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Command-line options that build a MockProfile (see profile_from_args)."""
+    parser.add_argument(
+        "--serp-latency", type=Latency.parse, default=Latency(50, 0.5),
+        help="SERP delay as median_ms[:sigma] (default: 50:0.5)",
+    )
+    parser.add_argument(
+        "--scrape-latency", type=Latency.parse, default=Latency(100, 0.5),
+        help="Scrape delay as median_ms[:sigma] (default: 100:0.5)",
+    )
+    parser.add_argument(
+        "--probe-latency", type=Latency.parse, default=Latency(20, 0.5),
+        help="Website probe delay as median_ms[:sigma] (default: 20:0.5)",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0,
+        help="Fraction of API requests failing with HTTP 500 (default: 0)",
+    )
+    parser.add_argument(
+        "--burst-every", type=float, default=0.0,
+        help="Seconds between 429 bursts (default: 0, no bursts)",
+    )
+    parser.add_argument(
+        "--burst-length", type=float, default=1.0,
+        help="Seconds each 429 burst lasts (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+
+
+def profile_from_args(args: argparse.Namespace) -> MockProfile:
+    return MockProfile(
+        serp_latency=args.serp_latency,
+        scrape_latency=args.scrape_latency,
+        probe_latency=args.probe_latency,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        seed=args.seed,
+    )
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Bright Data API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    serve(profile_from_args(args), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Per-lead time budget for enrich.py.
+
+A Deadline is created when a lead starts and passed down to every
+strategy of enrich_lead. Each SERP or scrape call gets the remaining
+budget as its timeout, optional steps are skipped once too little time is
+left, and every stage that did not get to finish is recorded so the lead's
+notes can say its result is incomplete.
+"""
+
+import time
+from typing import Optional
+
+# Seconds one lead may take, including rate-limit waits (0 = no limit)
+DEFAULT_LEAD_TIMEOUT = 120.0
+
+# Remaining seconds needed to start the LinkedIn company scrape
+SCRAPE_RESERVE = 10.0
+
+
+class Deadline:
+    """
+    Point in time by which a lead's lookups must finish.
+
+    Example:
+        >>> deadline = Deadline(60)
+        >>> if deadline.expired():
+        ...     deadline.miss("company_search")
+        ... else:
+        ...     result = await session.search(..., timeout=deadline.remaining())
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Args:
+            seconds: Time budget from now; None for no limit
+        """
+        self.seconds = seconds
+        self.expires = None if seconds is None else time.monotonic() + seconds
+        self.missed: list[str] = []
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a limit."""
+        if self.expires is None:
+            return None
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        """True once no time is left."""
+        return self.remaining() == 0.0
+
+    def cap(self, seconds: float) -> float:
+        """The smaller of `seconds` and the time left."""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def miss(self, stage: str) -> None:
+        """Record that `stage` ran out of time or was skipped for lack of it."""
+        if stage not in self.missed:
+            self.missed.append(stage)
+
+    def note(self) -> str:
+        """
+        Notes text for a lead with missed stages.
+
+        Returns:
+            Note naming the incomplete stages, or "" if none were missed
+        """
+        if not self.missed:
+            return ""
+        return f"Lead time budget ({self.seconds:g}s) ran out: {', '.join(self.missed)} incomplete."
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Suffix index for matching hosts against domain lists.
+
+Domains are stored as a trie of reversed labels ("mail.gmx.de" is walked as
+de -> gmx -> mail), so a lookup costs one dict step per label and only
+matches on label boundaries: "mail.gmx.de" matches "gmx.de", while
+"notlinkedin.com.example" does not match "linkedin.com".
+
+Entries of the form "gmx.*" match the name directly under one of
+WILDCARD_SUFFIXES ("gmx.net", "gmx.co.uk", but not "gmx.xyz"), with the
+host's public suffix taken from the Public Suffix List (ICANN section, via
+tldextract's bundled snapshot). Lists can be extended from the
+lead-enricher config file without code changes.
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlparse
+
+# Suffixes a "name.*" entry covers: the generic TLDs and the country
+# domains under which the large mail providers run regional services
+WILDCARD_SUFFIXES = {
+    "com", "net", "org", "eu",
+    "de", "at", "ch", "fr", "be", "nl", "lu", "it", "es", "pt", "ie",
+    "dk", "se", "no", "fi", "pl", "cz", "sk", "hu", "ro", "gr", "ru",
+    "ca", "mx", "ar", "cl", "in", "jp", "sg", "ph", "vn",
+    "co.uk", "com.au", "co.nz", "co.jp", "co.kr", "co.in", "co.id", "co.th",
+    "com.br", "com.ar", "com.mx", "com.co", "com.sg", "com.hk", "com.tw",
+    "com.my", "com.ph", "com.vn", "com.tr", "co.za", "co.il",
+}
+
+# Config keys read by load_domain_config
+CONFIG_KEYS = ("generic_email_domains", "skip_website_domains")
+
+_TERMINAL = ""  # Never a valid label, so safe as the end-of-entry marker
+
+
+def host_labels(host_or_url: str) -> list[str]:
+    """
+    Split a host, email domain or URL into lowercase labels.
+
+    Args:
+        host_or_url: "Mail.GMX.de", "https://www.linkedin.com/company/x", ...
+
+    Returns:
+        Labels in host order, e.g. ["www", "linkedin", "com"]
+    """
+    value = host_or_url.strip().lower()
+    if "/" in value or ":" in value:
+        if "://" not in value:
+            value = "https://" + value
+        value = urlparse(value).hostname or ""
+    value = value.rstrip(".")
+    return value.split(".") if value else []
+
+
+class DomainSuffixIndex:
+    """
+    Reversed-label trie answering "is this host in (or under) a listed domain?".
+
+    Example:
+        >>> index = DomainSuffixIndex(["gmx.de", "yahoo.*"])
+        >>> "mail.gmx.de" in index
+        True
+        >>> "yahoo.co.uk" in index
+        True
+        >>> "notgmx.de" in index
+        False
+    """
+
+    def __init__(self, domains: Iterable[str] = (), wildcard_suffixes: Iterable[str] = WILDCARD_SUFFIXES):
+        """
+        Args:
+            domains: Domains and "name.*" entries to index
+            wildcard_suffixes: Public suffixes a "name.*" entry matches under
+        """
+        self._root: dict = {}
+        self._wildcard_names: set[str] = set()
+        self._wildcard_suffixes = {suffix.strip(".").lower() for suffix in wildcard_suffixes}
+        self.update(domains)
+
+    def add(self, domain: str) -> None:
+        """Add a domain, or a "name.*" entry matching under the wildcard suffixes."""
+        domain = domain.strip().lower().rstrip(".")
+        if domain.endswith(".*"):
+            self._wildcard_names.add(domain[:-2])
+            return
+        labels = host_labels(domain)
+        if not labels:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        node[_TERMINAL] = True
+
+    def update(self, domains: Iterable[str]) -> None:
+        """Add several domains."""
+        for domain in domains:
+            self.add(domain)
+
+    def match_depth(self, labels: list[str], longest: bool = False) -> int:
+        """
+        Number of trailing labels covered by an indexed entry (0 if none).
+
+        Args:
+            labels: Host labels from host_labels
+            longest: Return the longest matching entry instead of the first
+        """
+        node = self._root
+        depth = 0
+        for i, label in enumerate(reversed(labels), start=1):
+            node = node.get(label)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                depth = i
+                if not longest:
+                    break
+        return depth
+
+    def __contains__(self, host_or_url: str) -> bool:
+        labels = host_labels(host_or_url)
+        if not labels:
+            return False
+        if self.match_depth(labels):
+            return True
+        if self._wildcard_names:
+            depth = public_suffix_depth(labels)
+            if len(labels) > depth and ".".join(labels[-depth:]) in self._wildcard_suffixes:
+                return labels[-depth - 1] in self._wildcard_names
+        return False
+
+
+@functools.cache
+def _psl_extractor():
+    """
+    Load tldextract once per process, reading only its bundled PSL snapshot.
+
+    Returns: TLDExtract instance, or None if tldextract is missing
+    """
+    try:
+        import tldextract
+    except ImportError:
+        return None
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _suffix_of(host: str) -> str:
+    extractor = _psl_extractor()
+    return extractor(host).suffix if extractor is not None else ""
+
+
+def public_suffix_depth(labels: list[str]) -> int:
+    """
+    Number of trailing labels forming the public suffix (at least 1).
+
+    Without tldextract every host is treated as having a one-label suffix.
+    """
+    suffix = _suffix_of(".".join(labels))
+    return max(1, suffix.count(".") + 1 if suffix else 1)
+
+
+def load_domain_config(config_file: Path) -> dict[str, list[str]]:
+    """
+    Read extra domain lists from a JSON config file.
+
+    Recognized keys are listed in CONFIG_KEYS. A missing or unreadable
+    file yields empty lists.
+
+    Returns:
+        Dict of config key to list of domains
+    """
+    extra = {key: [] for key in CONFIG_KEYS}
+    try:
+        with open(config_file, "r") as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return extra
+    if not isinstance(config, dict):
+        return extra
+
+    for key in CONFIG_KEYS:
+        values = config.get(key, [])
+        if isinstance(values, list):
+            extra[key] = [v for v in values if isinstance(v, str)]
+    return extra
@@ -3,33 +3,69 @@
 Lead enrichment script using Bright Data SERP API.
 
 Usage:
-  python3 scripts/enrich.py <input_csv> [output_csv] [--min-confidence 0.8]
+  python3 scripts/enrich.py <input_csv> [output_csv] [--min-confidence 0.8] [--concurrency N]
 
 Example:
   python3 scripts/enrich.py leads.csv leads_enriched.csv
+  python3 scripts/enrich.py leads.csv leads_enriched.csv --concurrency 10
 """
 
 import argparse
 import asyncio
-import csv
+import functools
 import json
 import os
 import re
 import sys
 import time
+from collections import OrderedDict, deque
+from contextlib import AsyncExitStack, nullcontext
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Container, Optional, Sequence
 from urllib.parse import urlparse
-import aiohttp
+
+if TYPE_CHECKING:
+    import aiohttp
 
 # Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-from brightdata_utils import get_api_key, LOCATION_MAP
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared-scripts"))
+from brightdata_utils import get_api_key, BrightDataSession, country_to_location, session_scope, timed_out
+from country_data import country_from_domain, country_from_phone
+from rate_limiter import (
+    DEFAULT_SCRAPE_RATE, DEFAULT_SERP_RATE, AdaptiveRateLimiter,
+)
+from circuit_breaker import CircuitBreaker
+from serp_cache import (
+    DEFAULT_CACHE_DIR, DEFAULT_NEGATIVE_TTL_DAYS, DEFAULT_SCRAPE_TTL_DAYS, DEFAULT_TTL_DAYS,
+    ScrapeCache, SerpCache,
+)
+from journal import EnrichmentJournal, journal_path_for, row_hash
+from domain_index import DomainSuffixIndex, load_domain_config
+from sharding import ByteRange, merge_shards, open_leads, shard_byte_ranges, shard_path_for
+from metrics import (
+    EMPTY, FAILURE, METRICS_INTERVAL, SUCCESS, RunMetrics, load_metrics, metrics_path_for,
+)
+from progress import (
+    LEAD_ID_LENGTH, PROGRESS_INTERVAL, LeadLog, ProgressReporter, log_detail, log_path_for,
+)
+from output_formats import (
+    OUTPUT_FORMATS, OUTPUT_WRITERS, check_output_format, merge_output_files, output_path_for,
+)
+from previous import DEFAULT_MAX_AGE_DAYS, ENRICHED_AT, PreviousEnrichment, enriched_at_now
+from deadline import DEFAULT_LEAD_TIMEOUT, SCRAPE_RESERVE, Deadline
 
 # Configuration
 CONFIG_DIR = Path.home() / ".claude" / "lead-enricher"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Columns added by enrich_lead, in output order
+ENRICHMENT_FIELDS = [
+    "website", "website_confidence", "company_linkedin", "person_linkedin",
+    "person_verified", "employee_count", "industry", "country", "notes", ENRICHED_AT,
+]
+
 # Email ISP domains organized by region (for maintainability)
 # Combined into GENERIC_EMAIL_DOMAINS for efficient lookup
 
@@ -196,6 +232,30 @@ GENERIC_EMAIL_DOMAINS = (
     LATIN_AMERICA_EMAIL_DOMAINS
 )
 
+# Providers with many regional domains (gmx.net, yahoo.co.uk, hotmail.fr, ...)
+GENERIC_EMAIL_BRANDS = {
+    "gmail", "googlemail", "yahoo", "ymail", "hotmail", "outlook",
+    "live", "gmx", "aol",
+}
+
+# Results from these sites are never the company website
+SKIP_WEBSITE_DOMAINS = {
+    "linkedin.com", "facebook.com", "instagram.com",
+    "twitter.com", "youtube.com", "wikipedia.org",
+}
+
+# Compiled once; extend via "generic_email_domains" / "skip_website_domains"
+# in CONFIG_FILE
+_DOMAIN_CONFIG = load_domain_config(CONFIG_FILE)
+GENERIC_EMAIL_INDEX = DomainSuffixIndex(
+    GENERIC_EMAIL_DOMAINS
+    | {f"{brand}.*" for brand in GENERIC_EMAIL_BRANDS}
+    | set(_DOMAIN_CONFIG["generic_email_domains"])
+)
+SKIP_WEBSITE_INDEX = DomainSuffixIndex(
+    SKIP_WEBSITE_DOMAINS | set(_DOMAIN_CONFIG["skip_website_domains"])
+)
+
 
 # get_api_key is now imported from shared.brightdata_utils
 
@@ -216,8 +276,8 @@ def extract_email_domain(email: str) -> Optional[str]:
 
 
 def is_generic_email_domain(domain: str) -> bool:
-    """Check if domain is a generic email provider."""
-    return domain in GENERIC_EMAIL_DOMAINS
+    """Check if domain is (a subdomain of) a generic email provider."""
+    return bool(domain) and domain in GENERIC_EMAIL_INDEX
 
 
 def normalize_phone(phone: str) -> str:
@@ -227,81 +287,210 @@ def normalize_phone(phone: str) -> str:
     return re.sub(r"\D", "", phone)
 
 
-def fuzzy_similarity(name1: str, name2: str) -> float:
-    """Calculate fuzzy similarity between two names (0-1)."""
+@functools.cache
+def _fuzz_backend():
+    """
+    Load rapidfuzz once per process.
+
+    Returns: (fuzz, process, utils, has_numpy) or None if rapidfuzz is missing
+    """
     try:
-        from thefuzz import fuzz
-        return fuzz.token_sort_ratio(name1, name2) / 100.0
+        from rapidfuzz import fuzz, process, utils
     except ImportError:
-        # Fallback: simple word overlap
-        words1 = set(name1.lower().split())
-        words2 = set(name2.lower().split())
-        if not words1 or not words2:
-            return 0.0
-        overlap = len(words1 & words2)
-        return overlap / max(len(words1), len(words2))
+        return None
+    # process.cdist needs numpy; without it batches are scored pairwise
+    return fuzz, process, utils, find_spec("numpy") is not None
+
+
+def preprocess_name(name: str) -> str:
+    """Normalize a name for fuzzy matching (case, punctuation, spacing)."""
+    backend = _fuzz_backend()
+    if backend is None:
+        return " ".join(name.lower().split())
+    return backend[2].default_process(name)
+
+
+def _word_overlap(name1: str, name2: str) -> float:
+    words1 = set(name1.split())
+    words2 = set(name2.split())
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / max(len(words1), len(words2))
+
+
+def similarity_matrix(queries: list[str], choices: list[str]) -> list[list[float]]:
+    """
+    Score every query against every choice in one batched call (0-1).
+
+    Inputs must already be passed through preprocess_name.
+
+    Returns: one row of choice scores per query
+    """
+    if not queries or not choices:
+        return [[] for _ in queries]
+
+    backend = _fuzz_backend()
+    if backend is None:
+        return [[_word_overlap(q, c) for c in choices] for q in queries]
+
+    fuzz, process, _, has_numpy = backend
+    if has_numpy:
+        matrix = process.cdist(queries, choices, scorer=fuzz.token_sort_ratio, processor=None)
+        return [[score / 100.0 for score in row] for row in matrix.tolist()]
+    return [[fuzz.token_sort_ratio(q, c) / 100.0 for c in choices] for q in queries]
+
+
+def fuzzy_similarity(name1: str, name2: str) -> float:
+    """Calculate fuzzy similarity between two names (0-1)."""
+    return similarity_matrix([preprocess_name(name1)], [preprocess_name(name2)])[0][0]
+
+
+# Used when neither phone nor email identify the country (German lead lists)
+DEFAULT_COUNTRY = "DE"
 
 
 def detect_country(lead: dict) -> str:
-    """Detect country from phone, email TLD, or company name."""
+    """Detect country from phone calling code or email ccTLD."""
     phone = lead.get("work_phone_number", "")
     email = lead.get("work_email", "")
 
-    # Phone country code
-    phone_digits = normalize_phone(phone)
-    if phone_digits.startswith("49"):
-        return "DE"
-    elif phone_digits.startswith("43"):
-        return "AT"
-    elif phone_digits.startswith("41"):
-        return "CH"
-    elif phone_digits.startswith("33"):
-        return "FR"
-    elif phone_digits.startswith("34"):
-        return "ES"
-
-    # Email TLD
+    country = country_from_phone(phone)
+    if country:
+        return country
+
     email_domain = extract_email_domain(email)
     if email_domain:
-        if email_domain.endswith(".de"):
-            return "DE"
-        elif email_domain.endswith(".at"):
-            return "AT"
-        elif email_domain.endswith(".ch"):
-            return "CH"
-        elif email_domain.endswith(".fr"):
-            return "FR"
-        elif email_domain.endswith(".es"):
-            return "ES"
+        country = country_from_domain(email_domain)
+        if country:
+            return country
+
+    return DEFAULT_COUNTRY
 
-    return "DE"  # Default to Germany for German leads
 
+# Statuses from servers that refuse HEAD but may answer GET
+HEAD_REJECTED_STATUSES = {403, 405, 501}
+DIRECT_PROBE_TIMEOUT = 5.0  # seconds
+# "{domain}" is filled in; the benchmarks point this at the mock server
+DIRECT_PROBE_URL = "https://{domain}/"
 
-async def try_direct_website(domain: str, timeout: float = 5.0) -> tuple[Optional[str], bool]:
+# Bulk domain probing
+PROBE_CONCURRENCY = 50
+DNS_CACHE_TTL = 300  # seconds
+
+
+def record_stage(
+    metrics: Optional[RunMetrics],
+    stage: str,
+    outcome: str,
+    started: float,
+    cached: bool = False,
+) -> None:
+    """Record a stage run that began at perf_counter() time `started`."""
+    if metrics is not None:
+        metrics.record(stage, outcome, time.perf_counter() - started, cached)
+
+
+async def try_direct_website(
+    domain: str,
+    timeout: float = DIRECT_PROBE_TIMEOUT,
+    http_session: Optional["aiohttp.ClientSession"] = None,
+) -> tuple[Optional[str], bool]:
     """
     Try to access website directly by domain.
 
+    Sends HEAD first and falls back to a bounded GET (first byte only) for
+    servers that reject HEAD. Uses `http_session` when given.
+
     Returns: (url, success) where url is the final URL after redirects
     """
     if not domain:
         return None, False
 
-    url = f"https://{domain}/"
+    import aiohttp
+
+    if http_session is None:
+        async with aiohttp.ClientSession() as one_off:
+            return await try_direct_website(domain, timeout, one_off)
+
+    url = DIRECT_PROBE_URL.format(domain=domain)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.head(
-                url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-                allow_redirects=True,
-            ) as response:
-                if response.status == 200:
-                    return str(response.url), True
+        async with http_session.head(
+            url, timeout=client_timeout, allow_redirects=True
+        ) as response:
+            if response.status == 200:
+                return str(response.url), True
+            if response.status not in HEAD_REJECTED_STATUSES:
+                return None, False
+
+        async with http_session.get(
+            url,
+            timeout=client_timeout,
+            allow_redirects=True,
+            headers={"Range": "bytes=0-0"},
+        ) as response:
+            # Body is never read; the connection is released on exit
+            if response.status in (200, 206):
+                return str(response.url), True
     except Exception:
         pass
 
     return None, False
 
 
+def collect_email_domains(
+    input_file: Path,
+    skip: Sequence[Container[str]] = (),
+    byte_range: Optional[ByteRange] = None,
+) -> set[str]:
+    """
+    Collect unique non-generic email domains from a leads file (or one shard).
+
+    Rows whose hash is in any of `skip` (e.g. a journal) are ignored.
+    """
+    domains = set()
+    with open_leads(input_file, byte_range) as reader:
+        for lead in reader:
+            if skip and any(row_hash(lead) in rows for rows in skip):
+                continue
+            domain = extract_email_domain(lead.get("work_email", "").strip())
+            if domain and not is_generic_email_domain(domain):
+                domains.add(domain)
+    return domains
+
+
+async def probe_domains(
+    domains: set[str],
+    concurrency: int = PROBE_CONCURRENCY,
+    timeout: float = 5.0,
+    metrics: Optional[RunMetrics] = None,
+) -> dict[str, Optional[str]]:
+    """
+    Probe many domains for a live website through one pooled HTTP session.
+
+    Each probe is recorded as a direct_probe call in `metrics`, if given.
+
+    Returns: dict mapping each domain to its final URL, or None if not live
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=DNS_CACHE_TTL)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(connector=connector) as http_session:
+        async def probe(domain: str) -> Optional[str]:
+            async with semaphore:
+                started = time.perf_counter()
+                url, success = await try_direct_website(domain, timeout, http_session)
+                record_stage(metrics, "direct_probe", SUCCESS if success else EMPTY, started)
+            return url if success else None
+
+        ordered = sorted(domains)
+        results = await asyncio.gather(*(probe(d) for d in ordered))
+
+    return dict(zip(ordered, results))
+
+
 def validate_linkedin_result(
     company_name: str,
     result_url: str,
@@ -315,28 +504,52 @@ def validate_linkedin_result(
     """
     if not company_name or not result_url:
         return False
+    return first_valid_linkedin_result(
+        company_name, [{"url": result_url, "title": result_title}], min_similarity
+    ) is not None
 
-    company_lower = company_name.lower().strip()
-
-    # Check 1: Company name in title (fuzzy match)
-    if result_title:
-        similarity = fuzzy_similarity(company_name, result_title)
-        if similarity >= min_similarity:
-            return True
 
-    # Check 2: Company slug in URL
+def _linkedin_slug_matches(company_nospace: str, url: str) -> bool:
+    """Check whether a LinkedIn company URL slug matches the company name."""
     # Extract slug from URL (e.g., "reha360" from /company/reha360)
-    url_lower = result_url.lower()
-    if "linkedin.com/company/" in url_lower:
-        # Get the slug part
-        parts = url_lower.split("/company/")[-1].split("/")
-        if parts:
-            slug = parts[0].replace("-", "").replace("_", "")
-            company_nospace = company_lower.replace(" ", "").replace("-", "")
-            if company_nospace in slug or slug in company_nospace:
-                return True
+    url_lower = url.lower()
+    if "linkedin.com/company/" not in url_lower:
+        return False
+    parts = url_lower.split("/company/")[-1].split("/")
+    slug = parts[0].replace("-", "").replace("_", "")
+    return company_nospace in slug or slug in company_nospace
 
-    return False
+
+def first_valid_linkedin_result(
+    company_name: str,
+    results: list[dict],
+    min_similarity: float = 0.6,
+) -> Optional[dict]:
+    """
+    Return the first result that matches the company, scoring all titles at once.
+
+    A result matches if its title is fuzzy-similar to the company name or
+    its URL slug matches the name.
+
+    Returns: matching result dict, or None
+    """
+    results = [r for r in results if r.get("url")]
+    if not company_name or not results:
+        return None
+
+    company_nospace = company_name.lower().strip().replace(" ", "").replace("-", "")
+    titles = [preprocess_name(r.get("title", "")) for r in results]
+    scores = similarity_matrix([preprocess_name(company_name)], titles)[0]
+
+    for result, title, similarity in zip(results, titles, scores):
+        # Check 1: Company name in title (fuzzy match)
+        if title and similarity >= min_similarity:
+            return result
+        # Check 2: Company slug in URL
+        if _linkedin_slug_matches(company_nospace, result["url"]):
+            return result
+
+    return None
 
 
 def person_equals_company(full_name: str, company_name: str) -> bool:
@@ -366,241 +579,172 @@ def person_equals_company(full_name: str, company_name: str) -> bool:
     return False
 
 
-async def search_by_email(
-    email: str,
-    country_code: str = "DE",
-    num_results: int = 5,
-) -> dict:
+class EndpointUnavailable(Exception):
     """
-    Search for exact email address to find associated websites.
+    A Bright Data endpoint is failing (its circuit breaker counted the call).
 
-    Returns dict with results or error.
+    Raised instead of returning an error so the whole lead is aborted and
+    requeued rather than written out with error notes. `circuit_open` tells
+    an outage apart from a single failure while the circuit is closed.
     """
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {"error": "brightdata-sdk not installed", "success": False}
 
-    try:
-        api_key = get_api_key()
-    except ValueError as e:
-        return {"error": str(e), "success": False}
+    def __init__(self, result: dict):
+        super().__init__(result.get("error", "Endpoint unavailable"))
+        self.retry_after = result.get("retry_after", 0.0)
+        self.circuit_open = result.get("circuit_open", True)
 
-    query = f'"{email}"'
 
-    location_map = {
-        "DE": "Germany", "AT": "Austria", "CH": "Switzerland",
-        "FR": "France", "ES": "Spain",
-    }
-    location = location_map.get(country_code, "Germany")
+async def run_search(
+    query: str,
+    location: str,
+    language: str,
+    num_results: int,
+    session: Optional[BrightDataSession] = None,
+    is_miss=None,
+    timeout: Optional[float] = None,
+) -> dict:
+    """
+    Run a SERP query on the shared session (or a one-off session).
+
+    `is_miss` marks results that found nothing usable, so the SERP cache
+    keeps them only for its negative TTL. The call gives up after
+    `timeout` seconds (timed_out=True in the result).
+
+    Returns dict with results or error.
 
+    Raises:
+        EndpointUnavailable: If the SERP endpoint is failing
+    """
     try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            results = await client.search.google(
-                query=query,
-                location=location,
-                language="de" if country_code in ("DE", "AT", "CH") else "en",
-                num_results=num_results,
+        async with session_scope(session, get_api_key) as active:
+            result = await active.search(
+                query, location, language, num_results, is_miss=is_miss, timeout=timeout
             )
+    except Exception as e:
+        return {"error": str(e), "success": False}
+    if result.get("unavailable"):
+        raise EndpointUnavailable(result)
+    return result
+
 
-            if not results.success:
-                return {"error": f"Search failed: {results.error}", "success": False}
+async def search_by_email(
+    email: str,
+    country_code: str = "DE",
+    num_results: int = 5,
+    session: Optional[BrightDataSession] = None,
+    timeout: Optional[float] = None,
+) -> dict:
+    """
+    Search for exact email address to find associated websites.
 
-            mapped = []
-            for item in results.data:
-                mapped.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "snippet": item.get("description", ""),
-                })
+    Returns dict with results or error.
+    """
+    query = f'"{email}"'
 
-            return {
-                "success": True,
-                "query": query,
-                "results": mapped
-            }
+    location = country_to_location(country_code)
+    language = "de" if country_code in ("DE", "AT", "CH") else "en"
 
-    except Exception as e:
-        return {"error": str(e), "success": False}
+    return await run_search(query, location, language, num_results, session, timeout=timeout)
 
 
 async def search_company(
     company_name: str,
     country_code: str = "DE",
     num_results: int = 10,
+    session: Optional[BrightDataSession] = None,
+    timeout: Optional[float] = None,
 ) -> dict:
     """
     Search for company using Bright Data SERP API.
 
     Returns dict with results or error.
     """
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {"error": "brightdata-sdk not installed", "success": False}
-
-    try:
-        api_key = get_api_key()
-    except ValueError as e:
-        return {"error": str(e), "success": False}
-
     # Build search query
     query = f'"{company_name}"'
 
     # Country code to location
-    location_map = {
-        "DE": "Germany", "AT": "Austria", "CH": "Switzerland",
-        "FR": "France", "ES": "Spain", "NL": "Netherlands",
-        "BE": "Belgium", "IT": "Italy", "PL": "Poland",
-    }
-    location = location_map.get(country_code, "Germany")
+    location = country_to_location(country_code)
+    language = "de" if country_code in ("DE", "AT", "CH") else "en"
 
-    try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            results = await client.search.google(
-                query=query,
-                location=location,
-                language="de" if country_code in ("DE", "AT", "CH") else "en",
-                num_results=num_results,
-            )
+    return await run_search(query, location, language, num_results, session, timeout=timeout)
 
-            if not results.success:
-                return {"error": f"Search failed: {results.error}", "success": False}
 
-            mapped = []
-            for item in results.data:
-                mapped.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "snippet": item.get("description", ""),
-                })
+def pick_linkedin_person(results: list[dict]) -> Optional[dict]:
+    """Return the first LinkedIn profile among search results, or None."""
+    for item in results:
+        if "linkedin.com/in" in item.get("url", ""):
+            return item
+    return None
 
-            return {
-                "success": True,
-                "query": query,
-                "results": mapped
-            }
 
-    except Exception as e:
-        return {"error": str(e), "success": False}
+def pick_linkedin_company(company_name: str, results: list[dict]) -> Optional[dict]:
+    """Return the first validated LinkedIn company page among search results, or None."""
+    # Validate all company pages at once and take the first valid one
+    pages = [item for item in results if "linkedin.com/company" in item.get("url", "")]
+    return first_valid_linkedin_result(company_name, pages)
 
 
 async def search_linkedin_person(
     full_name: str,
     company_name: str,
     country_code: str = "DE",
+    session: Optional[BrightDataSession] = None,
+    timeout: Optional[float] = None,
 ) -> dict:
     """Search for person's LinkedIn profile."""
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {"error": "brightdata-sdk not installed", "success": False}
-
-    try:
-        api_key = get_api_key()
-    except ValueError as e:
-        return {"error": str(e), "success": False}
-
     query = f'"{full_name}" "{company_name}" site:linkedin.com/in'
 
-    location_map = {"DE": "Germany", "AT": "Austria", "CH": "Switzerland"}
-    location = location_map.get(country_code, "Germany")
-
-    try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            results = await client.search.google(
-                query=query,
-                location=location,
-                language="en",
-                num_results=5,
-            )
-
-            if not results.success:
-                return {"error": f"Search failed", "success": False}
+    location = country_to_location(country_code)
 
-            for item in results.data:
-                url = item.get("url", "")
-                if "linkedin.com/in" in url:
-                    return {
-                        "success": True,
-                        "url": url,
-                        "title": item.get("title", ""),
-                    }
-
-            return {"success": True, "url": None}
+    # Searches without a profile are cached with the negative TTL
+    results = await run_search(
+        query, location, "en", 5, session,
+        is_miss=lambda items: pick_linkedin_person(items) is None,
+        timeout=timeout,
+    )
+    if not results.get("success"):
+        failed = {"error": "Search failed", "success": False}
+        if results.get("timed_out"):
+            failed["timed_out"] = True
+        return failed
 
-    except Exception as e:
-        return {"error": str(e), "success": False}
+    match = pick_linkedin_person(results["results"])
+    found = {"success": True, "url": None}
+    if match:
+        found.update(url=match["url"], title=match.get("title", ""))
+    if results.get("cached"):
+        found["cached"] = True
+    return found
 
 
 async def search_linkedin_company(
     company_name: str,
     country_code: str = "DE",
+    session: Optional[BrightDataSession] = None,
+    timeout: Optional[float] = None,
 ) -> dict:
     """Search for company's LinkedIn page with validation."""
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {"error": "brightdata-sdk not installed", "success": False}
-
-    try:
-        api_key = get_api_key()
-    except ValueError as e:
-        return {"error": str(e), "success": False}
-
     query = f'"{company_name}" site:linkedin.com/company'
 
-    location_map = {
-        "DE": "Germany", "AT": "Austria", "CH": "Switzerland",
-        "FR": "France", "ES": "Spain", "NL": "Netherlands",
-    }
-    location = location_map.get(country_code, "Germany")
-
-    try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            results = await client.search.google(
-                query=query,
-                location=location,
-                language="en",
-                num_results=10,  # Get more results to find valid one
-            )
-
-            if not results.success:
-                return {"error": f"Search failed: {results.error}", "success": False}
-
-            # Try each result until we find a valid one
-            for item in results.data:
-                url = item.get("url", "")
-                title = item.get("title", "")
-                if "linkedin.com/company" in url:
-                    # Validate before returning
-                    if validate_linkedin_result(company_name, url, title):
-                        return {
-                            "success": True,
-                            "url": url,
-                            "title": title,
-                        }
+    location = country_to_location(country_code)
 
-            return {"success": True, "url": None}
+    # Get more results to find valid one; searches without one are cached
+    # with the negative TTL
+    results = await run_search(
+        query, location, "en", 10, session,
+        is_miss=lambda items: pick_linkedin_company(company_name, items) is None,
+        timeout=timeout,
+    )
+    if not results.get("success"):
+        return results
 
-    except Exception as e:
-        return {"error": str(e), "success": False}
+    match = pick_linkedin_company(company_name, results["results"])
+    found = {"success": True, "url": None}
+    if match:
+        found.update(url=match["url"], title=match.get("title", ""))
+    if results.get("cached"):
+        found["cached"] = True
+    return found
 
 
 def extract_linkedin_company_data(html: str) -> dict:
@@ -668,52 +812,141 @@ def extract_linkedin_company_data(html: str) -> dict:
     return result
 
 
-async def scrape_linkedin_company(linkedin_url: str, verbose: bool = False) -> dict:
+def canonical_linkedin_company_url(url: str) -> str:
+    """
+    Canonical form of a LinkedIn company page URL.
+
+    Country subdomains, sub-pages, query strings and case are dropped, so
+    "https://de.linkedin.com/company/Reha-360/about/?trk=x" becomes
+    "https://www.linkedin.com/company/reha-360". Other URLs are returned unchanged.
+    """
+    match = re.search(r"linkedin\.com/company/([^/?#]+)", url, re.IGNORECASE)
+    if not match:
+        return url
+    return f"https://www.linkedin.com/company/{match.group(1).lower()}"
+
+
+async def scrape_linkedin_company(
+    linkedin_url: str,
+    verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    timeout: Optional[float] = None,
+) -> dict:
     """
     Scrape a LinkedIn company page to extract employee count and industry.
 
-    Returns dict with employee_count, industry, followers, or error.
+    Extracted data is cached per canonical URL in the session's scrape
+    cache; concurrent scrapes of the same page share one request. The
+    scrape gives up after `timeout` seconds (timed_out=True in the result)
+    and is not started with less than SCRAPE_RESERVE seconds (skipped=True).
+
+    Returns dict with employee_count, industry and followers (cached=True
+    when served from the scrape cache), or error.
+
+    Raises:
+        EndpointUnavailable: If the scrape endpoint is failing
     """
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {"error": "brightdata-sdk not installed", "success": False}
+    linkedin_url = canonical_linkedin_company_url(linkedin_url)
 
     try:
-        api_key = get_api_key()
-    except ValueError as e:
+        async with session_scope(session, get_api_key) as active:
+            scrape_cache = active.scrape_cache
+            data = scrape_cache.get(linkedin_url) if scrape_cache is not None else None
+            cached = data is not None
+            if cached:
+                if verbose:
+                    log_detail("linkedin_scrape", f"  [LinkedIn] Company page data cached: {linkedin_url}")
+            elif timeout is not None and timeout < SCRAPE_RESERVE:
+                return {"error": "Too little time left to scrape", "success": False, "skipped": True}
+            else:
+                if verbose:
+                    log_detail("linkedin_scrape", f"  [LinkedIn] Scraping company page: {linkedin_url}")
+                result = await active.scrape(linkedin_url, timeout=timeout)
+                if result.get("unavailable"):
+                    raise EndpointUnavailable(result)
+                if not result.get("success"):
+                    failed = {"error": result.get("error", "Scrape failed"), "success": False}
+                    if result.get("timed_out"):
+                        failed["timed_out"] = True
+                    return failed
+                data = extract_linkedin_company_data(result["data"])
+                if scrape_cache is not None:
+                    scrape_cache.put(linkedin_url, data)
+    except EndpointUnavailable:
+        raise
+    except Exception as e:
         return {"error": str(e), "success": False}
 
-    try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            if verbose:
-                print(f"  [LinkedIn] Scraping company page: {linkedin_url}")
+    if verbose:
+        emp = data.get("employee_count") or "N/A"
+        ind = data.get("industry") or "N/A"
+        log_detail("linkedin_scrape", f"  [LinkedIn] Extracted: employees={emp}, industry={ind}")
+
+    result = {
+        "success": True,
+        "employee_count": data.get("employee_count"),
+        "industry": data.get("industry"),
+        "followers": data.get("followers"),
+    }
+    if cached:
+        result["cached"] = True
+    return result
 
-            result = await client.scrape_url(linkedin_url)
 
-            if not result.success:
-                return {"error": f"Scrape failed: {result.error}", "success": False}
+@dataclass(frozen=True)
+class LeadFeatures:
+    """Matching features of a lead, computed once and reused for every candidate."""
 
-            data = extract_linkedin_company_data(result.data)
+    company_name: str
+    email_domain: str
+    phone_digits: str
 
-            if verbose:
-                emp = data.get("employee_count") or "N/A"
-                ind = data.get("industry") or "N/A"
-                print(f"  [LinkedIn] Extracted: employees={emp}, industry={ind}")
+    @classmethod
+    def from_lead(cls, lead: dict) -> "LeadFeatures":
+        email_domain = extract_email_domain(lead.get("work_email", "").strip()) or ""
+        if is_generic_email_domain(email_domain):
+            email_domain = ""
+        phone = lead.get("work_phone_number", "")
+        return cls(
+            company_name=preprocess_name(lead.get("company_name", "")),
+            email_domain=email_domain,
+            phone_digits=normalize_phone(phone) if phone else "",
+        )
 
-            return {
-                "success": True,
-                "employee_count": data.get("employee_count"),
-                "industry": data.get("industry"),
-                "followers": data.get("followers"),
-            }
 
-    except Exception as e:
-        return {"error": str(e), "success": False}
+def score_website_matches(
+    features: LeadFeatures,
+    results: list[dict],
+) -> list[float]:
+    """
+    Score how well each search result matches the lead.
+
+    Company name similarity for all results is computed in one batch.
+
+    Returns: one score 0.0-1.0 per result
+    """
+    titles = [preprocess_name(result.get("title", "")) for result in results]
+    similarities = similarity_matrix([features.company_name], titles)[0]
+
+    scores = []
+    for result, similarity in zip(results, similarities):
+        score = 0.0
+
+        # 1. Email domain match (0.50)
+        if features.email_domain:
+            if features.email_domain == extract_domain(result.get("url", "")):
+                score += 0.50
+
+        # 2. Company name similarity (0.25)
+        score += similarity * 0.25
+
+        # 3. Phone in snippet (0.15) - weak signal, just check if normalized phone appears
+        if features.phone_digits and features.phone_digits in normalize_phone(result.get("snippet", "")):
+            score += 0.15
+
+        scores.append(min(score, 1.0))
+
+    return scores
 
 
 def score_website_match(
@@ -725,159 +958,293 @@ def score_website_match(
 
     Returns score 0.0-1.0
     """
-    score = 0.0
-    company_name = lead.get("company_name", "")
-    email = lead.get("work_email", "")
-    phone = lead.get("work_phone_number", "")
-
-    # 1. Email domain match (0.50)
-    email_domain = extract_email_domain(email)
-    if email_domain and not is_generic_email_domain(email_domain):
-        result_domain = extract_domain(result.get("url", ""))
-        if email_domain == result_domain:
-            score += 0.50
-
-    # 2. Company name similarity (0.25)
-    title = result.get("title", "")
-    similarity = fuzzy_similarity(company_name, title)
-    score += similarity * 0.25
-
-    # 3. Phone in snippet (0.15) - weak signal, just check if normalized phone appears
-    snippet = result.get("snippet", "")
-    if phone and normalize_phone(phone) in normalize_phone(snippet):
-        score += 0.15
-
-    return min(score, 1.0)
+    return score_website_matches(LeadFeatures.from_lead(lead), [result])[0]
 
 
 def find_best_website(
     lead: dict,
     search_results: list[dict],
     min_confidence: float = 0.5,
+    features: Optional[LeadFeatures] = None,
 ) -> tuple[Optional[str], float, list[dict]]:
     """
     Find best matching website from search results.
 
+    Pass `features` to reuse a LeadFeatures computed earlier for the lead.
+
     Returns: (best_url, confidence, all_candidates)
     """
-    candidates = []
-
-    for result in search_results:
-        url = result.get("url", "")
-        if not url:
-            continue
-
-        # Skip LinkedIn, Facebook, etc. for website
-        skip_domains = ["linkedin.com", "facebook.com", "instagram.com",
-                        "twitter.com", "youtube.com", "wikipedia.org"]
-        if any(d in url for d in skip_domains):
-            continue
+    results = [
+        result for result in search_results
+        if result.get("url") and result["url"] not in SKIP_WEBSITE_INDEX
+    ]
+    if not results:
+        return None, 0.0, []
 
-        score = score_website_match(lead, result)
-        candidates.append({
-            "url": url,
+    scores = score_website_matches(features or LeadFeatures.from_lead(lead), results)
+    candidates = [
+        {
+            "url": result["url"],
             "title": result.get("title", ""),
             "snippet": result.get("snippet", ""),
             "score": score,
-        })
+        }
+        for result, score in zip(results, scores)
+    ]
 
     # Sort by score descending
     candidates.sort(key=lambda x: x["score"], reverse=True)
 
-    if not candidates:
-        return None, 0.0, []
-
     best = candidates[0]
     return best["url"], best["score"], candidates
 
 
-async def enrich_lead(
+def normalize_company_name(company_name: str) -> str:
+    """Normalize a company name for grouping (case, punctuation, spacing)."""
+    name = re.sub(r"[^\w\s&]", " ", company_name.lower())
+    return " ".join(name.split())
+
+
+def company_key(lead: dict, country: str) -> tuple[str, str, str]:
+    """
+    Key identifying the company a lead belongs to.
+
+    Leads sharing normalized company name, non-generic email domain and
+    country resolve to the same company-level facts.
+    """
+    email_domain = extract_email_domain(lead.get("work_email", "").strip()) or ""
+    if is_generic_email_domain(email_domain):
+        email_domain = ""
+    return (normalize_company_name(lead.get("company_name", "")), email_domain, country)
+
+
+# Company lookups kept by CompanyResolver (least recently used are dropped)
+COMPANY_CACHE_SIZE = 1000
+
+
+class CompanyResolver:
+    """
+    Run company-level lookups once per company within a run.
+
+    Lookups are keyed by company_key plus the stage and only take
+    company-level inputs (company name, email domain, country); everything
+    that depends on the person, such as the email search, phone scoring and
+    the lead's time budget, stays per lead. Concurrent leads from the same
+    company await the same task. A lookup that failed (e.g. during an
+    outage) is run again by the next lead. Only the `max_entries` most
+    recently used results are kept, so memory stays flat on long runs.
+    """
+
+    def __init__(self, max_entries: int = COMPANY_CACHE_SIZE):
+        self._tasks: OrderedDict[tuple, asyncio.Task] = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def resolve(self, key: tuple, factory, timeout: Optional[float] = None) -> tuple[dict, bool]:
+        """
+        Result of the lookup for `key`, started with `factory()` if needed.
+
+        Waits at most `timeout` seconds; the lookup itself keeps running
+        for other leads (raises asyncio.TimeoutError).
+
+        Returns: (result copy, True if another lead's lookup was reused)
+        """
+        task = self._tasks.get(key)
+        reused = task is not None
+        if reused:
+            self.hits += 1
+            self._tasks.move_to_end(key)
+        else:
+            task = asyncio.ensure_future(factory())
+            task.add_done_callback(functools.partial(self._forget_failed, key))
+            self._tasks[key] = task
+            self._evict()
+        # Shield so one cancelled or timed-out waiter does not cancel the shared lookup
+        return dict(await asyncio.wait_for(asyncio.shield(task), timeout)), reused
+
+    def _forget_failed(self, key: tuple, task: asyncio.Task) -> None:
+        # Also retrieves the exception when every waiter has gone
+        if (task.cancelled() or task.exception() is not None) and self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def _evict(self) -> None:
+        for key in list(self._tasks):
+            if len(self._tasks) <= self.max_entries:
+                break
+            # Lookups still in flight are bounded by the lead concurrency
+            if self._tasks[key].done():
+                del self._tasks[key]
+
+
+async def shared_lookup(
+    companies: Optional[CompanyResolver],
+    key: tuple,
+    stage: str,
+    deadline: Deadline,
+    lookup,
+) -> dict:
+    """
+    Run a company-level lookup once per company (see CompanyResolver).
+
+    `lookup` takes the Deadline to run under. Without `companies` it runs
+    under the lead's own `deadline`. A shared lookup outlives the lead that
+    started it, so it gets a budget of its own (same length), and each lead
+    waits for it only as long as its own deadline allows. Stages the shared
+    lookup missed are recorded on `deadline`.
+
+    Returns:
+        The lookup's dict (cached=True if another lead's lookup was
+        reused), or success=False and timed_out=True if `deadline` ran out
+        while waiting
+    """
+    if companies is None:
+        return await lookup(deadline)
+
+    async def run() -> dict:
+        own = Deadline(deadline.seconds)
+        result = await lookup(own)
+        if own.missed:
+            result["missed_stages"] = own.missed
+        return result
+
+    remaining = deadline.remaining()
+    try:
+        result, reused = await companies.resolve((*key, stage), run, remaining)
+    except asyncio.TimeoutError:
+        deadline.miss(stage)
+        return timed_out(remaining)
+    for missed in result.pop("missed_stages", []):
+        deadline.miss(missed)
+    if reused:
+        result["cached"] = True
+    return result
+
+
+async def find_website(
     lead: dict,
+    country: str,
     min_confidence: float = 0.8,
     verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    probed_domains: Optional[dict] = None,
+    metrics: Optional[RunMetrics] = None,
+    deadline: Optional[Deadline] = None,
+    companies: Optional[CompanyResolver] = None,
 ) -> dict:
     """
-    Enrich a single lead with website and LinkedIn info.
+    Find the company website with a chain of strategies.
 
-    Returns enriched lead dict.
-    """
-    result = lead.copy()
+    Strategies run in priority order (direct probe, email search, company
+    search). The first one that finds a website wins and later, more
+    expensive strategies are never issued. The direct probe reads
+    `probed_domains` (from probe_domains) when the domain is in it.
+    Every strategy that runs is recorded in `metrics`, if given.
 
-    # Initialize new fields
-    result["website"] = ""
-    result["website_confidence"] = 0.0
-    result["company_linkedin"] = ""
-    result["person_linkedin"] = ""
-    result["person_verified"] = ""
-    result["employee_count"] = ""
-    result["industry"] = ""
-    result["country"] = detect_country(lead)
-    result["notes"] = ""
+    Each call is bounded by the time left on `deadline`; strategies that
+    time out or are skipped because it expired are recorded on it. With
+    `companies`, the company-name search runs once per company and each
+    lead scores its results with its own features.
 
+    Returns dict with website, website_confidence and notes.
+    """
+    if deadline is None:
+        deadline = Deadline()
     company_name = lead.get("company_name", "").strip()
-    full_name = lead.get("full_name", "").strip()
     email = lead.get("work_email", "").strip()
-    email_domain = extract_email_domain(email)
-    is_generic_email = is_generic_email_domain(email_domain) if email_domain else True
-
-    # Check for generic company name
-    generic_names = ["selbstständigkeit", "selbstständig", "self-employed",
-                     "freelancer", "privat", "private"]
-    if company_name.lower() in generic_names:
-        result["notes"] = "Generic company name, verify manually"
-        return result
-
-    # Check if person name equals company name
-    person_is_company = person_equals_company(full_name, company_name)
+    features = LeadFeatures.from_lead(lead)
+    # Empty for missing and generic email domains
+    email_domain = features.email_domain
 
     # Strategy 1: Try direct website from email domain (non-generic emails only)
-    website_found = False
-    if not is_generic_email and email_domain:
+    async def direct_probe() -> Optional[dict]:
+        if not email_domain:
+            return None
         if verbose:
-            print(f"  [Strategy 1] Trying direct website: https://{email_domain}/")
-        direct_url, success = await try_direct_website(email_domain)
-        if success:
-            result["website"] = direct_url
-            result["website_confidence"] = 0.9  # High confidence - exact domain match
-            website_found = True
-            if verbose:
-                print(f"  [Strategy 1] ✅ Direct website found: {direct_url} (confidence: 0.9)")
+            log_detail("direct_probe", f"  [Strategy 1] Trying direct website: https://{email_domain}/")
+        if probed_domains is not None and email_domain in probed_domains:
+            direct_url = probed_domains[email_domain]
+            success = direct_url is not None
+        elif deadline.expired():
+            deadline.miss("direct_probe")
+            return None
+        else:
+            started = time.perf_counter()
+            direct_url, success = await try_direct_website(
+                email_domain, deadline.cap(DIRECT_PROBE_TIMEOUT)
+            )
+            record_stage(metrics, "direct_probe", SUCCESS if success else EMPTY, started)
+        if not success:
+            return None
+        if verbose:
+            log_detail(
+                "direct_probe", f"  [Strategy 1] ✅ Direct website found: {direct_url} (confidence: 0.9)"
+            )
+        # High confidence - exact domain match
+        return {"website": direct_url, "website_confidence": 0.9, "notes": ""}
 
     # Strategy 2: Search by email (non-generic emails only)
-    if not website_found and not is_generic_email and email:
+    async def email_search() -> Optional[dict]:
+        if not email_domain:
+            return None
+        if deadline.expired():
+            deadline.miss("email_search")
+            return None
         if verbose:
-            print(f"  [Strategy 2] Searching by email: \"{email}\"")
-        email_search = await search_by_email(email, result["country"])
-        if email_search.get("success"):
-            email_results = email_search.get("results", [])
-            if verbose:
-                print(f"  [Strategy 2] Found {len(email_results)} results")
-            if email_results:
-                # Look for website in email search results
-                for item in email_results:
-                    url = item.get("url", "")
-                    # Skip social media
-                    if any(d in url for d in ["linkedin.com", "facebook.com", "instagram.com"]):
-                        continue
-                    # Check if email domain matches
-                    if email_domain and extract_domain(url) == email_domain:
-                        result["website"] = url
-                        result["website_confidence"] = 0.9  # High confidence - email search + exact domain match
-                        website_found = True
-                        if verbose:
-                            print(f"  [Strategy 2] ✅ Domain match found: {url} (confidence: 0.9)")
-                        break
+            log_detail("email_search", f"  [Strategy 2] Searching by email: \"{email}\"")
+        started = time.perf_counter()
+        email_results = await search_by_email(
+            email, country, session=session, timeout=deadline.remaining()
+        )
+        cached = email_results.get("cached", False)
+        if not email_results.get("success"):
+            record_stage(metrics, "email_search", FAILURE, started)
+            if email_results.get("timed_out"):
+                deadline.miss("email_search")
+            return None
+        items = email_results.get("results", [])
+        if verbose:
+            log_detail("email_search", f"  [Strategy 2] Found {len(items)} results")
+        # Look for website in email search results
+        for item in items:
+            url = item.get("url", "")
+            # Skip social media
+            if url in SKIP_WEBSITE_INDEX:
+                continue
+            # Check if email domain matches
+            if extract_domain(url) == email_domain:
+                if verbose:
+                    log_detail(
+                        "email_search", f"  [Strategy 2] ✅ Domain match found: {url} (confidence: 0.9)"
+                    )
+                record_stage(metrics, "email_search", SUCCESS, started, cached)
+                # High confidence - email search + exact domain match
+                return {"website": url, "website_confidence": 0.9, "notes": ""}
+        record_stage(metrics, "email_search", EMPTY, started, cached)
+        return None
 
     # Strategy 3: Search by company name (fallback)
-    if not website_found:
+    async def company_search() -> dict:
+        result = {"website": "", "website_confidence": 0.0, "notes": ""}
+        if deadline.expired():
+            deadline.miss("company_search")
+            return result
         if verbose:
-            print(f"  [Strategy 3] Searching by company name: \"{company_name}\"")
-        search_result = await search_company(company_name, result["country"])
+            log_detail("company_search", f"  [Strategy 3] Searching by company name: \"{company_name}\"")
+        started = time.perf_counter()
+        search_result = await shared_lookup(
+            companies, company_key(lead, country), "company_search", deadline,
+            lambda own: search_company(company_name, country, session=session, timeout=own.remaining()),
+        )
 
         if search_result.get("success"):
             search_results = search_result.get("results", [])
             if search_results:
-                best_url, confidence, candidates = find_best_website(lead, search_results, min_confidence)
+                best_url, confidence, candidates = find_best_website(
+                    lead, search_results, min_confidence, features
+                )
                 result["website"] = best_url or ""
                 result["website_confidence"] = confidence
 
@@ -888,8 +1255,281 @@ async def enrich_lead(
                     result["notes"] = f"Medium confidence. Candidates: {', '.join(candidate_urls)}"
                 elif confidence < 0.5:
                     result["notes"] = f"Low confidence match ({confidence:.2f}). Manual review needed."
+            outcome = SUCCESS if result["website"] else EMPTY
+            record_stage(metrics, "company_search", outcome, started, search_result.get("cached", False))
+        elif search_result.get("timed_out"):
+            deadline.miss("company_search")
+            record_stage(metrics, "company_search", FAILURE, started)
         else:
             result["notes"] = f"Search error: {search_result.get('error', 'Unknown')}"
+            record_stage(metrics, "company_search", FAILURE, started)
+        return result
+
+    for strategy in (direct_probe, email_search):
+        found = await strategy()
+        if found is not None:
+            return found
+    return await company_search()
+
+
+async def find_company_linkedin(
+    company_name: str,
+    country: str,
+    verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    metrics: Optional[RunMetrics] = None,
+    deadline: Optional[Deadline] = None,
+) -> dict:
+    """
+    Find and scrape the company LinkedIn page.
+
+    Calls are bounded by the time left on `deadline`; the scrape is
+    skipped when less than SCRAPE_RESERVE seconds are left.
+
+    Returns dict with company_linkedin, employee_count and industry.
+    """
+    result = {"company_linkedin": "", "employee_count": "", "industry": ""}
+    if not company_name:
+        return result
+    if deadline is None:
+        deadline = Deadline()
+    if deadline.expired():
+        deadline.miss("linkedin_company")
+        return result
+
+    if verbose:
+        log_detail("linkedin_company", f"  [LinkedIn] Searching for company: \"{company_name}\"")
+    started = time.perf_counter()
+    linkedin_company = await search_linkedin_company(
+        company_name, country, session=session, timeout=deadline.remaining()
+    )
+    cached = linkedin_company.get("cached", False)
+    if linkedin_company.get("success") and linkedin_company.get("url"):
+        # Validate LinkedIn result
+        if validate_linkedin_result(company_name, linkedin_company["url"], linkedin_company.get("title", "")):
+            record_stage(metrics, "linkedin_company", SUCCESS, started, cached)
+            result["company_linkedin"] = linkedin_company["url"]
+            if verbose:
+                log_detail(
+                    "linkedin_company", f"  [LinkedIn] ✅ Company page validated: {linkedin_company['url']}"
+                )
+
+            # Scrape company page for employee count and industry
+            started = time.perf_counter()
+            company_data = await scrape_linkedin_company(
+                linkedin_company["url"], verbose, session=session, timeout=deadline.remaining()
+            )
+            if company_data.get("skipped"):
+                deadline.miss("linkedin_scrape")
+            elif company_data.get("success"):
+                if company_data.get("employee_count"):
+                    result["employee_count"] = company_data["employee_count"]
+                if company_data.get("industry"):
+                    result["industry"] = company_data["industry"]
+                outcome = SUCCESS if result["employee_count"] or result["industry"] else EMPTY
+                record_stage(metrics, "linkedin_scrape", outcome, started, company_data.get("cached", False))
+            else:
+                record_stage(metrics, "linkedin_scrape", FAILURE, started)
+                if company_data.get("timed_out"):
+                    deadline.miss("linkedin_scrape")
+        else:
+            record_stage(metrics, "linkedin_company", EMPTY, started, cached)
+            if verbose:
+                log_detail(
+                    "linkedin_company", f"  [LinkedIn] ⚠️ Result rejected by validation: {linkedin_company['url']}"
+                )
+    else:
+        outcome = EMPTY if linkedin_company.get("success") else FAILURE
+        record_stage(metrics, "linkedin_company", outcome, started, cached)
+        if linkedin_company.get("timed_out"):
+            deadline.miss("linkedin_company")
+        if verbose:
+            log_detail("linkedin_company", f"  [LinkedIn] No company page found")
+
+    return result
+
+
+async def find_person_linkedin(
+    full_name: str,
+    company_name: str,
+    country: str,
+    verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    metrics: Optional[RunMetrics] = None,
+    deadline: Optional[Deadline] = None,
+) -> dict:
+    """
+    Find the person's LinkedIn profile.
+
+    The search is bounded by the time left on `deadline`.
+
+    Returns dict with person_linkedin and person_verified.
+    """
+    result = {"person_linkedin": "", "person_verified": ""}
+    if not (full_name and company_name):
+        return result
+    if deadline is None:
+        deadline = Deadline()
+    if deadline.expired():
+        deadline.miss("linkedin_person")
+        return result
+
+    if verbose:
+        log_detail(
+            "linkedin_person", f"  [LinkedIn] Searching for person: \"{full_name}\" at \"{company_name}\""
+        )
+    started = time.perf_counter()
+    linkedin_person = await search_linkedin_person(
+        full_name, company_name, country, session=session, timeout=deadline.remaining()
+    )
+    if not linkedin_person.get("success"):
+        outcome = FAILURE
+        if linkedin_person.get("timed_out"):
+            deadline.miss("linkedin_person")
+    else:
+        outcome = SUCCESS if linkedin_person.get("url") else EMPTY
+    record_stage(metrics, "linkedin_person", outcome, started, linkedin_person.get("cached", False))
+    if linkedin_person.get("success") and linkedin_person.get("url"):
+        result["person_linkedin"] = linkedin_person["url"]
+        result["person_verified"] = "true"  # Found on LinkedIn with company
+        if verbose:
+            log_detail("linkedin_person", f"  [LinkedIn] ✅ Person profile found: {linkedin_person['url']}")
+    elif verbose:
+        log_detail("linkedin_person", f"  [LinkedIn] No person profile found")
+
+    return result
+
+
+async def resolve_company(
+    lead: dict,
+    country: str,
+    min_confidence: float = 0.8,
+    verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    probed_domains: Optional[dict] = None,
+    metrics: Optional[RunMetrics] = None,
+    deadline: Optional[Deadline] = None,
+    companies: Optional[CompanyResolver] = None,
+) -> dict:
+    """
+    Find company-level facts for a lead: website and company LinkedIn data.
+
+    The website chain and the LinkedIn branch do not depend on each other
+    and run concurrently, both within the time left on `deadline`. With
+    `companies`, the company search and the company LinkedIn lookup are
+    shared with the lead's colleagues (see CompanyResolver).
+
+    Returns dict with website, website_confidence, notes, company_linkedin,
+    employee_count and industry. Stages that ran out of time are recorded
+    on `deadline`.
+    """
+    if deadline is None:
+        deadline = Deadline()
+    company_name = lead.get("company_name", "").strip()
+
+    async def company_linkedin() -> dict:
+        facts = await shared_lookup(
+            companies, company_key(lead, country), "linkedin_company", deadline,
+            lambda own: find_company_linkedin(company_name, country, verbose, session, metrics, own),
+        )
+        return {field: facts.get(field, "") for field in ("company_linkedin", "employee_count", "industry")}
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            website = tg.create_task(
+                find_website(
+                    lead, country, min_confidence, verbose, session, probed_domains, metrics, deadline,
+                    companies,
+                )
+            )
+            linkedin = tg.create_task(company_linkedin())
+    except* EndpointUnavailable as group:
+        # The other branch was cancelled; report the outage itself
+        raise group.exceptions[0] from None
+    return {**website.result(), **linkedin.result()}
+
+
+def empty_result(lead: dict, notes: str = "") -> dict:
+    """Lead with all enrichment fields initialized (nothing found yet)."""
+    result = lead.copy()
+    result["website"] = ""
+    result["website_confidence"] = 0.0
+    result["company_linkedin"] = ""
+    result["person_linkedin"] = ""
+    result["person_verified"] = ""
+    result["employee_count"] = ""
+    result["industry"] = ""
+    result["country"] = detect_country(lead)
+    result["notes"] = notes
+    return result
+
+
+async def enrich_lead(
+    lead: dict,
+    min_confidence: float = 0.8,
+    verbose: bool = False,
+    session: Optional[BrightDataSession] = None,
+    companies: Optional[CompanyResolver] = None,
+    probed_domains: Optional[dict] = None,
+    metrics: Optional[RunMetrics] = None,
+    deadline: Optional[Deadline] = None,
+) -> dict:
+    """
+    Enrich a single lead with website and LinkedIn info.
+
+    All SERP and scrape calls go through `session` when given. With a
+    CompanyResolver, company-level facts are shared by all leads of the
+    same company; only the person lookup runs per lead. `probed_domains`
+    holds pre-probed email domain liveness results (see probe_domains).
+    Stage runs are recorded in `metrics`, if given.
+
+    Every call gets the time left on `deadline` as its timeout. Stages that
+    ran out of time are named in the lead's notes.
+
+    Returns enriched lead dict.
+
+    Raises:
+        EndpointUnavailable: If a Bright Data endpoint is failing; the
+            lead's other lookups are cancelled
+    """
+    if deadline is None:
+        deadline = Deadline()
+    result = empty_result(lead)
+
+    company_name = lead.get("company_name", "").strip()
+    full_name = lead.get("full_name", "").strip()
+    email_domain = extract_email_domain(lead.get("work_email", "").strip())
+    is_generic_email = is_generic_email_domain(email_domain) if email_domain else True
+
+    # Check for generic company name
+    generic_names = ["selbstständigkeit", "selbstständig", "self-employed",
+                     "freelancer", "privat", "private"]
+    if company_name.lower() in generic_names:
+        result["notes"] = "Generic company name, verify manually"
+        return result
+
+    # Check if person name equals company name
+    person_is_company = person_equals_company(full_name, company_name)
+
+    # Company-level facts (website, company LinkedIn, employee count, industry)
+    # and the per-person lookup are independent, so they run concurrently
+    try:
+        async with asyncio.TaskGroup() as tg:
+            company = tg.create_task(
+                resolve_company(
+                    lead, result["country"], min_confidence, verbose, session, probed_domains, metrics,
+                    deadline, companies,
+                )
+            )
+            person = tg.create_task(
+                find_person_linkedin(
+                    full_name, company_name, result["country"], verbose, session, metrics, deadline
+                )
+            )
+    except* EndpointUnavailable as group:
+        raise group.exceptions[0] from None
+    result.update(company.result())
+    result.update(person.result())
 
     # Handle person=company case
     if person_is_company and not is_generic_email:
@@ -900,128 +1540,639 @@ async def enrich_lead(
         if not result["notes"]:
             result["notes"] = "Person name equals company name with generic email. Verify manually."
 
-    # Search for LinkedIn profiles (with validation)
-    if company_name:
-        if verbose:
-            print(f"  [LinkedIn] Searching for company: \"{company_name}\"")
-        linkedin_company = await search_linkedin_company(company_name, result["country"])
-        if linkedin_company.get("success") and linkedin_company.get("url"):
-            # Validate LinkedIn result
-            if validate_linkedin_result(company_name, linkedin_company["url"], linkedin_company.get("title", "")):
-                result["company_linkedin"] = linkedin_company["url"]
-                if verbose:
-                    print(f"  [LinkedIn] ✅ Company page validated: {linkedin_company['url']}")
-
-                # Scrape company page for employee count and industry
-                company_data = await scrape_linkedin_company(linkedin_company["url"], verbose)
-                if company_data.get("success"):
-                    if company_data.get("employee_count"):
-                        result["employee_count"] = company_data["employee_count"]
-                    if company_data.get("industry"):
-                        result["industry"] = company_data["industry"]
-            else:
-                if verbose:
-                    print(f"  [LinkedIn] ⚠️ Result rejected by validation: {linkedin_company['url']}")
-        elif verbose:
-            print(f"  [LinkedIn] No company page found")
-
-    if full_name and company_name:
-        if verbose:
-            print(f"  [LinkedIn] Searching for person: \"{full_name}\" at \"{company_name}\"")
-        linkedin_person = await search_linkedin_person(full_name, company_name, result["country"])
-        if linkedin_person.get("success") and linkedin_person.get("url"):
-            result["person_linkedin"] = linkedin_person["url"]
-            result["person_verified"] = "true"  # Found on LinkedIn with company
-            if verbose:
-                print(f"  [LinkedIn] ✅ Person profile found: {linkedin_person['url']}")
-        elif verbose:
-            print(f"  [LinkedIn] No person profile found")
+    incomplete = deadline.note()
+    if incomplete:
+        result["notes"] = f"{result['notes']} {incomplete}".strip()
 
     return result
 
 
+# Leads failed by a Bright Data outage are retried after the circuit's open
+# period (at least REQUEUE_DELAY seconds); the run stops once one lead has
+# waited MAX_REQUEUE_SECONDS
+REQUEUE_DELAY = 5.0
+MAX_REQUEUE_SECONDS = 900.0
+
+# Retries of a lead whose endpoint failures left the circuit closed; after
+# these the lead is written with a "Search error" note
+MAX_LEAD_REQUEUES = 3
+
+
+def count_rows(input_file: Path, byte_range: Optional[ByteRange] = None) -> int:
+    """Count data rows in a tab-delimited file (or one shard) without keeping them in memory."""
+    with open_leads(input_file, byte_range) as reader:
+        return sum(1 for _ in reader)
+
+
+def review_path_for(output_file: Path) -> Path:
+    """Return the review-needed file path next to an output file."""
+    return output_file.with_name(
+        output_file.stem + "_review_needed" + output_file.suffix
+    )
+
+
 async def enrich_csv(
     input_path: str,
     output_path: str,
     min_confidence: float = 0.8,
     verbose: bool = False,
+    concurrency: int = 1,
+    session: Optional[BrightDataSession] = None,
+    cache: Optional[SerpCache] = None,
+    resume: bool = False,
+    serp_rate: float = DEFAULT_SERP_RATE,
+    scrape_rate: float = DEFAULT_SCRAPE_RATE,
+    probe_concurrency: int = PROBE_CONCURRENCY,
+    scrape_cache: Optional[ScrapeCache] = None,
+    byte_range: Optional[ByteRange] = None,
+    serp_limiter=None,
+    scrape_limiter=None,
+    output_format: str = "tsv",
+    metrics_file: Optional[str] = None,
+    prometheus_file: Optional[str] = None,
+    metrics_interval: float = METRICS_INTERVAL,
+    log_file: Optional[str] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+    progress_label: str = "",
+    previous_path: Optional[str] = None,
+    max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    lead_timeout: float = DEFAULT_LEAD_TIMEOUT,
 ) -> dict:
     """
     Enrich all leads in a CSV file.
 
+    Rows are streamed: read lazily from the input and each enriched row is
+    written (and flushed) to the output and review files as soon as it and
+    all rows before it are done, so memory stays flat for any file size.
+
+    Up to `concurrency` leads are enriched at the same time. Output rows
+    keep the input order regardless of which lead finishes first. All leads
+    share one Bright Data session; one is opened for the run (in front of
+    `cache`, if given) when no session is passed in. That session throttles
+    searches to `serp_rate` and scrapes to `scrape_rate` requests per second,
+    adapting both to the provider's rate-limit responses; pass `serp_limiter`
+    and `scrape_limiter` to use existing limiters instead.
+
+    With `byte_range` (see sharding.shard_byte_ranges) only that shard of
+    the input is enriched.
+
+    `output_format` ("tsv", "jsonl" or "parquet") applies to both the
+    output and the review file; see output_formats.
+
+    Every completed lead is appended to a journal next to the output. With
+    `resume`, leads already in the journal are copied from it instead of
+    being enriched again.
+
+    With `previous_path` (an earlier enriched output of any format), leads
+    whose input columns are unchanged and whose enrichment is younger than
+    `max_age_days` are copied from it; only new, changed and stale leads
+    are enriched. Every row records its lookup time in enriched_at.
+
+    Each lead gets `lead_timeout` seconds (0 for no limit) from the moment
+    it starts; calls are bounded by the time left and stages that run out
+    of time are named in the lead's notes (see deadline.py).
+
+    Before enrichment starts, all unique non-generic email domains are
+    probed at once (`probe_concurrency` in parallel over one HTTP session)
+    and the results feed the direct-website strategy of every lead.
+
+    Per-stage metrics (see metrics.py) are written to `metrics_file`
+    (default: next to the output) and, if given, to `prometheus_file`
+    every `metrics_interval` seconds and at the end of the run.
+
+    Progress (leads/s, API calls/s, ETA, error rate) is refreshed in place
+    on a terminal, or printed every `progress_interval` seconds otherwise;
+    `progress_label` prefixes the line (e.g. in worker processes). With
+    `verbose`, per-lead details go to the JSON-lines `log_file` (default:
+    next to the output), tagged with the lead's id.
+
+    When a Bright Data endpoint keeps failing, its circuit breaker opens
+    and calls fail fast. Leads hit by an endpoint failure are requeued:
+    they wait (outside the concurrency limit) until the endpoint may be
+    probed again and are then enriched from scratch, so no lead is written
+    out with outage errors. A lead that fails MAX_LEAD_REQUEUES more times
+    while the circuit stays closed is written with a "Search error" note.
+    If one lead is still failing after MAX_REQUEUE_SECONDS the run stops;
+    rerun with `resume` to continue.
+
     Returns summary dict.
     """
     input_file = Path(input_path)
     if not input_file.exists():
         return {"error": f"Input file not found: {input_path}", "success": False}
 
-    # Read input CSV
-    leads = []
-    with open(input_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter="\t")  # Tab-delimited
-        leads = list(reader)
-
-    if not leads:
+    total = count_rows(input_file, byte_range)
+    if not total:
         return {"error": "No leads found in input file", "success": False}
 
-    print(f"Processing {len(leads)} leads...")
+    print(f"Processing {total} leads (concurrency: {concurrency})...")
 
-    # Enrich each lead
-    enriched = []
+    previous = None
+    if previous_path:
+        if not Path(previous_path).exists():
+            return {"error": f"Previous output not found: {previous_path}", "success": False}
+        previous = PreviousEnrichment(Path(previous_path), ENRICHMENT_FIELDS, max_age_days)
+        print(
+            f"Previous output: {len(previous)} fresh rows, {previous.stale} stale, "
+            f"{previous.failed} failed ({previous_path})"
+        )
+
+    output_file = Path(output_path)
+    review_file = review_path_for(output_file)
+    journal_file = journal_path_for(output_file)
+    metrics_file = Path(metrics_file) if metrics_file else metrics_path_for(output_file)
+    prometheus_file = Path(prometheus_file) if prometheus_file else None
+    log_file = Path(log_file) if log_file else log_path_for(output_file)
+    concurrency = max(1, concurrency)
+
+    # Enrich leads with a bounded number in flight
+    semaphore = asyncio.Semaphore(concurrency)
     high_confidence_count = 0
     review_count = 0
-
-    for i, lead in enumerate(leads):
-        if (i + 1) % 10 == 0:
-            print(f"  Progress: {i + 1}/{len(leads)}")
-
-        enriched_lead = await enrich_lead(lead, min_confidence, verbose)
-        enriched.append(enriched_lead)
+    review_written = 0
+    resumed_count = 0
+    carried_count = 0
+    requeued_count = 0
+    companies = CompanyResolver()
+    metrics = RunMetrics()
+    # Worker processes share the terminal, so they print lines instead
+    progress = ProgressReporter(
+        total, metrics, progress_interval,
+        refresh=False if progress_label else None, label=progress_label,
+    )
+    lead_log = None
+
+    async def enrich_one(lead: dict, lead_id: str) -> dict:
+        async with semaphore:
+            with lead_log.lead(lead_id) if lead_log is not None else nullcontext():
+                started = time.perf_counter()
+                if lead_log is not None:
+                    lead_log.write(lead_id, "start", company=lead.get("company_name", ""))
+                enriched_lead = await enrich_lead(
+                    lead, min_confidence, verbose, session=session, companies=companies,
+                    probed_domains=probed_domains, metrics=metrics,
+                    deadline=Deadline(lead_timeout or None),
+                )
+                enriched_lead[ENRICHED_AT] = enriched_at_now()
+                if lead_log is not None:
+                    lead_log.write(
+                        lead_id, "done",
+                        seconds=round(time.perf_counter() - started, 3),
+                        website=enriched_lead.get("website", ""),
+                        website_confidence=enriched_lead.get("website_confidence", 0.0),
+                        notes=enriched_lead.get("notes", ""),
+                    )
+        return enriched_lead
+
+    async def process(lead: dict) -> dict:
+        nonlocal high_confidence_count, review_count, resumed_count, carried_count, requeued_count
+        key = row_hash(lead)
+        prior = previous.get(key) if previous is not None else None
+        resumed = key in journal
+        if resumed:
+            enriched_lead = journal.load(key)
+            resumed_count += 1
+        elif prior is not None:
+            enriched_lead = {**lead, **prior}
+            journal.append(key, enriched_lead)
+            carried_count += 1
+        else:
+            lead_id = key[:LEAD_ID_LENGTH]
+            outage_started = None
+            closed_failures = 0
+            while True:
+                try:
+                    enriched_lead = await enrich_one(lead, lead_id)
+                    break
+                except EndpointUnavailable as e:
+                    now = time.monotonic()
+                    outage_started = outage_started or now
+                    if now - outage_started >= MAX_REQUEUE_SECONDS:
+                        raise
+                    if not e.circuit_open:
+                        # The endpoint works for other leads; don't retry this one forever
+                        closed_failures += 1
+                        if closed_failures > MAX_LEAD_REQUEUES:
+                            enriched_lead = empty_result(lead, f"Search error: {e}")
+                            enriched_lead[ENRICHED_AT] = enriched_at_now()
+                            break
+                    requeued_count += 1
+                    if lead_log is not None:
+                        lead_log.write(lead_id, "requeued", error=str(e))
+                    await asyncio.sleep(max(REQUEUE_DELAY, e.retry_after))
+            journal.append(key, enriched_lead)
+            metrics.leads_completed += 1
+
+        progress.advance(skipped=resumed or prior is not None)
 
         if enriched_lead["website_confidence"] >= min_confidence:
             high_confidence_count += 1
         elif enriched_lead["website_confidence"] >= 0.5:
             review_count += 1
 
-        # Rate limiting
-        time.sleep(1)
-
-    # Write enriched CSV
-    output_file = Path(output_path)
-    fieldnames = list(enriched[0].keys())
-
-    with open(output_file, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-        writer.writeheader()
-        writer.writerows(enriched)
-
-    # Write review-needed CSV
-    review_file = output_file.with_name(
-        output_file.stem + "_review_needed" + output_file.suffix
-    )
-    review_leads = [l for l in enriched if l["website_confidence"] < min_confidence and l["website"]]
+        return enriched_lead
+
+    async with AsyncExitStack() as stack:
+        if session is None:
+            try:
+                session = await stack.enter_async_context(
+                    BrightDataSession(
+                        get_api_key(),
+                        cache=cache,
+                        serp_limiter=serp_limiter or AdaptiveRateLimiter(serp_rate),
+                        scrape_limiter=scrape_limiter or AdaptiveRateLimiter(scrape_rate),
+                        scrape_cache=scrape_cache,
+                        serp_breaker=CircuitBreaker("SERP"),
+                        scrape_breaker=CircuitBreaker("scrape"),
+                    )
+                )
+            except Exception as e:
+                return {"error": f"Could not open Bright Data session: {e}", "success": False}
+
+        journal = EnrichmentJournal(journal_file, resume=resume)
+        stack.callback(journal.close)
+        if resume:
+            print(f"Resuming: {len(journal)} leads already in {journal_file}")
+        elif journal.backup is not None:
+            print(f"Moved the journal of an earlier run to {journal.backup} (use --resume to continue a run)")
+
+        async def write_metrics_periodically():
+            while True:
+                await asyncio.sleep(metrics_interval)
+                metrics.write(metrics_file, prometheus_file)
+
+        # Final write runs after the periodic writer is cancelled, even on errors
+        stack.callback(metrics.write, metrics_file, prometheus_file)
+        stack.callback(asyncio.create_task(write_metrics_periodically()).cancel)
 
-    if review_leads:
-        with open(review_file, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-            writer.writeheader()
-            writer.writerows(review_leads)
+        if verbose:
+            lead_log = LeadLog(log_file, append=resume)
+            stack.callback(lead_log.close)
+            print(f"Per-lead details: {log_file}")
+
+        async def report_progress():
+            while True:
+                await asyncio.sleep(progress.interval)
+                progress.report()
+                if lead_log is not None:
+                    lead_log.flush()
+
+        stack.callback(progress.finish)
+        stack.callback(asyncio.create_task(report_progress()).cancel)
+
+        # Pre-stage: probe every email domain once, concurrently
+        skip = (journal,) if previous is None else (journal, previous)
+        domains = collect_email_domains(input_file, skip=skip, byte_range=byte_range)
+        probed_domains = {}
+        if domains:
+            print(f"Probing {len(domains)} email domains...")
+            probed_domains = await probe_domains(domains, probe_concurrency, metrics=metrics)
+            live = sum(1 for url in probed_domains.values() if url)
+            print(f"  {live}/{len(domains)} domains have a live website")
+
+        reader = stack.enter_context(open_leads(input_file, byte_range))
+        input_fields = list(reader.fieldnames or [])
+        fieldnames = input_fields + [f for f in ENRICHMENT_FIELDS if f not in input_fields]
+
+        output_writer = OUTPUT_WRITERS[output_format]
+        writer = stack.enter_context(output_writer(output_file, fieldnames))
+        review_writer = None
+
+        def write_row(enriched_lead: dict) -> None:
+            nonlocal review_writer, review_written
+            writer.write(enriched_lead)
+
+            if enriched_lead["website_confidence"] < min_confidence and enriched_lead["website"]:
+                if review_writer is None:
+                    review_writer = stack.enter_context(output_writer(review_file, fieldnames))
+                review_writer.write(enriched_lead)
+                review_written += 1
+
+        # Tasks are written in input order; the window bounds how many
+        # finished rows can wait behind a slow one
+        window = concurrency * 2
+        pending: deque[asyncio.Task] = deque()
+        try:
+            for lead in reader:
+                pending.append(asyncio.create_task(process(lead)))
+                if len(pending) >= window:
+                    write_row(await pending.popleft())
+            while pending:
+                write_row(await pending.popleft())
+        except EndpointUnavailable as e:
+            return {
+                "error": (
+                    f"Bright Data still failing after {MAX_REQUEUE_SECONDS / 60:g} minutes ({e}); "
+                    f"finished leads are in {journal_file}, rerun with --resume to continue"
+                ),
+                "success": False,
+            }
+        finally:
+            for task in pending:
+                task.cancel()
+
+        cache_stats = session.cache.stats() if session.cache is not None else None
+        scrape_cache_stats = (
+            session.scrape_cache.stats() if session.scrape_cache is not None else None
+        )
+        rate_limited = sum(
+            limiter.rate_limited_count
+            for limiter in (session.serp_limiter, session.scrape_limiter)
+            if limiter is not None
+        )
+        circuit_opened = sum(
+            breaker.opened_count
+            for breaker in (session.serp_breaker, session.scrape_breaker)
+            if breaker is not None
+        )
 
     print(f"\nComplete!")
-    print(f"  Total leads: {len(leads)}")
+    print(f"  Total leads: {total}")
+    if resume:
+        print(f"  Resumed from journal: {resumed_count}")
+    if previous is not None:
+        print(f"  Carried forward from previous output: {carried_count}")
     print(f"  High confidence: {high_confidence_count}")
     print(f"  Needs review: {review_count}")
+    if companies.hits:
+        print(f"  Company lookups reused: {companies.hits}")
+    if cache_stats is not None:
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        print(f"  SERP cache hits: {cache_stats['hits']}/{lookups} ({cache_stats['hit_rate']:.0%})")
+        if cache_stats["negative_hits"]:
+            print(f"  Known LinkedIn misses skipped: {cache_stats['negative_hits']}")
+    if scrape_cache_stats is not None and scrape_cache_stats["hits"]:
+        print(f"  LinkedIn company pages from cache: {scrape_cache_stats['hits']}")
+    if rate_limited:
+        print(f"  Rate-limited responses (backed off): {rate_limited}")
+    if circuit_opened or requeued_count:
+        print(f"  Bright Data outages: circuit opened {circuit_opened}x, leads requeued {requeued_count}x")
+    if metrics.summary_line():
+        print(f"  Network calls by stage: {metrics.summary_line()}")
     print(f"  Output: {output_file}")
-    if review_leads:
+    if review_written:
         print(f"  Review file: {review_file}")
+    print(f"  Metrics: {metrics_file}")
 
-    return {
+    summary = {
         "success": True,
-        "total": len(leads),
+        "total": total,
         "high_confidence": high_confidence_count,
         "review_needed": review_count,
+        "resumed": resumed_count,
+        "carried_forward": carried_count,
+        "rate_limited": rate_limited,
+        "circuit_opened": circuit_opened,
+        "requeued": requeued_count,
+        "company_reuses": companies.hits,
         "output_file": str(output_file),
+        "metrics_file": str(metrics_file),
     }
+    if cache_stats is not None:
+        summary["cache"] = cache_stats
+    if scrape_cache_stats is not None:
+        summary["scrape_cache"] = scrape_cache_stats
+    return summary
+
+
+# Summary counters added up across shards
+SHARD_SUMMARY_COUNTERS = [
+    "total", "high_confidence", "review_needed", "resumed", "carried_forward", "rate_limited",
+    "circuit_opened", "requeued", "company_reuses",
+]
+
+
+def _enrich_shard(job: dict) -> dict:
+    """
+    Worker process entry point: enrich one shard of the input.
+
+    Opens its own caches (SQLite handles concurrent processes) and draws
+    from the parent's shared rate limiters.
+    """
+    from rate_budget import RemoteRateLimiter
+
+    cache_options = job["cache_options"]
+    cache = scrape_cache = None
+    if cache_options is not None:
+        cache = SerpCache(
+            cache_options["cache_dir"],
+            cache_options["ttl_days"],
+            negative_ttl_days=cache_options["negative_ttl_days"],
+        )
+        scrape_cache = ScrapeCache(cache_options["cache_dir"], cache_options["scrape_ttl_days"])
+
+    try:
+        return asyncio.run(
+            enrich_csv(
+                job["input_path"],
+                job["output_path"],
+                job["min_confidence"],
+                job["verbose"],
+                concurrency=job["concurrency"],
+                cache=cache,
+                resume=job["resume"],
+                probe_concurrency=job["probe_concurrency"],
+                scrape_cache=scrape_cache,
+                byte_range=job["byte_range"],
+                serp_limiter=RemoteRateLimiter(job["serp_limiter"]),
+                scrape_limiter=RemoteRateLimiter(job["scrape_limiter"]),
+                output_format=job["output_format"],
+                metrics_file=job["metrics_file"],
+                metrics_interval=job["metrics_interval"],
+                progress_interval=job["progress_interval"],
+                progress_label=job["progress_label"],
+                previous_path=job["previous_path"],
+                max_age_days=job["max_age_days"],
+                lead_timeout=job["lead_timeout"],
+            )
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+        if scrape_cache is not None:
+            scrape_cache.close()
+
+
+def merge_shard_summaries(summaries: list[dict]) -> dict:
+    """Add up the summaries of all shards into one run summary."""
+    merged = {key: sum(s.get(key, 0) for s in summaries) for key in SHARD_SUMMARY_COUNTERS}
+    for stats_key in ("cache", "scrape_cache"):
+        stats = [s[stats_key] for s in summaries if stats_key in s]
+        if not stats:
+            continue
+        combined = {k: sum(st[k] for st in stats) for k in stats[0] if k != "hit_rate"}
+        if "hit_rate" in stats[0]:
+            lookups = combined["hits"] + combined["misses"]
+            combined["hit_rate"] = round(combined["hits"] / lookups, 3) if lookups else 0.0
+        merged[stats_key] = combined
+    return merged
+
+
+def merge_shard_metrics(metrics: RunMetrics, shard_metrics_files: list[Path]) -> RunMetrics:
+    """Combine the latest metrics files written by the shards (missing ones are skipped)."""
+    combined = RunMetrics()
+    combined.started = metrics.started
+    for path in shard_metrics_files:
+        data = load_metrics(path)
+        if data is not None:
+            combined.merge(data)
+    return combined
+
+
+def enrich_csv_sharded(
+    input_path: str,
+    output_path: str,
+    workers: int,
+    min_confidence: float = 0.8,
+    verbose: bool = False,
+    concurrency: int = 1,
+    resume: bool = False,
+    serp_rate: float = DEFAULT_SERP_RATE,
+    scrape_rate: float = DEFAULT_SCRAPE_RATE,
+    probe_concurrency: int = PROBE_CONCURRENCY,
+    cache_options: Optional[dict] = None,
+    output_format: str = "tsv",
+    metrics_file: Optional[str] = None,
+    prometheus_file: Optional[str] = None,
+    metrics_interval: float = METRICS_INTERVAL,
+    log_file: Optional[str] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+    previous_path: Optional[str] = None,
+    max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    lead_timeout: float = DEFAULT_LEAD_TIMEOUT,
+) -> dict:
+    """
+    Enrich a large CSV with one worker process per byte-range shard.
+
+    Every worker runs enrich_csv on its shard with `concurrency` leads in
+    flight. All workers share one SERP and one scrape rate budget hosted
+    by this (parent) process. Shard outputs and review files are merged in
+    input order; shard journals are kept so an interrupted run can be
+    resumed with the same number of workers.
+
+    `cache_options` holds cache_dir, ttl_days, negative_ttl_days and
+    scrape_ttl_days for the workers' caches; None disables caching.
+
+    Workers write their own metrics files; this process merges them into
+    `metrics_file` (and `prometheus_file`) every `metrics_interval`
+    seconds and at the end. Each worker prints its own progress line; with
+    `verbose` their per-lead logs are concatenated into `log_file`.
+
+    With `previous_path`, every worker loads the previous output and
+    copies unchanged, fresh rows of its shard from it (see enrich_csv).
+    `lead_timeout` bounds every lead as in enrich_csv.
+
+    Returns merged summary dict.
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait
+    from multiprocessing import get_context
+
+    from rate_budget import RateBudgetManager
+
+    input_file = Path(input_path)
+    if not input_file.exists():
+        return {"error": f"Input file not found: {input_path}", "success": False}
+
+    ranges = shard_byte_ranges(input_file, workers)
+    if not ranges:
+        return {"error": "No leads found in input file", "success": False}
+
+    output_file = Path(output_path)
+    shard_outputs = [shard_path_for(output_file, i) for i in range(len(ranges))]
+    shard_metrics = [metrics_path_for(p) for p in shard_outputs]
+    metrics_file = Path(metrics_file) if metrics_file else metrics_path_for(output_file)
+    prometheus_file = Path(prometheus_file) if prometheus_file else None
+    metrics = RunMetrics()
+    print(f"Splitting {input_file.name} into {len(ranges)} shards...")
+
+    with RateBudgetManager() as manager:
+        serp_limiter = manager.AdaptiveRateLimiter(serp_rate)
+        scrape_limiter = manager.AdaptiveRateLimiter(scrape_rate)
+        jobs = [
+            {
+                "input_path": str(input_file),
+                "output_path": str(shard_output),
+                "byte_range": byte_range,
+                "min_confidence": min_confidence,
+                "verbose": verbose,
+                "concurrency": concurrency,
+                "resume": resume,
+                "probe_concurrency": probe_concurrency,
+                "cache_options": cache_options,
+                "serp_limiter": serp_limiter,
+                "scrape_limiter": scrape_limiter,
+                "output_format": output_format,
+                "metrics_file": str(shard_metrics_file),
+                "metrics_interval": metrics_interval,
+                "progress_interval": progress_interval,
+                "progress_label": f"shard {i}",
+                "previous_path": previous_path,
+                "max_age_days": max_age_days,
+                "lead_timeout": lead_timeout,
+            }
+            for i, (shard_output, shard_metrics_file, byte_range) in enumerate(
+                zip(shard_outputs, shard_metrics, ranges)
+            )
+        ]
+        # spawn: workers must not inherit the parent's manager threads
+        with ProcessPoolExecutor(len(jobs), mp_context=get_context("spawn")) as pool:
+            futures = [pool.submit(_enrich_shard, job) for job in jobs]
+            while wait(futures, timeout=metrics_interval).not_done:
+                merge_shard_metrics(metrics, shard_metrics).write(metrics_file, prometheus_file)
+            summaries = [future.result() for future in futures]
+
+    metrics = merge_shard_metrics(metrics, shard_metrics)
+    metrics.write(metrics_file, prometheus_file)
+
+    failed = [(i, s) for i, s in enumerate(summaries) if not s.get("success")]
+    if failed:
+        errors = "; ".join(f"shard {i}: {s.get('error', 'Unknown')}" for i, s in failed)
+        return {"error": f"Shards failed ({errors}). Rerun with --resume to continue.", "success": False}
+
+    review_file = review_path_for(output_file)
+    merge_output_files(output_format, shard_outputs, output_file)
+    review_written = merge_output_files(
+        output_format, [review_path_for(p) for p in shard_outputs], review_file
+    )
+    log_file = Path(log_file) if log_file else log_path_for(output_file)
+    shard_logs = [log_path_for(p) for p in shard_outputs]
+    if verbose:
+        merge_shards(shard_logs, log_file, header=False)
+    for shard_output, shard_metrics_file, shard_log in zip(shard_outputs, shard_metrics, shard_logs):
+        shard_log.unlink(missing_ok=True)
+        shard_output.unlink(missing_ok=True)
+        review_path_for(shard_output).unlink(missing_ok=True)
+        shard_metrics_file.unlink(missing_ok=True)
+
+    summary = {"success": True, **merge_shard_summaries(summaries), "workers": len(jobs)}
+    summary["output_file"] = str(output_file)
+    summary["metrics_file"] = str(metrics_file)
+
+    print(f"\nAll {len(jobs)} shards complete!")
+    print(f"  Total leads: {summary['total']}")
+    if resume:
+        print(f"  Resumed from journals: {summary['resumed']}")
+    if previous_path:
+        print(f"  Carried forward from previous output: {summary['carried_forward']}")
+    print(f"  High confidence: {summary['high_confidence']}")
+    print(f"  Needs review: {summary['review_needed']}")
+    if summary["rate_limited"]:
+        print(f"  Rate-limited responses (backed off): {summary['rate_limited']}")
+    if summary["circuit_opened"] or summary["requeued"]:
+        print(
+            f"  Bright Data outages: circuit opened {summary['circuit_opened']}x, "
+            f"leads requeued {summary['requeued']}x"
+        )
+    if metrics.summary_line():
+        print(f"  Network calls by stage: {metrics.summary_line()}")
+    print(f"  Output: {output_file}")
+    if review_written:
+        print(f"  Review file: {review_file}")
+    print(f"  Metrics: {metrics_file}")
+    if verbose:
+        print(f"  Per-lead details: {log_file}")
+
+    return summary
 
 
 def main():
@@ -1052,7 +2203,133 @@ def main():
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
-        help="Show detailed progress and debugging info"
+        help="Write per-lead details to a JSON-lines log (output_name.log.jsonl)"
+    )
+    parser.add_argument(
+        "--log",
+        metavar="PATH",
+        help="Per-lead details log for --verbose (default: output_name.log.jsonl)"
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=PROGRESS_INTERVAL,
+        metavar="SECONDS",
+        help=f"Print progress this often when not on a terminal (default: {PROGRESS_INTERVAL:g})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of leads to enrich at the same time (default: 1)"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="tsv",
+        help="Output file format: tab-delimited CSV, JSON lines or typed Parquet (default: tsv)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Split the input into N shards enriched by parallel processes (default: 1)"
+    )
+    parser.add_argument(
+        "--probe-concurrency",
+        type=int,
+        default=PROBE_CONCURRENCY,
+        metavar="N",
+        help=f"Email domains to probe in parallel before enrichment (default: {PROBE_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--serp-rate",
+        type=float,
+        default=DEFAULT_SERP_RATE,
+        metavar="RPS",
+        help=f"Starting SERP requests per second, adapted to rate limits (default: {DEFAULT_SERP_RATE:g})"
+    )
+    parser.add_argument(
+        "--scrape-rate",
+        type=float,
+        default=DEFAULT_SCRAPE_RATE,
+        metavar="RPS",
+        help=f"Starting scrape requests per second, adapted to rate limits (default: {DEFAULT_SCRAPE_RATE:g})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip leads already recorded in the output's journal from an interrupted run"
+    )
+    parser.add_argument(
+        "--previous",
+        metavar="PATH",
+        help="Earlier enriched output: copy enrichment of unchanged leads instead of enriching them again"
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=DEFAULT_MAX_AGE_DAYS,
+        metavar="DAYS",
+        help=f"Re-enrich --previous rows older than this (default: {DEFAULT_MAX_AGE_DAYS:g} days)"
+    )
+    parser.add_argument(
+        "--lead-timeout",
+        type=float,
+        default=DEFAULT_LEAD_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Time budget per lead; unfinished lookups are noted (default: {DEFAULT_LEAD_TIMEOUT:g}, 0 = no limit)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"SERP cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        metavar="DAYS",
+        help=f"Reuse cached SERP results younger than this (default: {DEFAULT_TTL_DAYS:g} days)"
+    )
+    parser.add_argument(
+        "--negative-cache-ttl",
+        type=float,
+        default=DEFAULT_NEGATIVE_TTL_DAYS,
+        metavar="DAYS",
+        help=f"Reuse cached LinkedIn lookups that found nothing for this long (default: {DEFAULT_NEGATIVE_TTL_DAYS:g} days)"
+    )
+    parser.add_argument(
+        "--scrape-cache-ttl",
+        type=float,
+        default=DEFAULT_SCRAPE_TTL_DAYS,
+        metavar="DAYS",
+        help=f"Reuse LinkedIn company page data younger than this (default: {DEFAULT_SCRAPE_TTL_DAYS:g} days)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Bright Data, ignoring the SERP and scrape caches"
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="Per-stage metrics JSON file (default: output_name.metrics.json)"
+    )
+    parser.add_argument(
+        "--prometheus",
+        metavar="PATH",
+        help="Also write per-stage metrics as a Prometheus textfile (e.g. for node_exporter)"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=METRICS_INTERVAL,
+        metavar="SECONDS",
+        help=f"Update the metrics files this often during the run (default: {METRICS_INTERVAL:g})"
     )
 
     args = parser.parse_args()
@@ -1073,10 +2350,99 @@ def main():
     if args.output_csv:
         output_path = args.output_csv
     else:
-        output_path = str(input_path.with_stem(input_path.stem + "_enriched"))
+        output_path = str(output_path_for(
+            input_path.with_stem(input_path.stem + "_enriched"), args.output_format
+        ))
+
+    try:
+        check_output_format(args.output_format)
+    except ImportError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.concurrency < 1 or args.workers < 1:
+        print("Error: --concurrency and --workers must be at least 1")
+        sys.exit(1)
+    if args.serp_rate <= 0 or args.scrape_rate <= 0:
+        print("Error: --serp-rate and --scrape-rate must be positive")
+        sys.exit(1)
+    if args.metrics_interval <= 0 or args.progress_interval <= 0:
+        print("Error: --metrics-interval and --progress-interval must be positive")
+        sys.exit(1)
+    if args.lead_timeout < 0:
+        print("Error: --lead-timeout must not be negative")
+        sys.exit(1)
+
+    if args.workers > 1:
+        cache_options = None if args.no_cache else {
+            "cache_dir": args.cache_dir,
+            "ttl_days": args.cache_ttl,
+            "negative_ttl_days": args.negative_cache_ttl,
+            "scrape_ttl_days": args.scrape_cache_ttl,
+        }
+        result = enrich_csv_sharded(
+            args.input_csv,
+            output_path,
+            args.workers,
+            args.min_confidence,
+            args.verbose,
+            concurrency=args.concurrency,
+            resume=args.resume,
+            serp_rate=args.serp_rate,
+            scrape_rate=args.scrape_rate,
+            probe_concurrency=max(1, args.probe_concurrency),
+            cache_options=cache_options,
+            output_format=args.output_format,
+            metrics_file=args.metrics,
+            prometheus_file=args.prometheus,
+            metrics_interval=args.metrics_interval,
+            log_file=args.log,
+            progress_interval=args.progress_interval,
+            previous_path=args.previous,
+            max_age_days=args.max_age,
+            lead_timeout=args.lead_timeout,
+        )
+        if not result.get("success"):
+            print(f"Error: {result.get('error')}")
+            sys.exit(1)
+        return
+
+    cache = None if args.no_cache else SerpCache(
+        args.cache_dir, args.cache_ttl, negative_ttl_days=args.negative_cache_ttl
+    )
+    scrape_cache = None if args.no_cache else ScrapeCache(args.cache_dir, args.scrape_cache_ttl)
 
     # Run enrichment
-    result = asyncio.run(enrich_csv(args.input_csv, output_path, args.min_confidence, args.verbose))
+    try:
+        result = asyncio.run(
+            enrich_csv(
+                args.input_csv,
+                output_path,
+                args.min_confidence,
+                args.verbose,
+                concurrency=args.concurrency,
+                cache=cache,
+                resume=args.resume,
+                serp_rate=args.serp_rate,
+                scrape_rate=args.scrape_rate,
+                probe_concurrency=max(1, args.probe_concurrency),
+                scrape_cache=scrape_cache,
+                output_format=args.output_format,
+                metrics_file=args.metrics,
+                prometheus_file=args.prometheus,
+                metrics_interval=args.metrics_interval,
+                log_file=args.log,
+                progress_interval=args.progress_interval,
+                previous_path=args.previous,
+                max_age_days=args.max_age,
+                lead_timeout=args.lead_timeout,
+            )
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+        if scrape_cache is not None:
+            scrape_cache.close()
 
     if not result.get("success"):
         print(f"Error: {result.get('error')}")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint journal for enrichment runs.
+
+Every completed lead is appended to a JSON-lines file next to the output,
+keyed by a hash of the input row. An interrupted run restarted with
+--resume reuses journaled rows instead of enriching them again. A run
+started without --resume moves an existing journal to "<journal>.bak"
+rather than truncating it, so a forgotten flag does not lose the
+checkpoint.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+
+def row_hash(lead: dict) -> str:
+    """
+    Hash the input columns of a lead.
+
+    Args:
+        lead: Input row as read from the CSV
+
+    Returns:
+        Hex digest that is stable across runs and column order
+    """
+    raw = json.dumps(lead, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def journal_path_for(output_file: Path) -> Path:
+    """Return the journal file path next to an output file."""
+    return output_file.with_name(output_file.stem + ".journal.jsonl")
+
+
+def backup_path_for(journal_file: Path) -> Path:
+    """Return where a journal is moved when a run starts without resume."""
+    return journal_file.with_name(journal_file.name + ".bak")
+
+
+class EnrichmentJournal:
+    """
+    JSON-lines journal of enriched rows, keyed by input row hash.
+
+    Only byte offsets are kept in memory; rows are read back from disk when
+    a resumed run needs them.
+
+    Example:
+        >>> journal = EnrichmentJournal(Path("out.journal.jsonl"), resume=True)
+        >>> key = row_hash(lead)
+        >>> if key in journal:
+        ...     enriched = journal.load(key)
+        ... else:
+        ...     journal.append(key, enriched)
+    """
+
+    def __init__(self, path: Path, resume: bool = False):
+        """
+        Args:
+            path: Journal file
+            resume: Keep and index an existing journal; otherwise a
+                non-empty one is moved to backup_path_for(path) (see
+                `backup`) and a new journal is started
+        """
+        self.path = Path(path)
+        self.backup: Optional[Path] = None
+        self._offsets: dict[str, int] = {}
+
+        if resume and self.path.exists():
+            self._index()
+            self._file = open(self.path, "ab")
+            return
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self.backup = backup_path_for(self.path)
+            self.path.replace(self.backup)
+        self._file = open(self.path, "wb")
+
+    def _index(self) -> None:
+        """Record the offset of every complete entry in an existing journal."""
+        with open(self.path, "rb") as f:
+            offset = 0
+            valid_end = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._offsets[entry["hash"]] = offset
+                    valid_end = offset + len(line)
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # Partial last line from an interrupted write
+                    pass
+                offset += len(line)
+
+        # Drop a torn trailing write so appends start on a clean line
+        if valid_end < offset:
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Read a journaled row back from disk.
+
+        Args:
+            key: Row hash from row_hash
+
+        Returns:
+            Enriched row dict, or None if not journaled
+        """
+        offset = self._offsets.get(key)
+        if offset is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())["row"]
+
+    def append(self, key: str, row: dict) -> None:
+        """
+        Append a completed row and flush it to disk.
+
+        Args:
+            key: Row hash from row_hash
+            row: Enriched row dict
+        """
+        line = json.dumps({"hash": key, "row": row}, ensure_ascii=False) + "\n"
+        data = line.encode("utf-8")
+        self._file.seek(0, 2)
+        self._offsets[key] = self._file.tell()
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
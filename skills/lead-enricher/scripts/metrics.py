@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Per-stage metrics for enrichment runs.
+
+Each enrichment strategy is a stage. Every time a lead runs a stage, the
+stage records its outcome and whether it was answered from a cache. For
+stages that made a network call it also records the call latency in a
+histogram:
+- success: the stage found what it looks for (a website, a LinkedIn page,
+  page data)
+- empty: the call worked but found nothing usable
+- failure: the call failed (API error, timeout)
+
+Metrics are written as JSON and, optionally, as a Prometheus textfile (for
+node_exporter's textfile collector). Both files are replaced atomically,
+so readers never see a half-written file.
+"""
+
+import json
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# Enrichment strategies, in the order they run for a lead
+STAGES = (
+    "direct_probe",
+    "email_search",
+    "company_search",
+    "linkedin_company",
+    "linkedin_scrape",
+    "linkedin_person",
+)
+
+SUCCESS = "success"
+EMPTY = "empty"
+FAILURE = "failure"
+OUTCOMES = (SUCCESS, EMPTY, FAILURE)
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+# Seconds between metrics file updates during a run
+METRICS_INTERVAL = 30.0
+
+PROMETHEUS_PREFIX = "lead_enricher"
+
+
+def metrics_path_for(output_file: Path) -> Path:
+    """Return the metrics file path next to an output file."""
+    return output_file.with_name(output_file.stem + ".metrics.json")
+
+
+def _bucket_label(bound: float) -> str:
+    return "+Inf" if bound == math.inf else f"{bound:g}"
+
+
+@dataclass
+class StageMetrics:
+    """Counters and latency histogram of one stage."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    outcomes: dict = field(default_factory=lambda: dict.fromkeys(OUTCOMES, 0))
+    latency_sum: float = 0.0
+    # Non-cumulative count per bucket in LATENCY_BUCKETS
+    buckets: list = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def observe(self, outcome: str, seconds: Optional[float], cached: bool) -> None:
+        self.outcomes[outcome] += 1
+        if cached:
+            self.cache_hits += 1
+            return
+        self.calls += 1
+        if seconds is not None:
+            self.latency_sum += seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    self.buckets[i] += 1
+                    break
+
+    def merge(self, other: "StageMetrics") -> None:
+        self.calls += other.calls
+        self.cache_hits += other.cache_hits
+        for outcome in OUTCOMES:
+            self.outcomes[outcome] += other.outcomes.get(outcome, 0)
+        self.latency_sum += other.latency_sum
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            **self.outcomes,
+            "latency_seconds": {
+                "count": sum(self.buckets),
+                "sum": round(self.latency_sum, 6),
+                "buckets": {
+                    _bucket_label(bound): count
+                    for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+                },
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StageMetrics":
+        latency = data.get("latency_seconds", {})
+        counts = latency.get("buckets", {})
+        return cls(
+            calls=data.get("calls", 0),
+            cache_hits=data.get("cache_hits", 0),
+            outcomes={outcome: data.get(outcome, 0) for outcome in OUTCOMES},
+            latency_sum=latency.get("sum", 0.0),
+            buckets=[counts.get(_bucket_label(bound), 0) for bound in LATENCY_BUCKETS],
+        )
+
+
+class RunMetrics:
+    """
+    Metrics of all stages of one enrichment run.
+
+    Example:
+        >>> metrics = RunMetrics()
+        >>> start = time.perf_counter()
+        >>> result = await search_company(name, country, session=session)
+        >>> metrics.record("company_search", SUCCESS, time.perf_counter() - start,
+        ...                cached=result.get("cached", False))
+        >>> metrics.write(Path("out.metrics.json"), Path("enrich.prom"))
+    """
+
+    def __init__(self):
+        self.stages = {stage: StageMetrics() for stage in STAGES}
+        self.leads_completed = 0
+        self.started = time.monotonic()
+
+    def record(
+        self,
+        stage: str,
+        outcome: str,
+        seconds: Optional[float] = None,
+        cached: bool = False,
+    ) -> None:
+        """
+        Record one run of a stage.
+
+        Args:
+            stage: One of STAGES
+            outcome: SUCCESS, EMPTY or FAILURE
+            seconds: Call latency (ignored for cache hits)
+            cached: True if answered from a cache without a network call
+        """
+        self.stages[stage].observe(outcome, seconds, cached)
+
+    def merge(self, data: dict) -> None:
+        """Add metrics from another run's to_dict() (e.g. a shard)."""
+        self.leads_completed += data.get("leads_completed", 0)
+        for stage, stage_data in data.get("stages", {}).items():
+            if stage in self.stages:
+                self.stages[stage].merge(StageMetrics.from_dict(stage_data))
+
+    def to_dict(self) -> dict:
+        return {
+            "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "elapsed_seconds": round(time.monotonic() - self.started, 3),
+            "leads_completed": self.leads_completed,
+            "stages": {stage: metrics.to_dict() for stage, metrics in self.stages.items()},
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        p = PROMETHEUS_PREFIX
+        lines = [
+            f"# HELP {p}_leads_completed_total Leads enriched in this run.",
+            f"# TYPE {p}_leads_completed_total counter",
+            f"{p}_leads_completed_total {self.leads_completed}",
+            f"# HELP {p}_stage_calls_total Network calls made by each enrichment stage.",
+            f"# TYPE {p}_stage_calls_total counter",
+        ]
+        lines += [f'{p}_stage_calls_total{{stage="{s}"}} {m.calls}' for s, m in self.stages.items()]
+        lines += [
+            f"# HELP {p}_stage_cache_hits_total Stage runs answered from a cache.",
+            f"# TYPE {p}_stage_cache_hits_total counter",
+        ]
+        lines += [
+            f'{p}_stage_cache_hits_total{{stage="{s}"}} {m.cache_hits}'
+            for s, m in self.stages.items()
+        ]
+        lines += [
+            f"# HELP {p}_stage_results_total Stage runs by outcome.",
+            f"# TYPE {p}_stage_results_total counter",
+        ]
+        for stage, metrics in self.stages.items():
+            lines += [
+                f'{p}_stage_results_total{{stage="{stage}",outcome="{outcome}"}} {count}'
+                for outcome, count in metrics.outcomes.items()
+            ]
+        lines += [
+            f"# HELP {p}_stage_latency_seconds Latency of stage network calls.",
+            f"# TYPE {p}_stage_latency_seconds histogram",
+        ]
+        for stage, metrics in self.stages.items():
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(
+                    f'{p}_stage_latency_seconds_bucket{{stage="{stage}",le="{_bucket_label(bound)}"}} {cumulative}'
+                )
+            lines.append(f'{p}_stage_latency_seconds_sum{{stage="{stage}"}} {metrics.latency_sum:.6f}')
+            lines.append(f'{p}_stage_latency_seconds_count{{stage="{stage}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_file: Optional[Path], prometheus_file: Optional[Path] = None) -> None:
+        """Write the JSON and/or Prometheus file, replacing any previous version."""
+        if json_file is not None:
+            _atomic_write(json_file, json.dumps(self.to_dict(), indent=2) + "\n")
+        if prometheus_file is not None:
+            _atomic_write(prometheus_file, self.to_prometheus())
+
+    def summary_line(self) -> str:
+        """Network calls per stage, e.g. "company_search 40, linkedin_scrape 12"."""
+        return ", ".join(f"{s} {m.calls}" for s, m in self.stages.items() if m.calls)
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def load_metrics(path: Path) -> Optional[dict]:
+    """Read a JSON metrics file; None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
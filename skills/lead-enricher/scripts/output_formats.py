@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Output writers for enriched leads: tab-delimited CSV, JSON lines, Parquet.
+
+All writers take rows one at a time as the enrichment stream produces them:
+- tsv: text columns, flushed after every row (the original format)
+- jsonl: one typed JSON object per line, flushed after every row so other
+  tools can tail the file during a run
+- parquet: typed columns, written in row groups as rows arrive
+  (requires pyarrow)
+
+Typed formats store website_confidence as a float and person_verified as
+a nullable boolean; all other columns are strings. employee_count keeps
+LinkedIn's text ("51-200", "10,001+"), and typed formats add its bounds
+as nullable integers in employee_count_min and employee_count_max.
+
+read_output_rows reads any of the formats back, e.g. last run's output
+for --previous.
+"""
+
+import csv
+import json
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sharding import merge_shards
+
+OUTPUT_FORMATS = ("tsv", "jsonl", "parquet")
+
+# Rows buffered per Parquet row group
+PARQUET_ROW_GROUP_SIZE = 1000
+
+FLOAT_COLUMNS = {"website_confidence"}
+BOOL_COLUMNS = {"person_verified"}
+
+# Text columns holding a range, with the integer bound columns typed
+# formats add after them
+RANGE_COLUMNS = {"employee_count": ("employee_count_min", "employee_count_max")}
+INT_COLUMNS = {bound for bounds in RANGE_COLUMNS.values() for bound in bounds}
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_range(value) -> tuple[Optional[int], Optional[int]]:
+    """Bounds of "51-200" (51, 200), "10,001+" (10001, None) or "1234" (1234, 1234)."""
+    text = str(value or "")
+    # "," and "." only appear as thousands separators in counts
+    numbers = re.findall(r"\d+", text.replace(",", "").replace(".", ""))
+    if not numbers:
+        return None, None
+    low = int(numbers[0])
+    if len(numbers) > 1:
+        return low, int(numbers[1])
+    return low, None if "+" in text else low
+
+
+def _to_bool(value) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    text = str(value or "").strip().lower()
+    if text in ("true", "1", "yes"):
+        return True
+    if text in ("false", "0", "no"):
+        return False
+    return None
+
+
+def typed_fieldnames(fieldnames: list[str]) -> list[str]:
+    """Columns of typed output: `fieldnames` with range bounds after their column."""
+    typed = []
+    for field in fieldnames:
+        if field in INT_COLUMNS:
+            continue
+        typed.append(field)
+        typed.extend(RANGE_COLUMNS.get(field, ()))
+    return typed
+
+
+def typed_row(row: dict, fieldnames: list[str]) -> dict:
+    """
+    Convert an enriched row to typed values, in typed_fieldnames order.
+
+    Empty or unparseable numbers become None; other columns are strings.
+    """
+    typed = {}
+    for field in fieldnames:
+        if field in INT_COLUMNS:
+            continue
+        value = row.get(field)
+        if field in FLOAT_COLUMNS:
+            typed[field] = _to_float(value)
+        elif field in BOOL_COLUMNS:
+            typed[field] = _to_bool(value)
+        else:
+            typed[field] = "" if value is None else str(value)
+        if field in RANGE_COLUMNS:
+            low, high = RANGE_COLUMNS[field]
+            typed[low], typed[high] = _to_range(value)
+    return typed
+
+
+def untyped_row(row: dict) -> dict:
+    """
+    Convert a row read back from any format to enrich_lead's value types.
+
+    website_confidence becomes a float (0.0 if empty); all other columns
+    become strings, with None as "" and booleans as "true"/"false". The
+    range bound columns of typed formats are left out.
+    """
+    plain = {}
+    for field, value in row.items():
+        if field in INT_COLUMNS:
+            continue
+        if field in FLOAT_COLUMNS:
+            plain[field] = _to_float(value) or 0.0
+        elif value is None:
+            plain[field] = ""
+        elif isinstance(value, bool):
+            plain[field] = "true" if value else "false"
+        else:
+            plain[field] = str(value)
+    return plain
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+
+class _OutputWriter(ABC):
+    """Base class: context manager writing enriched rows to `path`."""
+
+    extension = ""
+
+    def __init__(self, path: Path, fieldnames: list[str]):
+        self.path = Path(path)
+        self.fieldnames = fieldnames
+
+    @abstractmethod
+    def write(self, row: dict) -> None:
+        """Write one enriched row."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TsvWriter(_OutputWriter):
+    """Tab-delimited CSV with a header row, flushed after every row."""
+
+    extension = ".csv"
+
+    def __init__(self, path: Path, fieldnames: list[str]):
+        super().__init__(path, fieldnames)
+        self._file = open(self.path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, delimiter="\t")
+        self._writer.writeheader()
+
+    def write(self, row: dict) -> None:
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlWriter(_OutputWriter):
+    """One typed JSON object per line, flushed after every row."""
+
+    extension = ".jsonl"
+
+    def __init__(self, path: Path, fieldnames: list[str]):
+        super().__init__(path, fieldnames)
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, row: dict) -> None:
+        self._file.write(json.dumps(typed_row(row, self.fieldnames), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def parquet_schema(fieldnames: list[str]):
+    """Arrow schema for enriched rows with the given columns."""
+    pa, _ = _import_pyarrow()
+    fields = []
+    for field in typed_fieldnames(fieldnames):
+        if field in FLOAT_COLUMNS:
+            fields.append(pa.field(field, pa.float64()))
+        elif field in INT_COLUMNS:
+            fields.append(pa.field(field, pa.int64()))
+        elif field in BOOL_COLUMNS:
+            fields.append(pa.field(field, pa.bool_()))
+        else:
+            fields.append(pa.field(field, pa.string()))
+    return pa.schema(fields)
+
+
+class ParquetWriter(_OutputWriter):
+    """Typed Parquet file written one row group at a time."""
+
+    extension = ".parquet"
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: list[str],
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+    ):
+        super().__init__(path, fieldnames)
+        self._pa, pq = _import_pyarrow()
+        self.schema = parquet_schema(fieldnames)
+        self.row_group_size = row_group_size
+        self._rows: list[dict] = []
+        self._writer = pq.ParquetWriter(str(self.path), self.schema)
+
+    def write(self, row: dict) -> None:
+        self._rows.append(typed_row(row, self.fieldnames))
+        if len(self._rows) >= self.row_group_size:
+            self._flush_row_group()
+
+    def _flush_row_group(self) -> None:
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush_row_group()
+        self._writer.close()
+
+
+OUTPUT_WRITERS = {
+    "tsv": TsvWriter,
+    "jsonl": JsonlWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def check_output_format(output_format: str) -> None:
+    """Raise ValueError/ImportError early if a format cannot be written."""
+    if output_format not in OUTPUT_WRITERS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if output_format == "parquet":
+        _import_pyarrow()
+
+
+def output_path_for(path: Path, output_format: str) -> Path:
+    """Give an output path the extension of its format (TSV keeps its own)."""
+    path = Path(path)
+    if output_format == "tsv":
+        return path
+    return path.with_suffix(OUTPUT_WRITERS[output_format].extension)
+
+
+def read_output_rows(path: Path) -> Iterator[dict]:
+    """
+    Read an output file back as untyped rows (see untyped_row).
+
+    The format is taken from the extension: .jsonl, .parquet, otherwise
+    tab-delimited CSV.
+    """
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield untyped_row(json.loads(line))
+    elif path.suffix == ".parquet":
+        _, pq = _import_pyarrow()
+        for batch in pq.ParquetFile(str(path)).iter_batches():
+            for row in batch.to_pylist():
+                yield untyped_row(row)
+    else:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f, delimiter="\t"):
+                yield untyped_row(row)
+
+
+def merge_output_files(output_format: str, shard_files: list[Path], output_file: Path) -> bool:
+    """
+    Merge per-shard outputs of one format into `output_file`, in order.
+
+    Missing shard files are skipped; returns True if the output was written.
+    """
+    if output_format == "tsv":
+        return merge_shards(shard_files, output_file)
+    if output_format == "jsonl":
+        return merge_shards(shard_files, output_file, header=False)
+
+    existing = [Path(p) for p in shard_files if Path(p).exists()]
+    if not existing:
+        return False
+    _, pq = _import_pyarrow()
+    schema = pq.read_schema(str(existing[0]))
+    with pq.ParquetWriter(str(output_file), schema) as writer:
+        for shard_file in existing:
+            shard = pq.ParquetFile(str(shard_file))
+            for group in range(shard.num_row_groups):
+                writer.write_table(shard.read_row_group(group))
+    return True
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Carry enrichment forward from a previous run's output.
+
+Refreshed lead exports mostly repeat last week's leads. PreviousEnrichment
+indexes an earlier enriched file by the row hash of each lead's input
+columns (see journal.row_hash), so a new run can copy the prior enrichment
+of unchanged rows instead of enriching them again. Only new, changed and
+stale rows go through enrich_lead.
+
+A row is stale once its enriched_at timestamp is older than the maximum
+age. Files written before enriched_at existed use the file's modification
+time for every row. Rows whose notes record a failed lookup (search error,
+time budget ran out, endpoint unavailable) are never carried forward, so a
+rerun retries them.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from journal import row_hash
+from output_formats import read_output_rows
+
+# Column recording when a row's enrichment was looked up
+ENRICHED_AT = "enriched_at"
+
+# Prior enrichment older than this is looked up again
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+# Notes written by enrich_lead when a lookup failed rather than found nothing
+FAILED_NOTES = re.compile(
+    r"Search error:|Lead time budget \([^)]*\) ran out|endpoint unavailable", re.IGNORECASE
+)
+
+
+def enriched_at_now() -> str:
+    """Current time as an enriched_at value."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class PreviousEnrichment:
+    """
+    Fresh enrichment values of a previous output, keyed by input row hash.
+
+    Only the enrichment columns of fresh, successfully enriched rows are
+    kept in memory.
+
+    Example:
+        >>> previous = PreviousEnrichment(Path("last_week_enriched.csv"), ENRICHMENT_FIELDS)
+        >>> prior = previous.get(row_hash(lead))
+        >>> if prior is not None:
+        ...     enriched = {**lead, **prior}
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        enrichment_fields: list[str],
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ):
+        """
+        Args:
+            path: Enriched output of an earlier run (tsv, jsonl or parquet)
+            enrichment_fields: Columns added by enrichment, including enriched_at;
+                all other columns are input columns
+            max_age_days: Rows enriched longer ago than this are left out
+        """
+        self.path = Path(path)
+        self.fields = [f for f in enrichment_fields if f != ENRICHED_AT] + [ENRICHED_AT]
+        self.stale = 0
+        self.failed = 0
+        self._rows: dict[str, tuple] = {}
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        file_time = datetime.fromtimestamp(self.path.stat().st_mtime, timezone.utc)
+        for row in read_output_rows(self.path):
+            enriched_at = _parse_time(row.get(ENRICHED_AT, "")) or file_time
+            row[ENRICHED_AT] = enriched_at.isoformat(timespec="seconds")
+            failed = FAILED_NOTES.search(row.get("notes", ""))
+            values = tuple(row.pop(field, "") for field in self.fields)
+            if failed:
+                self.failed += 1
+                continue
+            if enriched_at < cutoff:
+                self.stale += 1
+                continue
+            self._rows[row_hash(row)] = values
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Enrichment columns of a fresh previous row.
+
+        Args:
+            key: Row hash of the lead's input columns
+
+        Returns:
+            Dict of enrichment columns, or None if the lead is new, changed,
+            stale or failed last time
+        """
+        values = self._rows.get(key)
+        if values is None:
+            return None
+        return dict(zip(self.fields, values))
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Run progress and per-lead logs for enrichment runs.
+
+ProgressReporter renders throughput, ETA and error rate: on a terminal as
+one line refreshed in place, otherwise (log files, worker processes) as
+a new line at a fixed interval. It is driven by a timer, not by lead
+completions, so its cost does not grow with the lead rate.
+
+LeadLog collects verbose per-lead details as JSON lines tagged with a
+lead id. Concurrent leads no longer interleave on the console, and the
+log can be filtered by lead afterwards:
+
+    jq 'select(.lead == "3f9a1c0e2b7d")' leads_enriched.log.jsonl
+
+Details are attached to the running lead through a context variable,
+which asyncio copies into every task a lead starts.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, TextIO
+
+# Seconds between progress lines when not writing to a terminal
+PROGRESS_INTERVAL = 10.0
+# Seconds between refreshes of the in-place progress line on a terminal
+REFRESH_INTERVAL = 0.5
+
+# Characters of the journal row hash used as lead id
+LEAD_ID_LENGTH = 12
+
+
+def log_path_for(output_file: Path) -> Path:
+    """Return the per-lead log path next to an output file."""
+    return output_file.with_name(output_file.stem + ".log.jsonl")
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. "42s", "17m05s" or "3h12m"."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+class ProgressReporter:
+    """
+    Progress line with leads/sec, API calls/sec, ETA and stage error rate.
+
+    Example:
+        >>> progress = ProgressReporter(total=1000, metrics=metrics)
+        >>> progress.advance()          # after each lead
+        >>> progress.report()           # from a timer, every progress.interval
+        >>> progress.finish()
+    """
+
+    def __init__(
+        self,
+        total: int,
+        metrics=None,
+        interval: float = PROGRESS_INTERVAL,
+        stream: Optional[TextIO] = None,
+        refresh: Optional[bool] = None,
+        label: str = "",
+    ):
+        """
+        Args:
+            total: Leads in the run
+            metrics: RunMetrics supplying API call and failure counts
+            interval: Seconds between lines when not refreshing in place
+            stream: Output stream (default: stdout)
+            refresh: Refresh one line in place (default: if stream is a terminal)
+            label: Prefix for every line, e.g. "shard 2"
+        """
+        self.total = total
+        self.metrics = metrics
+        self.stream = stream if stream is not None else sys.stdout
+        if refresh is None:
+            isatty = getattr(self.stream, "isatty", None)
+            refresh = bool(isatty and isatty())
+        self.refresh = refresh
+        self.interval = REFRESH_INTERVAL if refresh else interval
+        self.label = label
+        self.completed = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        self._line_length = 0
+
+    def advance(self, skipped: bool = False) -> None:
+        """Count one finished lead; `skipped` for leads copied from a journal."""
+        self.completed += 1
+        if skipped:
+            self.skipped += 1
+
+    def line(self) -> str:
+        """Current progress as one line of text."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        enriched = self.completed - self.skipped
+        lead_rate = enriched / elapsed
+        percent = self.completed / self.total if self.total else 1.0
+
+        parts = [f"{self.completed}/{self.total} leads ({percent:.0%})", f"{lead_rate:.1f} leads/s"]
+        if self.metrics is not None:
+            calls = failures = runs = 0
+            for stage in self.metrics.stages.values():
+                calls += stage.calls
+                failures += stage.outcomes["failure"]
+                runs += sum(stage.outcomes.values())
+            parts.append(f"{calls / elapsed:.1f} calls/s")
+            parts.append(f"errors {failures / runs if runs else 0.0:.1%}")
+
+        remaining = self.total - self.completed
+        if remaining <= 0:
+            parts.append(f"done in {format_duration(elapsed)}")
+        elif lead_rate > 0:
+            parts.append(f"ETA {format_duration(remaining / lead_rate)}")
+        else:
+            parts.append("ETA --")
+
+        prefix = f"[{self.label}] " if self.label else ""
+        return prefix + " | ".join(parts)
+
+    def report(self) -> None:
+        """Write the current progress line."""
+        line = self.line()
+        if self.refresh:
+            # Pad to overwrite a longer previous line
+            self.stream.write("\r" + line.ljust(self._line_length))
+            self._line_length = len(line)
+        else:
+            self.stream.write(f"  {line}\n")
+        self.stream.flush()
+
+    def finish(self) -> None:
+        """Write the final progress line and end the refreshing line."""
+        self.report()
+        if self.refresh:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+# (log, lead id) of the lead whose code is running, if a log is active
+_current_lead: ContextVar[Optional[tuple["LeadLog", str]]] = ContextVar(
+    "current_lead", default=None
+)
+
+
+class LeadLog:
+    """
+    JSON-lines log of per-lead events.
+
+    Every line has ts, lead (lead id), event and event fields. Writes are
+    buffered; call flush() from a timer and close() at the end of the run.
+
+    Example:
+        >>> log = LeadLog(Path("out.log.jsonl"))
+        >>> with log.lead("3f9a1c0e2b7d"):
+        ...     log_detail("company_search", "Searching by company name")
+        >>> log.close()
+    """
+
+    def __init__(self, path: Path, append: bool = False):
+        self.path = Path(path)
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, lead_id: str, event: str, **fields) -> None:
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "lead": lead_id,
+            "event": event,
+            **fields,
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    @contextmanager
+    def lead(self, lead_id: str):
+        """Send log_detail() calls made inside the block (and its tasks) to this lead."""
+        token = _current_lead.set((self, lead_id))
+        try:
+            yield
+        finally:
+            _current_lead.reset(token)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def log_detail(stage: str, message: str) -> None:
+    """
+    Record a verbose detail of the running lead.
+
+    Goes to the lead's LeadLog when one is active, otherwise to stdout
+    (e.g. when enriching a single lead interactively).
+
+    Args:
+        stage: Enrichment stage the detail belongs to (see metrics.STAGES)
+        message: Human-readable detail
+    """
+    current = _current_lead.get()
+    if current is None:
+        print(message)
+        return
+    log, lead_id = current
+    log.write(lead_id, "detail", stage=stage, message=message.strip())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Byte-range sharding of tab-delimited lead files for multi-process runs.
+
+The input is split into contiguous byte ranges that start and end on line
+boundaries; each worker reads only its range (the header is read from the
+top of the file). Shard outputs are concatenated in shard order, so the
+merged output has the same row order as the input.
+
+Shards assume one lead per line: quoted fields containing newlines are
+not split safely.
+"""
+
+import csv
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+ByteRange = tuple[int, int]
+
+
+def shard_byte_ranges(input_file: Path, shards: int) -> list[ByteRange]:
+    """
+    Split the data rows of a file into up to `shards` line-aligned byte ranges.
+
+    Args:
+        input_file: Tab-delimited file with a header line
+        shards: Number of shards wanted
+
+    Returns:
+        List of (start, end) offsets; empty ranges are dropped
+    """
+    with open(input_file, "rb") as f:
+        f.readline()
+        data_start = f.tell()
+        size = f.seek(0, 2)
+
+        boundaries = [data_start]
+        for i in range(1, shards):
+            target = data_start + (size - data_start) * i // shards
+            if target <= boundaries[-1]:
+                continue
+            # Move to the start of the next line
+            f.seek(target - 1)
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+        boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _shard_lines(f, end: int) -> Iterator[str]:
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            break
+        yield line.decode("utf-8")
+
+
+@contextmanager
+def open_leads(input_file: Path, byte_range: Optional[ByteRange] = None) -> Iterator[csv.DictReader]:
+    """
+    Open a tab-delimited leads file, or one byte range of it, as a DictReader.
+
+    Args:
+        input_file: Tab-delimited file with a header line
+        byte_range: (start, end) from shard_byte_ranges; None reads all rows
+    """
+    if byte_range is None:
+        with open(input_file, "r", encoding="utf-8", newline="") as f:
+            yield csv.DictReader(f, delimiter="\t")
+        return
+
+    with open(input_file, "rb") as f:
+        header = f.readline().decode("utf-8")
+        fieldnames = next(csv.reader([header], delimiter="\t"), [])
+        start, end = byte_range
+        f.seek(start)
+        yield csv.DictReader(_shard_lines(f, end), fieldnames=fieldnames, delimiter="\t")
+
+
+def shard_path_for(output_file: Path, index: int) -> Path:
+    """Return the output path of one shard, next to the final output."""
+    return output_file.with_name(f"{output_file.stem}.shard{index}{output_file.suffix}")
+
+
+def merge_shards(shard_files: list[Path], output_file: Path, header: bool = True) -> bool:
+    """
+    Concatenate shard outputs in order, keeping only the first header.
+
+    With header=False (e.g. JSON lines) files are concatenated as they are.
+
+    Missing shard files (e.g. shards without review rows) are skipped; if
+    none exist, no output is written.
+
+    Returns:
+        True if the output file was written
+    """
+    existing = [p for p in shard_files if p.exists()]
+    if not existing:
+        return False
+
+    with open(output_file, "wb") as out_f:
+        for i, shard_file in enumerate(existing):
+            with open(shard_file, "rb") as in_f:
+                if header:
+                    header_line = in_f.readline()
+                    if i == 0:
+                        out_f.write(header_line)
+                shutil.copyfileobj(in_f, out_f)
+    return True
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Offline end-to-end tests against the benchmark's mock Bright Data API."""
+
+import asyncio
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import enrich
+from bench_enrich import generate_leads, mock_probe_url, percentile, server_stats
+from mock_server import Latency, MockProfile, company_domain, running_mock_server, serp_results
+
+
+class TestMockResults:
+    def test_company_search_points_at_email_domain(self):
+        results = serp_results('"Benchfirma 000042 GmbH"')
+        assert results[0]["link"] == "https://www.benchfirma000042.de/"
+        assert company_domain("Benchfirma 000042 GmbH") == "benchfirma000042.de"
+
+    def test_linkedin_searches(self):
+        company = serp_results('"Acme GmbH" site:linkedin.com/company')
+        person = serp_results('"Anna Koch" "Acme GmbH" site:linkedin.com/in')
+        assert "linkedin.com/company/" in company[0]["link"]
+        assert "linkedin.com/in/" in person[0]["link"]
+
+    def test_latency_spec(self):
+        assert Latency.parse("300:0.5") == Latency(300, 0.5)
+        assert Latency.parse("0").sample(None) == 0.0
+
+
+class TestBenchHelpers:
+    def test_generate_leads(self, tmp_path):
+        path = tmp_path / "leads.csv"
+        generate_leads(path, 50)
+        with open(path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f, delimiter="\t"))
+        assert len(rows) == 50
+        assert {"full_name", "company_name", "work_phone_number", "work_email"} <= set(rows[0])
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
+
+
+class TestOfflineEnrichment:
+    @pytest.mark.asyncio
+    async def test_enrich_csv_against_mock_api(self, tmp_path, monkeypatch):
+        """enrich_csv runs end to end through the real SDK against the mock server."""
+        pytest.importorskip("brightdata")
+        from brightdata.core.engine import AsyncEngine
+        from brightdata_utils import BrightDataSession
+
+        monkeypatch.setattr(AsyncEngine, "DEFAULT_RATE_LIMIT", 0)
+
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        generate_leads(input_path, 20)
+
+        async with running_mock_server(MockProfile()) as base_url:
+            monkeypatch.setenv("BRIGHTDATA_BASE_URL", base_url)
+            monkeypatch.setattr(enrich, "DIRECT_PROBE_URL", mock_probe_url(base_url))
+            async with BrightDataSession("benchmark-api-key") as session:
+                summary = await enrich.enrich_csv(
+                    str(input_path), str(output_path), concurrency=5, session=session,
+                )
+            stats = await asyncio.to_thread(server_stats, base_url)
+
+        assert summary["success"]
+        assert summary["total"] == 20
+        # Direct probes went through enrich's own HTTP path to the mock
+        assert stats["probe"] > 0
+        with open(output_path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f, delimiter="\t"))
+        assert all(row["website"] for row in rows)
+        assert all("linkedin.com/company/" in row["company_linkedin"] for row in rows)
+        assert all(row["employee_count"] for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_workers_against_mock_api(self, tmp_path):
+        """--workers spawns shard processes sharing the parent's rate budget."""
+        pytest.importorskip("brightdata")
+        import asyncio
+        import os
+
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        names = [f"Benchfirma {i:06d} GmbH" for i in range(6)]
+        with open(input_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, delimiter="\t")
+            writer.writerow(["full_name", "company_name", "work_phone_number", "work_email"])
+            for i, name in enumerate(names):
+                # Generic email domains are never probed directly
+                writer.writerow([f"Anna Koch{i}", name, "", f"anna.koch{i}@gmail.com"])
+
+        async with running_mock_server(MockProfile()) as base_url:
+            env = {
+                **os.environ,
+                "HOME": str(tmp_path),
+                "BRIGHTDATA_BASE_URL": base_url,
+                "BRIGHTDATA_SERP_API_KEY": "benchmark-api-key",
+            }
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, str(Path(enrich.__file__)), str(input_path), str(output_path),
+                "--workers", "2", "--no-cache",
+                env=env, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            )
+            output, _ = await asyncio.wait_for(process.communicate(), 120)
+
+        assert process.returncode == 0, output.decode()
+        assert "All 2 shards complete!" in output.decode()
+        with open(output_path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f, delimiter="\t"))
+        assert [row["company_name"] for row in rows] == names
+        assert all(row["website"] for row in rows)
+        assert all("linkedin.com/company/" in row["company_linkedin"] for row in rows)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Unit tests for deadline.py."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from deadline import Deadline
+
+
+class TestDeadline:
+    def test_unlimited(self):
+        deadline = Deadline()
+
+        assert deadline.remaining() is None
+        assert not deadline.expired()
+        assert deadline.cap(5.0) == 5.0
+
+    def test_expired(self):
+        deadline = Deadline(0)
+
+        assert deadline.remaining() == 0.0
+        assert deadline.expired()
+        assert deadline.cap(5.0) == 0.0
+
+    def test_note_lists_missed_stages_once(self):
+        deadline = Deadline(60)
+        assert deadline.note() == ""
+
+        deadline.miss("company_search")
+        deadline.miss("company_search")
+
+        assert deadline.missed == ["company_search"]
+        assert deadline.note() == "Lead time budget (60s) ran out: company_search incomplete."
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Unit tests for the domain suffix index."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domain_index import DomainSuffixIndex, host_labels, load_domain_config, public_suffix_depth
+
+
+class TestHostLabels:
+    def test_plain_domain(self):
+        assert host_labels("Mail.GMX.de") == ["mail", "gmx", "de"]
+
+    def test_url(self):
+        assert host_labels("https://www.linkedin.com/company/x") == ["www", "linkedin", "com"]
+
+    def test_url_without_scheme_and_port(self):
+        assert host_labels("acme.de:8080/about") == ["acme", "de"]
+
+    def test_empty(self):
+        assert host_labels("") == []
+
+
+class TestDomainSuffixIndex:
+    def test_exact_and_subdomain(self):
+        index = DomainSuffixIndex(["gmx.de"])
+        assert "gmx.de" in index
+        assert "mail.gmx.de" in index
+
+    def test_label_boundary(self):
+        index = DomainSuffixIndex(["linkedin.com"])
+        assert "notlinkedin.com" not in index
+        assert "https://notlinkedin.com.example/" not in index
+        assert "https://acme.de/linkedin.com" not in index
+
+    def test_url_lookup(self):
+        index = DomainSuffixIndex(["linkedin.com"])
+        assert "https://de.linkedin.com/company/reha360" in index
+
+    def test_wildcard_public_suffix(self):
+        index = DomainSuffixIndex(["yahoo.*"])
+        assert "yahoo.de" in index
+        assert "yahoo.co.uk" in index
+        assert "mail.yahoo.co.jp" in index
+        assert "yahoo.acme.de" not in index
+        assert "co.uk" not in index
+
+    def test_wildcard_limited_to_listed_suffixes(self):
+        index = DomainSuffixIndex(["bosch.*"])
+        assert "bosch.de" in index
+        assert "bosch.xyz" not in index
+        assert "bosch.online" not in index
+        assert "bosch.xyz" in DomainSuffixIndex(["bosch.*"], wildcard_suffixes=["xyz"])
+
+
+class TestPublicSuffix:
+    def test_single_label(self):
+        assert public_suffix_depth(["acme", "de"]) == 1
+
+    def test_multi_label(self):
+        assert public_suffix_depth(["shop", "acme", "co", "uk"]) == 2
+
+    def test_registrable_domains_are_not_suffixes(self):
+        pytest.importorskip("tldextract")
+        # Listed only in the PSL's private section, or not at all
+        assert public_suffix_depth(["acme", "au", "com"]) == 1
+        assert public_suffix_depth(["acme", "online", "de"]) == 1
+        assert public_suffix_depth(["acme", "com", "au"]) == 2
+
+
+class TestLoadDomainConfig:
+    def test_missing_file(self, tmp_path):
+        config = load_domain_config(tmp_path / "missing.json")
+        assert config == {"generic_email_domains": [], "skip_website_domains": []}
+
+    def test_extra_domains(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "api_key": "x",
+            "generic_email_domains": ["posteo.de", 42],
+            "skip_website_domains": "not-a-list",
+        }))
+        config = load_domain_config(config_file)
+        assert config["generic_email_domains"] == ["posteo.de"]
+        assert config["skip_website_domains"] == []
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Unit tests for lead enrichment functions."""
 
+import asyncio
+import csv
 import pytest
 import sys
 from pathlib import Path
@@ -8,7 +10,12 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import enrich
+from brightdata_utils import timed_out
+from serp_cache import ScrapeCache
+from sharding import merge_shards
 from enrich import (
+    enrich_csv,
     extract_domain,
     extract_email_domain,
     is_generic_email_domain,
@@ -52,6 +59,39 @@ class TestIsGenericEmailDomain:
     def test_german_isp(self):
         assert is_generic_email_domain("web.de") is True
 
+    def test_subdomain_of_isp(self):
+        assert is_generic_email_domain("mail.gmx.de") is True
+
+    def test_regional_variant(self):
+        assert is_generic_email_domain("yahoo.co.uk") is True
+        assert is_generic_email_domain("hotmail.fr") is True
+
+    def test_label_boundary(self):
+        assert is_generic_email_domain("notgmail.com") is False
+
+
+class TestDetectCountry:
+    def test_phone_calling_code(self):
+        assert enrich.detect_country({"work_phone_number": "+46 8 123 456", "work_email": ""}) == "SE"
+
+    def test_email_cctld(self):
+        assert enrich.detect_country({"work_phone_number": "", "work_email": "info@acme.co.uk"}) == "GB"
+
+    def test_phone_before_email(self):
+        lead = {"work_phone_number": "+43 1 234 5678", "work_email": "info@acme.de"}
+        assert enrich.detect_country(lead) == "AT"
+
+    def test_default(self):
+        assert enrich.detect_country({"work_phone_number": "", "work_email": "a@gmail.com"}) == "DE"
+
+    def test_nanp_national_number_falls_back_to_email(self):
+        lead = {"work_phone_number": "(416) 555-1234", "work_email": "info@acme.ca"}
+        assert enrich.detect_country(lead) == "CA"
+
+    def test_nanp_national_number_without_cctld(self):
+        lead = {"work_phone_number": "(415) 555-1234", "work_email": "info@acme.com"}
+        assert enrich.detect_country(lead) == enrich.DEFAULT_COUNTRY
+
 
 class TestNormalizePhone:
     def test_with_country_code(self):
@@ -139,6 +179,1098 @@ class TestScoreWebsiteMatch:
         assert score >= 0.15  # Phone bonus
 
 
+class TestBatchedMatching:
+    """Batched scoring agrees with per-candidate scoring."""
+
+    LEAD = {"company_name": "Reha360 GmbH", "work_email": "office@reha360.de", "work_phone_number": "+49-123-456"}
+    RESULTS = [
+        {"url": "https://reha360.de", "title": "Reha360 GmbH - Physiotherapie", "snippet": "Tel 49123456"},
+        {"url": "https://other.de", "title": "Sankom Patent Socks", "snippet": ""},
+        {"url": "https://www.reha360.de/kontakt", "title": "Kontakt", "snippet": ""},
+    ]
+
+    def test_lead_features_drop_generic_domain(self):
+        features = enrich.LeadFeatures.from_lead({"company_name": "Test", "work_email": "a@gmail.com"})
+        assert features.email_domain == ""
+        assert features.phone_digits == ""
+
+    def test_batch_matches_single_scores(self):
+        features = enrich.LeadFeatures.from_lead(self.LEAD)
+        batched = enrich.score_website_matches(features, self.RESULTS)
+        single = [score_website_match(self.LEAD, result) for result in self.RESULTS]
+        assert batched == pytest.approx(single)
+        assert batched[0] > batched[2] > batched[1]
+
+    def test_similarity_matrix_shape(self):
+        queries = [enrich.preprocess_name(n) for n in ["Reha360", "Acme"]]
+        choices = [enrich.preprocess_name(n) for n in ["Reha360", "ACME", "Other"]]
+        matrix = enrich.similarity_matrix(queries, choices)
+        assert len(matrix) == 2 and all(len(row) == 3 for row in matrix)
+        assert matrix[0][0] == pytest.approx(1.0)
+        assert matrix[1][1] == pytest.approx(1.0)
+
+    def test_find_best_website_skips_social(self):
+        results = [{"url": "https://linkedin.com/company/reha360", "title": "Reha360", "snippet": ""}] + self.RESULTS
+        best_url, confidence, candidates = enrich.find_best_website(self.LEAD, results)
+        assert best_url == "https://reha360.de"
+        assert len(candidates) == 3
+
+    def test_first_valid_linkedin_result(self):
+        results = [
+            {"url": "https://linkedin.com/company/sankom", "title": "Sankom Patent Socks"},
+            {"url": "https://linkedin.com/company/reha-360", "title": "Unrelated"},
+        ]
+        match = enrich.first_valid_linkedin_result("Reha360", results)
+        assert match["url"] == "https://linkedin.com/company/reha-360"
+        assert enrich.first_valid_linkedin_result("Reha360", results[:1]) is None
+
+
+class FakeSession:
+    """Stand-in for BrightDataSession that records every call."""
+
+    def __init__(self, search_results=None, scrape_html="", delay=0.0):
+        self.search_results = search_results or {}
+        self.delay = delay
+        self.scrape_html = scrape_html
+        self.cache = None
+        self.serp_limiter = None
+        self.scrape_limiter = None
+        self.scrape_cache = None
+        self.serp_breaker = None
+        self.scrape_breaker = None
+        self.searches = []
+        self.miss_predicates = {}
+        self.scrapes = []
+
+    async def wait(self, timeout):
+        """Sleep for the call delay; False if `timeout` ran out first."""
+        try:
+            await asyncio.wait_for(asyncio.sleep(self.delay), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def search(self, query, location, language="en", num_results=10, is_miss=None, timeout=None):
+        self.searches.append(query)
+        self.miss_predicates[query] = is_miss
+        if not await self.wait(timeout):
+            return timed_out(timeout, query=query)
+        return {"success": True, "query": query, "results": self.search_results.get(query, [])}
+
+    async def scrape(self, url, timeout=None):
+        self.scrapes.append(url)
+        if not await self.wait(timeout):
+            return timed_out(timeout, url=url)
+        return {"success": True, "url": url, "data": self.scrape_html}
+
+
+def write_leads(path, names):
+    """Write a tab-delimited leads file with the given company names."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=["full_name", "company_name", "work_phone_number", "work_email"],
+            delimiter="\t",
+        )
+        writer.writeheader()
+        for name in names:
+            writer.writerow({
+                "full_name": f"Contact {name}",
+                "company_name": name,
+                "work_phone_number": "",
+                "work_email": f"info@{name.lower()}.de",
+            })
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8") as f:
+        return list(csv.DictReader(f, delimiter="\t"))
+
+
+class TestEnrichCsv:
+    """Tests for enrich_csv with mocked enrich_lead."""
+
+    @pytest.fixture(autouse=True)
+    def no_probing(self, monkeypatch):
+        async def fake_probe_domains(domains, concurrency=50, timeout=5.0, metrics=None):
+            return {domain: None for domain in domains}
+
+        monkeypatch.setattr(enrich, "probe_domains", fake_probe_domains)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_output_keeps_input_order(self, tmp_path, monkeypatch):
+        """Leads finishing out of order are still written in input order."""
+        names = [f"Company{i}" for i in range(8)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later leads finish first
+            index = names.index(lead["company_name"])
+            await asyncio.sleep(0.01 * (len(names) - index))
+            in_flight -= 1
+            confidence = 0.9 if index % 2 == 0 else 0.6
+            return {**lead, "website": "https://example.com", "website_confidence": confidence}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, names)
+
+        summary = await enrich_csv(
+            str(input_path), str(output_path), concurrency=3, session=FakeSession()
+        )
+
+        assert summary["success"] is True
+        assert summary["total"] == 8
+        assert summary["high_confidence"] == 4
+        assert summary["review_needed"] == 4
+        assert max_in_flight == 3
+        assert [row["company_name"] for row in read_rows(output_path)] == names
+
+    @pytest.mark.asyncio
+    async def test_rows_are_flushed_as_they_complete(self, tmp_path, monkeypatch):
+        """A crash mid-run keeps every row finished before it."""
+        names = [f"Company{i}" for i in range(6)]
+
+        async def failing_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            if lead["company_name"] == "Company4":
+                raise RuntimeError("connection lost")
+            return {**lead, "website": "https://example.com", "website_confidence": 0.9}
+
+        monkeypatch.setattr(enrich, "enrich_lead", failing_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, names)
+
+        with pytest.raises(RuntimeError):
+            await enrich_csv(str(input_path), str(output_path), session=FakeSession())
+
+        assert [row["company_name"] for row in read_rows(output_path)] == names[:4]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_journaled_leads(self, tmp_path, monkeypatch):
+        """A resumed run only enriches leads missing from the journal."""
+        names = [f"Company{i}" for i in range(6)]
+        calls = []
+        fail_on = {"Company4"}
+
+        async def flaky_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            if lead["company_name"] in fail_on:
+                raise RuntimeError("connection lost")
+            calls.append(lead["company_name"])
+            return {**lead, "website": "https://example.com", "website_confidence": 0.9}
+
+        monkeypatch.setattr(enrich, "enrich_lead", flaky_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, names)
+
+        with pytest.raises(RuntimeError):
+            await enrich_csv(str(input_path), str(output_path), session=FakeSession())
+
+        fail_on.clear()
+        calls.clear()
+        summary = await enrich_csv(
+            str(input_path), str(output_path), session=FakeSession(), resume=True
+        )
+
+        # Leads finished before the crash (possibly Company5 too) are not redone
+        assert calls[0] == "Company4"
+        assert set(calls) <= {"Company4", "Company5"}
+        assert summary["resumed"] == 6 - len(calls)
+        assert summary["high_confidence"] == 6
+        assert [row["company_name"] for row in read_rows(output_path)] == names
+
+    @pytest.mark.asyncio
+    async def test_review_file_written_in_same_pass(self, tmp_path, monkeypatch):
+        """Medium-confidence rows with a website go to the review file."""
+        names = ["Alpha", "Beta", "Gamma"]
+        confidences = {"Alpha": 0.9, "Beta": 0.6, "Gamma": 0.0}
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            confidence = confidences[lead["company_name"]]
+            website = "https://example.com" if confidence else ""
+            return {**lead, "website": website, "website_confidence": confidence}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, names)
+
+        await enrich_csv(str(input_path), str(output_path), session=FakeSession())
+
+        review_rows = read_rows(tmp_path / "leads_enriched_review_needed.csv")
+        assert [row["company_name"] for row in review_rows] == ["Beta"]
+        assert list(read_rows(output_path)[0].keys())[-len(enrich.ENRICHMENT_FIELDS):] == enrich.ENRICHMENT_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_previous_output_carried_forward(self, tmp_path, monkeypatch):
+        """Only new, changed and stale leads are enriched again."""
+        calls = []
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            calls.append(lead["company_name"])
+            return {**lead, "website": f"https://{lead['company_name'].lower()}.de", "website_confidence": 0.9}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        last_week = tmp_path / "week1.csv"
+        write_leads(last_week, ["Alpha", "Beta", "Gamma"])
+        last_output = tmp_path / "week1_enriched.csv"
+        await enrich_csv(str(last_week), str(last_output), session=FakeSession())
+
+        # Gamma's enrichment is older than --max-age
+        rows = read_rows(last_output)
+        rows[2]["enriched_at"] = "2020-01-01T00:00:00+00:00"
+        with open(last_output, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]), delimiter="\t")
+            writer.writeheader()
+            writer.writerows(rows)
+
+        calls.clear()
+        this_week = tmp_path / "week2.csv"
+        write_leads(this_week, ["Alpha", "Beta", "Gamma", "Delta"])
+        with open(this_week, encoding="utf-8") as f:
+            text = f.read()
+        # Beta changed its email address
+        this_week.write_text(text.replace("info@beta.de", "sales@beta.de"), encoding="utf-8")
+        output_path = tmp_path / "week2_enriched.csv"
+
+        summary = await enrich_csv(
+            str(this_week), str(output_path), session=FakeSession(),
+            previous_path=str(last_output), max_age_days=30,
+        )
+
+        assert sorted(calls) == ["Beta", "Delta", "Gamma"]
+        assert summary["carried_forward"] == 1
+        output = read_rows(output_path)
+        assert [row["company_name"] for row in output] == ["Alpha", "Beta", "Gamma", "Delta"]
+        assert output[0]["website"] == "https://alpha.de"
+        assert output[0]["enriched_at"] == rows[0]["enriched_at"]
+        assert output[2]["enriched_at"] > "2020-01-01"
+
+    @pytest.mark.asyncio
+    async def test_previous_failures_enriched_again(self, tmp_path, monkeypatch):
+        calls = []
+        outage = True
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            calls.append(lead["company_name"])
+            if outage and lead["company_name"] == "Alpha":
+                return {**lead, "website": "", "website_confidence": 0.0,
+                        "notes": "Search error: HTTP 503: Service Unavailable"}
+            return {**lead, "website": f"https://{lead['company_name'].lower()}.de", "website_confidence": 0.9}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        write_leads(input_path, ["Alpha", "Beta"])
+        last_output = tmp_path / "last_enriched.csv"
+        await enrich_csv(str(input_path), str(last_output), session=FakeSession())
+
+        calls.clear()
+        outage = False
+        output_path = tmp_path / "leads_enriched.csv"
+        summary = await enrich_csv(
+            str(input_path), str(output_path), session=FakeSession(), previous_path=str(last_output)
+        )
+
+        assert calls == ["Alpha"]
+        assert summary["carried_forward"] == 1
+        assert read_rows(output_path)[0]["website"] == "https://alpha.de"
+
+    @pytest.mark.asyncio
+    async def test_verbose_details_go_to_lead_log(self, tmp_path, monkeypatch, capsys):
+        """Verbose details are tagged per lead in a JSON-lines log, not printed."""
+        import json
+        from progress import log_detail
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            await asyncio.sleep(0)
+            log_detail("company_search", f"  [Strategy 3] Searching: {lead['company_name']}")
+            return {**lead, "website": "https://example.com", "website_confidence": 0.9}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, ["Alpha", "Beta", "Gamma"])
+
+        await enrich_csv(str(input_path), str(output_path), verbose=True, session=FakeSession())
+
+        assert "[Strategy 3]" not in capsys.readouterr().out
+        records = [
+            json.loads(line)
+            for line in (tmp_path / "leads_enriched.log.jsonl").read_text().splitlines()
+        ]
+        by_lead = {}
+        for record in records:
+            by_lead.setdefault(record["lead"], []).append(record)
+        assert len(by_lead) == 3
+        for events in by_lead.values():
+            assert [e["event"] for e in events] == ["start", "detail", "done"]
+            assert events[0]["company"] in events[1]["message"]
+
+    @pytest.mark.asyncio
+    async def test_missing_input_file(self, tmp_path):
+        summary = await enrich_csv(str(tmp_path / "missing.csv"), str(tmp_path / "out.csv"))
+        assert summary["success"] is False
+
+
+    @pytest.mark.asyncio
+    async def test_each_lead_gets_its_own_deadline(self, tmp_path, monkeypatch):
+        deadlines = []
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, deadline=None, **kwargs):
+            deadlines.append(deadline)
+            return {**lead, "website": "", "website_confidence": 0.0, "notes": ""}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        write_leads(input_path, ["Company0", "Company1"])
+
+        await enrich_csv(str(input_path), str(tmp_path / "a.csv"), session=FakeSession(), lead_timeout=30)
+        await enrich_csv(str(input_path), str(tmp_path / "b.csv"), session=FakeSession(), lead_timeout=0)
+
+        assert [d.seconds for d in deadlines] == [30, 30, None, None]
+        assert deadlines[0] is not deadlines[1]
+
+
+class TestShardedEnrichment:
+    """Shards enriched separately and merged match a single-process run."""
+
+    @pytest.fixture(autouse=True)
+    def no_probing(self, monkeypatch):
+        async def fake_probe_domains(domains, concurrency=50, timeout=5.0, metrics=None):
+            return {domain: None for domain in domains}
+
+        monkeypatch.setattr(enrich, "probe_domains", fake_probe_domains)
+
+    @pytest.mark.asyncio
+    async def test_merged_shards_match_single_run(self, tmp_path, monkeypatch):
+        names = [f"Company{i}" for i in range(11)]
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            index = names.index(lead["company_name"])
+            confidence = [0.9, 0.6, 0.2][index % 3]
+            return {**lead, "website": "https://example.com", "website_confidence": confidence}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        write_leads(input_path, names)
+
+        single = tmp_path / "single.csv"
+        await enrich_csv(str(input_path), str(single), session=FakeSession())
+
+        sharded = tmp_path / "sharded.csv"
+        shard_outputs = []
+        summaries = []
+        for i, byte_range in enumerate(enrich.shard_byte_ranges(input_path, 3)):
+            shard_output = enrich.shard_path_for(sharded, i)
+            shard_outputs.append(shard_output)
+            summaries.append(await enrich_csv(
+                str(input_path), str(shard_output), session=FakeSession(), byte_range=byte_range
+            ))
+        merge_shards(shard_outputs, sharded)
+        merge_shards([enrich.review_path_for(p) for p in shard_outputs], enrich.review_path_for(sharded))
+
+        assert sharded.read_text() == single.read_text()
+        assert enrich.review_path_for(sharded).read_text() == enrich.review_path_for(single).read_text()
+        merged = enrich.merge_shard_summaries(summaries)
+        assert merged["total"] == 11
+        assert merged["high_confidence"] == 4
+        assert merged["review_needed"] == 4
+
+    def test_merge_summaries_recomputes_hit_rate(self):
+        merged = enrich.merge_shard_summaries([
+            {"total": 2, "cache": {"hits": 1, "negative_hits": 0, "misses": 3, "hit_rate": 0.25}},
+            {"total": 3, "cache": {"hits": 3, "negative_hits": 1, "misses": 1, "hit_rate": 0.75}},
+        ])
+        assert merged["total"] == 5
+        assert merged["cache"] == {"hits": 4, "negative_hits": 1, "misses": 4, "hit_rate": 0.5}
+
+    def test_missing_input(self, tmp_path):
+        result = enrich.enrich_csv_sharded(str(tmp_path / "missing.csv"), str(tmp_path / "out.csv"), 2)
+        assert result["success"] is False
+
+
+class TestOutputFormat:
+    """enrich_csv writes JSON lines when asked."""
+
+    @pytest.fixture(autouse=True)
+    def no_probing(self, monkeypatch):
+        async def fake_probe_domains(domains, concurrency=50, timeout=5.0, metrics=None):
+            return {domain: None for domain in domains}
+
+        monkeypatch.setattr(enrich, "probe_domains", fake_probe_domains)
+
+    @pytest.mark.asyncio
+    async def test_jsonl_output_and_review(self, tmp_path, monkeypatch):
+        import json
+
+        names = ["Company0", "Company1", "Company2"]
+
+        async def fake_enrich_lead(lead, min_confidence=0.8, verbose=False, **kwargs):
+            confidence = 0.9 if lead["company_name"] != "Company1" else 0.6
+            return {**lead, "website": "https://example.com", "website_confidence": confidence,
+                    "employee_count": "42"}
+
+        monkeypatch.setattr(enrich, "enrich_lead", fake_enrich_lead)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.jsonl"
+        write_leads(input_path, names)
+
+        await enrich_csv(str(input_path), str(output_path), session=FakeSession(), output_format="jsonl")
+
+        rows = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert [r["company_name"] for r in rows] == names
+        assert rows[0]["website_confidence"] == 0.9
+        assert rows[0]["employee_count"] == "42"
+        assert rows[0]["employee_count_min"] == 42
+        review = enrich.review_path_for(output_path)
+        assert [json.loads(l)["company_name"] for l in review.read_text().splitlines()] == ["Company1"]
+
+
+class TestSharedSession:
+    """enrich_lead routes every SERP and scrape call through one session."""
+
+    @pytest.mark.asyncio
+    async def test_all_calls_use_injected_session(self, monkeypatch):
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        session = FakeSession(
+            search_results={
+                '"Reha360" site:linkedin.com/company': [
+                    {"title": "Reha360 | LinkedIn", "url": "https://linkedin.com/company/reha360", "snippet": ""},
+                ],
+            },
+            scrape_html='<p>1,234 followers on LinkedIn</p>',
+        )
+        lead = {
+            "full_name": "Sven Haubert",
+            "company_name": "Reha360",
+            "work_phone_number": "",
+            "work_email": "office@reha360.de",
+        }
+
+        result = await enrich.enrich_lead(lead, session=session)
+
+        assert sorted(session.searches) == sorted([
+            '"office@reha360.de"',
+            '"Reha360"',
+            '"Reha360" site:linkedin.com/company',
+            '"Sven Haubert" "Reha360" site:linkedin.com/in',
+        ])
+        assert session.scrapes == ["https://www.linkedin.com/company/reha360"]
+        assert result["company_linkedin"] == "https://linkedin.com/company/reha360"
+
+
+class TestStageMetrics:
+    """Every strategy a lead runs is recorded per stage."""
+
+    @pytest.mark.asyncio
+    async def test_stages_recorded(self, monkeypatch):
+        from metrics import RunMetrics
+
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        session = FakeSession(
+            search_results={
+                '"Reha360" site:linkedin.com/company': [
+                    {"title": "Reha360 | LinkedIn", "url": "https://linkedin.com/company/reha360", "snippet": ""},
+                ],
+            },
+            scrape_html='<p>1,234 followers on LinkedIn</p>',
+        )
+        lead = {"full_name": "Sven Haubert", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+        metrics = RunMetrics()
+
+        await enrich.enrich_lead(lead, session=session, metrics=metrics)
+
+        stages = metrics.to_dict()["stages"]
+        assert stages["direct_probe"]["empty"] == 1
+        assert stages["email_search"]["empty"] == 1
+        assert stages["company_search"]["empty"] == 1
+        assert stages["linkedin_company"]["success"] == 1
+        # Page scraped, but no employee count or industry on it
+        assert stages["linkedin_scrape"]["empty"] == 1
+        assert stages["linkedin_person"]["empty"] == 1
+        assert all(stage["calls"] == 1 for stage in stages.values())
+
+    @pytest.mark.asyncio
+    async def test_cached_search_counts_as_cache_hit(self):
+        from metrics import RunMetrics
+
+        class CachedSession(FakeSession):
+            async def search(self, *args, **kwargs):
+                return {**await super().search(*args, **kwargs), "cached": True}
+
+        metrics = RunMetrics()
+        await enrich.find_person_linkedin("Sven Haubert", "Reha360", "DE", session=CachedSession(), metrics=metrics)
+
+        stage = metrics.to_dict()["stages"]["linkedin_person"]
+        assert (stage["calls"], stage["cache_hits"], stage["empty"]) == (0, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_enrich_csv_writes_metrics(self, tmp_path, monkeypatch):
+        import json
+
+        async def fake_probe_domains(domains, concurrency=50, timeout=5.0, metrics=None):
+            return {domain: None for domain in domains}
+
+        monkeypatch.setattr(enrich, "probe_domains", fake_probe_domains)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        prom_path = tmp_path / "enrich.prom"
+        write_leads(input_path, ["Company0", "Company1"])
+
+        summary = await enrich_csv(
+            str(input_path), str(output_path), session=FakeSession(), prometheus_file=str(prom_path)
+        )
+
+        metrics_path = tmp_path / "leads_enriched.metrics.json"
+        assert summary["metrics_file"] == str(metrics_path)
+        data = json.loads(metrics_path.read_text())
+        assert data["leads_completed"] == 2
+        assert data["stages"]["company_search"]["calls"] == 2
+        assert 'lead_enricher_stage_calls_total{stage="company_search"} 2' in prom_path.read_text()
+
+
+class TestConcurrentStrategies:
+    """Independent lookups inside enrich_lead run concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_linkedin_lookups_overlap_website_chain(self, monkeypatch):
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        session = FakeSession(
+            search_results={
+                '"Reha360" site:linkedin.com/company': [
+                    {"title": "Reha360 | LinkedIn", "url": "https://linkedin.com/company/reha360", "snippet": ""},
+                ],
+            },
+            delay=0.05,
+        )
+        lead = {"full_name": "Sven Haubert", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+
+        start = asyncio.get_running_loop().time()
+        await enrich.enrich_lead(lead, session=session)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # 5 calls of 50 ms; the longest chain is 2 deep
+        assert len(session.searches) + len(session.scrapes) == 5
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_website_chain_stops_at_first_win(self, monkeypatch):
+        async def direct_website(domain, timeout=5.0, http_session=None):
+            return f"https://{domain}/", True
+
+        monkeypatch.setattr(enrich, "try_direct_website", direct_website)
+        session = FakeSession()
+        lead = {"full_name": "", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+
+        result = await enrich.enrich_lead(lead, session=session)
+
+        assert result["website"] == "https://reha360.de/"
+        assert '"office@reha360.de"' not in session.searches
+        assert '"Reha360"' not in session.searches
+
+
+class TestLeadDeadline:
+    """Every call of a lead is bounded by the lead's time budget."""
+
+    LEAD = {"full_name": "Sven Haubert", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+
+    @pytest.fixture(autouse=True)
+    def no_direct_website(self, monkeypatch):
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_cut_off_at_deadline(self):
+        from deadline import Deadline
+
+        session = FakeSession(
+            search_results={
+                '"Reha360" site:linkedin.com/company': [
+                    {"title": "Reha360 | LinkedIn", "url": "https://linkedin.com/company/reha360", "snippet": ""},
+                ],
+            },
+            delay=0.05,
+        )
+
+        start = asyncio.get_running_loop().time()
+        result = await enrich.enrich_lead(self.LEAD, session=session, deadline=Deadline(0.08))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # The company search times out after the email search; too little
+        # time is left to start the scrape
+        assert '"Reha360"' in session.searches
+        assert session.scrapes == []
+        assert elapsed < 0.15
+        assert result["company_linkedin"] == "https://linkedin.com/company/reha360"
+        assert result["notes"].startswith("Lead time budget (0.08s) ran out:")
+        assert "company_search" in result["notes"]
+        assert "linkedin_scrape" in result["notes"]
+        assert "linkedin_person" not in result["notes"]
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_every_call(self):
+        from deadline import Deadline
+
+        session = FakeSession()
+        result = await enrich.enrich_lead(self.LEAD, session=session, deadline=Deadline(0))
+
+        assert session.searches == []
+        for stage in ("direct_probe", "email_search", "company_search", "linkedin_company", "linkedin_person"):
+            assert stage in result["notes"]
+
+    @pytest.mark.asyncio
+    async def test_no_note_within_budget(self):
+        from deadline import Deadline
+
+        result = await enrich.enrich_lead(self.LEAD, session=FakeSession(), deadline=Deadline(5))
+
+        assert "time budget" not in result["notes"]
+
+
+class OutageSession(FakeSession):
+    """FakeSession whose SERP endpoint fails for the first `failures` calls."""
+
+    def __init__(self, failures, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+
+    async def search(self, query, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            self.searches.append(query)
+            return {"error": "SERP endpoint unavailable (circuit open, retry in 0s)", "success": False,
+                    "query": query, "unavailable": True, "retry_after": 0.0}
+        return await super().search(query, *args, **kwargs)
+
+
+class TestOutageRequeue:
+    """Leads hit by a Bright Data outage are retried, not written with errors."""
+
+    LEAD = {"full_name": "Sven Haubert", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+
+    @pytest.fixture(autouse=True)
+    def fast_requeue(self, monkeypatch):
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        async def fake_probe_domains(domains, concurrency=50, timeout=5.0, metrics=None):
+            return {domain: None for domain in domains}
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        monkeypatch.setattr(enrich, "probe_domains", fake_probe_domains)
+        monkeypatch.setattr(enrich, "REQUEUE_DELAY", 0.01)
+
+    @pytest.mark.asyncio
+    async def test_outage_aborts_lead_and_is_not_reused(self):
+        companies = enrich.CompanyResolver()
+        session = OutageSession(failures=1)
+
+        with pytest.raises(enrich.EndpointUnavailable):
+            await enrich.enrich_lead(self.LEAD, session=session, companies=companies)
+        result = await enrich.enrich_lead(self.LEAD, session=session, companies=companies)
+
+        # The failed company lookup ran again for the retry
+        assert session.searches.count('"Reha360"') == 1
+        assert "Search error" not in result["notes"]
+
+    @pytest.mark.asyncio
+    async def test_failed_leads_requeued(self, tmp_path):
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, ["Company0", "Company1", "Company2"])
+
+        summary = await enrich_csv(
+            str(input_path), str(output_path), concurrency=3, session=OutageSession(failures=4)
+        )
+
+        rows = read_rows(output_path)
+        assert summary["success"] is True
+        assert summary["requeued"] >= 1
+        assert [row["company_name"] for row in rows] == ["Company0", "Company1", "Company2"]
+        assert not any("error" in row["notes"].lower() for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_run_stops_when_outage_persists(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(enrich, "MAX_REQUEUE_SECONDS", 0.05)
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, ["Company0"])
+
+        summary = await enrich_csv(
+            str(input_path), str(output_path), session=OutageSession(failures=1000)
+        )
+
+        assert summary["success"] is False
+        assert "--resume" in summary["error"]
+        assert read_rows(output_path) == []
+
+    @staticmethod
+    def mock_client(google):
+        from unittest.mock import AsyncMock
+
+        client = AsyncMock()
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+        client.search.google = AsyncMock(side_effect=google)
+        return client
+
+    async def run_with_client(self, client, tmp_path, names, concurrency=1):
+        from unittest.mock import patch
+        from brightdata_utils import BrightDataSession
+        from circuit_breaker import CircuitBreaker
+
+        input_path = tmp_path / "leads.csv"
+        output_path = tmp_path / "leads_enriched.csv"
+        write_leads(input_path, names)
+        with patch("brightdata.BrightDataClient", return_value=client):
+            async with BrightDataSession(
+                "test_key", serp_breaker=CircuitBreaker("SERP", open_seconds=0.02)
+            ) as session:
+                summary = await enrich_csv(
+                    str(input_path), str(output_path), concurrency=concurrency, session=session
+                )
+        return summary, read_rows(output_path)
+
+    @pytest.mark.asyncio
+    async def test_outage_burst_writes_no_error_rows(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock
+        import circuit_breaker
+
+        monkeypatch.setattr(circuit_breaker, "PROBE_POLL", 0.01)
+
+        outage = {"left": 8}
+
+        async def google(query, **kwargs):
+            if outage["left"]:
+                outage["left"] -= 1
+                if outage["left"] % 2:
+                    raise OSError("Cannot connect to host api.brightdata.com")
+                return MagicMock(success=False, error="HTTP 503: Service Unavailable")
+            return MagicMock(success=True, data=[])
+
+        names = [f"Company{i}" for i in range(6)]
+        summary, rows = await self.run_with_client(self.mock_client(google), tmp_path, names, concurrency=4)
+
+        assert summary["success"] is True
+        assert summary["requeued"] >= 1
+        assert [row["company_name"] for row in rows] == names
+        # Failures before the circuit opened were requeued as well
+        assert not any("error" in row["notes"].lower() for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_failing_lead_requeued_a_bounded_number_of_times(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        calls = []
+
+        async def google(query, **kwargs):
+            if query == '"Company0"':
+                calls.append(query)
+                return MagicMock(success=False, error="HTTP 503: Service Unavailable")
+            return MagicMock(success=True, data=[])
+
+        summary, rows = await self.run_with_client(self.mock_client(google), tmp_path, ["Company0"])
+
+        # Other calls succeed, so the circuit stays closed
+        assert len(calls) == enrich.MAX_LEAD_REQUEUES + 1
+        assert summary["requeued"] == enrich.MAX_LEAD_REQUEUES
+        assert rows[0]["notes"].startswith("Search error: Search failed: HTTP 503")
+
+
+class TestCompanyGrouping:
+    """Company-level facts are resolved once per company."""
+
+    def test_normalize_company_name(self):
+        assert enrich.normalize_company_name("  Reha360   GmbH ") == "reha360 gmbh"
+        assert enrich.normalize_company_name("Reha360, GmbH.") == "reha360 gmbh"
+
+    def test_company_key_ignores_generic_domains(self):
+        a = {"company_name": "Reha360", "work_email": "a@gmail.com"}
+        b = {"company_name": "reha360", "work_email": "b@web.de"}
+        assert enrich.company_key(a, "DE") == enrich.company_key(b, "DE") == ("reha360", "", "DE")
+
+    def test_company_key_separates_domains(self):
+        a = {"company_name": "Acme", "work_email": "a@acme.de"}
+        b = {"company_name": "Acme", "work_email": "b@acme.fr"}
+        assert enrich.company_key(a, "DE") != enrich.company_key(b, "DE")
+
+    @pytest.mark.asyncio
+    async def test_colleagues_share_company_lookups(self, monkeypatch):
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        session = FakeSession()
+        companies = enrich.CompanyResolver()
+        leads = [
+            {"full_name": name, "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+            for name in ("Sven Haubert", "Anna Schmidt")
+        ]
+
+        await asyncio.gather(*(
+            enrich.enrich_lead(lead, session=session, companies=companies) for lead in leads
+        ))
+
+        assert session.searches.count('"Reha360"') == 1
+        assert session.searches.count('"Reha360" site:linkedin.com/company') == 1
+        assert '"Sven Haubert" "Reha360" site:linkedin.com/in' in session.searches
+        assert '"Anna Schmidt" "Reha360" site:linkedin.com/in' in session.searches
+        # The company search and the company LinkedIn lookup
+        assert companies.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_colleagues_scored_with_own_features(self):
+        session = FakeSession(search_results={
+            '"Reha360"': [{"title": "Reha360", "url": "https://reha360-physio.de", "snippet": "Tel. +49 30 1234567"}],
+        })
+        companies = enrich.CompanyResolver()
+        leads = [
+            {"full_name": name, "company_name": "Reha360", "work_phone_number": phone, "work_email": f"{name}@gmail.com"}
+            for name, phone in (("sven", "+49 30 1234567"), ("anna", "+49 40 7654321"))
+        ]
+
+        sven, anna = await asyncio.gather(*(
+            enrich.enrich_lead(lead, session=session, companies=companies) for lead in leads
+        ))
+
+        assert session.searches.count('"Reha360"') == 1
+        # Only Sven's phone number is in the snippet
+        assert sven["website_confidence"] == pytest.approx(anna["website_confidence"] + 0.15)
+
+    @pytest.mark.asyncio
+    async def test_colleague_not_limited_by_first_leads_deadline(self, monkeypatch):
+        from deadline import Deadline
+
+        async def no_direct_website(domain, timeout=5.0, http_session=None):
+            return None, False
+
+        monkeypatch.setattr(enrich, "try_direct_website", no_direct_website)
+        session = FakeSession(
+            search_results={
+                '"Reha360" site:linkedin.com/company': [
+                    {"title": "Reha360 | LinkedIn", "url": "https://linkedin.com/company/reha360", "snippet": ""},
+                ],
+            },
+            delay=0.05,
+        )
+        companies = enrich.CompanyResolver()
+        leads = [
+            {"full_name": name, "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+            for name in ("Sven Haubert", "Anna Schmidt")
+        ]
+
+        # Same budget, but the first lead has almost used its time up
+        almost_over = Deadline(30)
+        almost_over.expires -= 29.97
+
+        hurried, patient = await asyncio.gather(
+            enrich.enrich_lead(leads[0], session=session, companies=companies, deadline=almost_over),
+            enrich.enrich_lead(leads[1], session=session, companies=companies, deadline=Deadline(30)),
+        )
+
+        assert "linkedin_company" in hurried["notes"]
+        assert patient["company_linkedin"] == "https://linkedin.com/company/reha360"
+        assert "time budget" not in patient["notes"]
+
+    @pytest.mark.asyncio
+    async def test_resolver_keeps_recent_companies_only(self):
+        companies = enrich.CompanyResolver(max_entries=2)
+        calls = []
+
+        async def lookup(name):
+            calls.append(name)
+            return {"name": name}
+
+        for name in ("a", "b", "c", "a"):
+            await companies.resolve((name,), lambda: lookup(name))
+
+        assert len(companies) == 2
+        assert calls == ["a", "b", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_forgotten_without_waiters(self):
+        companies = enrich.CompanyResolver()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await companies.resolve(("a",), failing, timeout=0)
+        await asyncio.sleep(0.02)
+
+        assert len(companies) == 0
+
+
+class FakeResponse:
+    def __init__(self, status, url):
+        self.status = status
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeHttpSession:
+    """Minimal aiohttp.ClientSession stand-in with fixed HEAD/GET statuses."""
+
+    def __init__(self, head_status, get_status=200):
+        self.head_status = head_status
+        self.get_status = get_status
+        self.calls = []
+
+    def head(self, url, **kwargs):
+        self.calls.append("HEAD")
+        return FakeResponse(self.head_status, url)
+
+    def get(self, url, **kwargs):
+        self.calls.append("GET")
+        return FakeResponse(self.get_status, url)
+
+
+class TestScrapeCache:
+    """LinkedIn company page data is cached per canonical URL."""
+
+    def test_canonical_url(self):
+        canonical = enrich.canonical_linkedin_company_url
+        assert canonical("https://de.linkedin.com/company/Reha-360/about/?trk=x") == \
+            "https://www.linkedin.com/company/reha-360"
+        assert canonical("https://linkedin.com/company/reha360") == "https://www.linkedin.com/company/reha360"
+        assert canonical("https://reha360.de/") == "https://reha360.de/"
+
+    @pytest.mark.asyncio
+    async def test_cached_page_is_not_scraped(self, tmp_path):
+        session = FakeSession(scrape_html='<p>1,234 followers on LinkedIn</p>')
+        session.scrape_cache = ScrapeCache(tmp_path)
+
+        first = await enrich.scrape_linkedin_company("https://de.linkedin.com/company/reha360", session=session)
+        second = await enrich.scrape_linkedin_company("https://linkedin.com/company/reha360/about", session=session)
+
+        assert session.scrapes == ["https://www.linkedin.com/company/reha360"]
+        assert second.pop("cached") is True
+        assert first == second
+        assert session.scrape_cache.stats() == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_scrape_is_not_cached(self, tmp_path):
+        session = FakeSession()
+        session.scrape_cache = ScrapeCache(tmp_path)
+
+        async def failing_scrape(url, timeout=None):
+            session.scrapes.append(url)
+            return {"success": False, "url": url, "error": "Scrape failed: timeout"}
+
+        session.scrape = failing_scrape
+        await enrich.scrape_linkedin_company("https://linkedin.com/company/reha360", session=session)
+        await enrich.scrape_linkedin_company("https://linkedin.com/company/reha360", session=session)
+
+        assert len(session.scrapes) == 2
+
+
+class TestNegativeCache:
+    """LinkedIn lookups mark searches that found nothing as cache misses."""
+
+    @pytest.mark.asyncio
+    async def test_company_miss_predicate(self):
+        session = FakeSession()
+        result = await enrich.search_linkedin_company("Reha360", session=session)
+        assert result == {"success": True, "url": None}
+
+        is_miss = session.miss_predicates['"Reha360" site:linkedin.com/company']
+        assert is_miss([]) is True
+        assert is_miss([{"url": "https://linkedin.com/company/sankom", "title": "Sankom"}]) is True
+        assert is_miss([{"url": "https://linkedin.com/company/reha360", "title": "Reha360"}]) is False
+
+    @pytest.mark.asyncio
+    async def test_person_miss_predicate(self):
+        session = FakeSession()
+        await enrich.search_linkedin_person("Sven Haubert", "Reha360", session=session)
+
+        is_miss = session.miss_predicates['"Sven Haubert" "Reha360" site:linkedin.com/in']
+        assert is_miss([{"url": "https://reha360.de", "title": ""}]) is True
+        assert is_miss([{"url": "https://linkedin.com/in/sven", "title": ""}]) is False
+
+
+class TestDomainProbing:
+    """Bulk email domain probing before enrichment."""
+
+    @pytest.mark.asyncio
+    async def test_head_success_skips_get(self):
+        http = FakeHttpSession(head_status=200)
+        url, success = await enrich.try_direct_website("reha360.de", http_session=http)
+        assert success is True
+        assert url == "https://reha360.de/"
+        assert http.calls == ["HEAD"]
+
+    @pytest.mark.asyncio
+    async def test_head_rejected_falls_back_to_get(self):
+        http = FakeHttpSession(head_status=405, get_status=206)
+        url, success = await enrich.try_direct_website("reha360.de", http_session=http)
+        assert success is True
+        assert http.calls == ["HEAD", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_not_found_does_not_retry(self):
+        http = FakeHttpSession(head_status=404)
+        url, success = await enrich.try_direct_website("reha360.de", http_session=http)
+        assert success is False
+        assert http.calls == ["HEAD"]
+
+    def test_collect_email_domains_skips_generic(self, tmp_path):
+        input_path = tmp_path / "leads.csv"
+        write_leads(input_path, ["Acme", "Acme", "Beta"])
+        with open(input_path, "a", encoding="utf-8") as f:
+            f.write("X\tGmailCo\t\tsomeone@gmail.com\n")
+        assert enrich.collect_email_domains(input_path) == {"acme.de", "beta.de"}
+
+    @pytest.mark.asyncio
+    async def test_probe_domains_shares_one_session(self, monkeypatch):
+        sessions = set()
+
+        async def fake_direct_website(domain, timeout=5.0, http_session=None):
+            sessions.add(id(http_session))
+            return (f"https://{domain}/", True) if domain != "dead.de" else (None, False)
+
+        monkeypatch.setattr(enrich, "try_direct_website", fake_direct_website)
+        probed = await enrich.probe_domains({"acme.de", "dead.de"})
+        assert probed == {"acme.de": "https://acme.de/", "dead.de": None}
+        assert len(sessions) == 1
+
+    @pytest.mark.asyncio
+    async def test_probed_domains_replace_live_probe(self, monkeypatch):
+        async def unexpected_probe(domain, timeout=5.0, http_session=None):
+            raise AssertionError("domain should come from the probe table")
+
+        monkeypatch.setattr(enrich, "try_direct_website", unexpected_probe)
+        lead = {"full_name": "", "company_name": "Reha360", "work_phone_number": "", "work_email": "office@reha360.de"}
+
+        result = await enrich.enrich_lead(
+            lead, session=FakeSession(), probed_domains={"reha360.de": "https://www.reha360.de/"}
+        )
+
+        assert result["website"] == "https://www.reha360.de/"
+
+
 class TestBrightDataSDK:
     """Smoke tests for Bright Data SDK installation."""
 
@@ -153,3 +1285,20 @@ class TestBrightDataSDK:
         client = BrightDataClient(token="test_token_12345", validate_token=False)
         assert hasattr(client, 'search')
         assert hasattr(client.search, 'google')
+
+
+class TestStartup:
+    """The CLI loads network and multiprocessing libraries only when used."""
+
+    def test_import_skips_heavy_modules(self):
+        import subprocess
+
+        heavy = ("brightdata", "aiohttp", "multiprocessing.managers", "concurrent.futures.process")
+        code = f"import sys, enrich; print(sorted(m for m in sys.modules if m in {heavy}))"
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True, timeout=60,
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "[]"
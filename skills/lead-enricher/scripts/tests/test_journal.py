@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Unit tests for the checkpoint journal."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import EnrichmentJournal, journal_path_for, row_hash
+
+
+LEAD = {"full_name": "Sven Haubert", "company_name": "Reha360", "work_email": "office@reha360.de"}
+
+
+class TestRowHash:
+    def test_stable_across_column_order(self):
+        reordered = {k: LEAD[k] for k in reversed(list(LEAD))}
+        assert row_hash(LEAD) == row_hash(reordered)
+
+    def test_changes_with_values(self):
+        assert row_hash(LEAD) != row_hash({**LEAD, "company_name": "Reha 360"})
+
+
+class TestJournalPath:
+    def test_next_to_output(self):
+        assert journal_path_for(Path("/data/leads_enriched.csv")) == Path("/data/leads_enriched.journal.jsonl")
+
+
+class TestEnrichmentJournal:
+    def test_append_and_load(self, tmp_path):
+        journal = EnrichmentJournal(tmp_path / "j.jsonl")
+        journal.append("abc", {"website": "https://reha360.de"})
+
+        assert "abc" in journal
+        assert journal.load("abc") == {"website": "https://reha360.de"}
+        assert journal.load("missing") is None
+
+    def test_resume_reads_existing_entries(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        first = EnrichmentJournal(path)
+        first.append("a", {"n": 1})
+        first.append("b", {"n": 2})
+        first.close()
+
+        resumed = EnrichmentJournal(path, resume=True)
+        resumed.append("c", {"n": 3})
+
+        assert len(resumed) == 3
+        assert [resumed.load(k) for k in "abc"] == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+    def test_without_resume_starts_fresh(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        first = EnrichmentJournal(path)
+        first.append("a", {"n": 1})
+        first.close()
+
+        assert "a" not in EnrichmentJournal(path)
+
+    def test_without_resume_keeps_old_journal_as_backup(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        first = EnrichmentJournal(path)
+        first.append("a", {"n": 1})
+        first.close()
+
+        fresh = EnrichmentJournal(path)
+
+        assert fresh.backup == tmp_path / "j.jsonl.bak"
+        assert "a" in EnrichmentJournal(fresh.backup, resume=True)
+        assert path.read_bytes() == b""
+
+    def test_empty_journal_not_backed_up(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        EnrichmentJournal(path).close()
+
+        assert EnrichmentJournal(path).backup is None
+        assert not (tmp_path / "j.jsonl.bak").exists()
+
+    def test_torn_trailing_write_is_dropped(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        first = EnrichmentJournal(path)
+        first.append("a", {"n": 1})
+        first.close()
+        with open(path, "a") as f:
+            f.write('{"hash": "b", "row": {"n"')
+
+        resumed = EnrichmentJournal(path, resume=True)
+        resumed.append("c", {"n": 3})
+
+        assert "b" not in resumed
+        assert resumed.load("c") == {"n": 3}
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Unit tests for per-stage run metrics."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics import EMPTY, FAILURE, SUCCESS, RunMetrics, load_metrics, metrics_path_for
+
+
+class TestRunMetrics:
+    def test_record_calls_and_cache_hits(self):
+        metrics = RunMetrics()
+        metrics.record("company_search", SUCCESS, 0.2)
+        metrics.record("company_search", EMPTY, 3.0)
+        metrics.record("company_search", SUCCESS, 0.0, cached=True)
+        metrics.record("linkedin_scrape", FAILURE, 0.07)
+
+        stage = metrics.to_dict()["stages"]["company_search"]
+        assert stage["calls"] == 2
+        assert stage["cache_hits"] == 1
+        assert (stage["success"], stage["empty"], stage["failure"]) == (2, 1, 0)
+        # Cache hits stay out of the latency histogram
+        assert stage["latency_seconds"]["count"] == 2
+        assert stage["latency_seconds"]["sum"] == pytest.approx(3.2)
+        assert stage["latency_seconds"]["buckets"]["0.25"] == 1
+        assert stage["latency_seconds"]["buckets"]["5"] == 1
+
+    def test_merge_round_trip(self):
+        first, second = RunMetrics(), RunMetrics()
+        first.record("email_search", SUCCESS, 0.1)
+        first.leads_completed = 2
+        second.record("email_search", EMPTY, 100.0)
+        second.leads_completed = 3
+
+        combined = RunMetrics()
+        combined.merge(first.to_dict())
+        combined.merge(second.to_dict())
+
+        stage = combined.to_dict()["stages"]["email_search"]
+        assert combined.leads_completed == 5
+        assert stage["calls"] == 2
+        assert stage["latency_seconds"]["buckets"]["0.1"] == 1
+        assert stage["latency_seconds"]["buckets"]["+Inf"] == 1
+
+    def test_prometheus_histogram_is_cumulative(self):
+        metrics = RunMetrics()
+        metrics.record("linkedin_person", SUCCESS, 0.04)
+        metrics.record("linkedin_person", EMPTY, 0.3)
+        text = metrics.to_prometheus()
+
+        assert 'lead_enricher_stage_calls_total{stage="linkedin_person"} 2' in text
+        assert 'lead_enricher_stage_results_total{stage="linkedin_person",outcome="empty"} 1' in text
+        assert 'lead_enricher_stage_latency_seconds_bucket{stage="linkedin_person",le="0.05"} 1' in text
+        assert 'lead_enricher_stage_latency_seconds_bucket{stage="linkedin_person",le="0.5"} 2' in text
+        assert 'lead_enricher_stage_latency_seconds_bucket{stage="linkedin_person",le="+Inf"} 2' in text
+        assert 'lead_enricher_stage_latency_seconds_count{stage="linkedin_person"} 2' in text
+
+    def test_write_files(self, tmp_path):
+        metrics = RunMetrics()
+        metrics.record("direct_probe", SUCCESS, 0.01)
+        json_file = metrics_path_for(tmp_path / "leads_enriched.csv")
+        prom_file = tmp_path / "enrich.prom"
+        metrics.write(json_file, prom_file)
+
+        assert json_file.name == "leads_enriched.metrics.json"
+        assert load_metrics(json_file)["stages"]["direct_probe"]["success"] == 1
+        assert "lead_enricher_leads_completed_total 0" in prom_file.read_text()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["enrich.prom", "leads_enriched.metrics.json"]
+
+    def test_load_missing(self, tmp_path):
+        assert load_metrics(tmp_path / "missing.json") is None
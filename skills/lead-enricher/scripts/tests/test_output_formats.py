@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Unit tests for enriched-lead output writers."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from output_formats import (
+    JsonlWriter, TsvWriter, check_output_format, merge_output_files, output_path_for,
+    read_output_rows, typed_row,
+)
+
+FIELDS = ["company_name", "website", "website_confidence", "person_verified", "employee_count"]
+ROW = {
+    "company_name": "Reha360",
+    "website": "https://reha360.de",
+    "website_confidence": 0.9,
+    "person_verified": "true",
+    "employee_count": "1,234",
+}
+
+
+class TestTypedRow:
+    def test_types(self):
+        assert typed_row(ROW, FIELDS) == {
+            "company_name": "Reha360",
+            "website": "https://reha360.de",
+            "website_confidence": 0.9,
+            "person_verified": True,
+            "employee_count": "1,234",
+            "employee_count_min": 1234,
+            "employee_count_max": 1234,
+        }
+
+    def test_empty_values_become_null(self):
+        row = {"company_name": "X", "website_confidence": "", "person_verified": "", "employee_count": ""}
+        typed = typed_row(row, FIELDS)
+        assert typed["website_confidence"] is None
+        assert typed["person_verified"] is None
+        assert typed["employee_count"] == ""
+        assert typed["employee_count_min"] is None
+        assert typed["employee_count_max"] is None
+        assert typed["website"] == ""
+
+    def test_employee_range_kept_with_bounds(self):
+        for value, low, high in [("51-200", 51, 200), ("10,001+", 10001, None),
+                                 ("1.001-5.000", 1001, 5000), ("N/A", None, None)]:
+            assert typed_row({"employee_count": value}, ["employee_count"]) == {
+                "employee_count": value, "employee_count_min": low, "employee_count_max": high,
+            }
+
+    def test_confidence_from_text(self):
+        assert typed_row({"website_confidence": "0.75"}, ["website_confidence"]) == {"website_confidence": 0.75}
+
+
+class TestWriters:
+    def test_base_writer_is_abstract(self, tmp_path):
+        from output_formats import _OutputWriter
+
+        with pytest.raises(TypeError):
+            _OutputWriter(tmp_path / "out", FIELDS)
+
+    def test_jsonl_is_readable_while_open(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        with JsonlWriter(path, FIELDS) as writer:
+            writer.write(ROW)
+            # Flushed per row, so a tailing reader sees it before close
+            assert json.loads(path.read_text().splitlines()[0])["employee_count_min"] == 1234
+
+    def test_tsv_keeps_text(self, tmp_path):
+        path = tmp_path / "out.csv"
+        with TsvWriter(path, FIELDS) as writer:
+            writer.write(ROW)
+        lines = path.read_text().splitlines()
+        assert lines[0] == "\t".join(FIELDS)
+        assert lines[1].split("\t")[-1] == "1,234"
+
+    def test_merge_jsonl_has_no_header_handling(self, tmp_path):
+        shards = [tmp_path / "a.jsonl", tmp_path / "b.jsonl"]
+        shards[0].write_text('{"n": 1}\n{"n": 2}\n')
+        shards[1].write_text('{"n": 3}\n')
+        merge_output_files("jsonl", shards, tmp_path / "out.jsonl")
+        assert [json.loads(l)["n"] for l in (tmp_path / "out.jsonl").read_text().splitlines()] == [1, 2, 3]
+
+
+class TestReadOutputRows:
+    @pytest.mark.parametrize("writer_cls, name", [(TsvWriter, "out.csv"), (JsonlWriter, "out.jsonl")])
+    def test_round_trip_to_enrich_types(self, tmp_path, writer_cls, name):
+        path = tmp_path / name
+        empty = {"company_name": "X", "website": "", "website_confidence": 0.0,
+                 "person_verified": "", "employee_count": ""}
+        with writer_cls(path, FIELDS) as writer:
+            writer.write({**ROW, "employee_count": "51-200"})
+            writer.write(empty)
+
+        # The same text in every format, so --previous does not depend on it
+        rows = list(read_output_rows(path))
+        assert rows[0] == {**ROW, "employee_count": "51-200"}
+        assert rows[1] == empty
+
+
+class TestParquet:
+    def test_typed_columns_and_row_groups(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        from output_formats import ParquetWriter
+
+        path = tmp_path / "out.parquet"
+        with ParquetWriter(path, FIELDS, row_group_size=2) as writer:
+            for i in range(5):
+                writer.write({**ROW, "employee_count": str(i) if i else ""})
+
+        parquet = pq.ParquetFile(str(path))
+        assert parquet.num_row_groups == 3
+        table = parquet.read()
+        assert str(table.schema.field("website_confidence").type) == "double"
+        assert table.column("employee_count").to_pylist() == ["", "1", "2", "3", "4"]
+        assert str(table.schema.field("employee_count_min").type) == "int64"
+        assert table.column("employee_count_max").to_pylist() == [None, 1, 2, 3, 4]
+
+    def test_missing_pyarrow_is_reported(self):
+        try:
+            import pyarrow  # noqa: F401
+            pytest.skip("pyarrow is installed")
+        except ImportError:
+            pass
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            check_output_format("parquet")
+
+
+class TestOutputPath:
+    def test_extension_follows_format(self):
+        assert output_path_for(Path("/d/leads_enriched.csv"), "jsonl") == Path("/d/leads_enriched.jsonl")
+        assert output_path_for(Path("/d/leads_enriched.csv"), "parquet") == Path("/d/leads_enriched.parquet")
+        assert output_path_for(Path("/d/leads_enriched.tsv"), "tsv") == Path("/d/leads_enriched.tsv")
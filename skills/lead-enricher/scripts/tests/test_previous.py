@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Unit tests for carrying enrichment forward from a previous output."""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import row_hash
+from output_formats import JsonlWriter, TsvWriter
+from previous import ENRICHED_AT, PreviousEnrichment
+
+ENRICHMENT = ["website", "website_confidence", "notes", ENRICHED_AT]
+INPUT = ["full_name", "company_name", "work_email"]
+
+
+def lead(company: str) -> dict:
+    return {"full_name": "Sven Haubert", "company_name": company, "work_email": "office@example.de"}
+
+
+def days_ago(days: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat(timespec="seconds")
+
+
+def write_previous(path, rows, writer_cls=TsvWriter, fields=INPUT + ENRICHMENT):
+    with writer_cls(path, fields) as writer:
+        for row in rows:
+            writer.write(row)
+
+
+class TestPreviousEnrichment:
+    def test_fresh_rows_by_input_hash(self, tmp_path):
+        path = tmp_path / "last_enriched.csv"
+        enriched_at = days_ago(3)
+        write_previous(path, [
+            {**lead("Reha360"), "website": "https://reha360.de", "website_confidence": 0.9,
+             "notes": "", ENRICHED_AT: enriched_at},
+        ])
+
+        previous = PreviousEnrichment(path, ENRICHMENT, max_age_days=30)
+
+        assert len(previous) == 1
+        assert previous.get(row_hash(lead("Reha360"))) == {
+            "website": "https://reha360.de", "website_confidence": 0.9, "notes": "",
+            ENRICHED_AT: enriched_at,
+        }
+        # Changed input columns do not match
+        assert previous.get(row_hash(lead("Reha 360"))) is None
+
+    def test_stale_rows_left_out(self, tmp_path):
+        path = tmp_path / "last_enriched.jsonl"
+        write_previous(path, [
+            {**lead("Fresh"), "website_confidence": 0.9, ENRICHED_AT: days_ago(6)},
+            {**lead("Stale"), "website_confidence": 0.9, ENRICHED_AT: days_ago(8)},
+        ], writer_cls=JsonlWriter)
+
+        previous = PreviousEnrichment(path, ENRICHMENT, max_age_days=7)
+
+        assert row_hash(lead("Fresh")) in previous
+        assert row_hash(lead("Stale")) not in previous
+        assert previous.stale == 1
+
+    def test_file_time_without_enriched_at(self, tmp_path):
+        path = tmp_path / "old_enriched.csv"
+        write_previous(
+            path, [{**lead("Reha360"), "website_confidence": 0.9}],
+            fields=INPUT + ["website", "website_confidence", "notes"],
+        )
+        ten_days_ago = time.time() - 10 * 86400
+        os.utime(path, (ten_days_ago, ten_days_ago))
+
+        assert len(PreviousEnrichment(path, ENRICHMENT, max_age_days=30)) == 1
+        assert len(PreviousEnrichment(path, ENRICHMENT, max_age_days=7)) == 0
+
+    def test_failed_rows_left_out(self, tmp_path):
+        path = tmp_path / "last_enriched.csv"
+        write_previous(path, [
+            {**lead("Found"), "website": "https://found.de", "website_confidence": 0.9,
+             "notes": "", ENRICHED_AT: days_ago(1)},
+            {**lead("Errored"), "website_confidence": 0.0,
+             "notes": "Search error: HTTP 503: Service Unavailable", ENRICHED_AT: days_ago(1)},
+            {**lead("Slow"), "website_confidence": 0.0,
+             "notes": "Lead time budget (120s) ran out: company_search incomplete.", ENRICHED_AT: days_ago(1)},
+            {**lead("Nothing"), "website_confidence": 0.0,
+             "notes": "Low confidence match (0.00). Manual review needed.", ENRICHED_AT: days_ago(1)},
+        ])
+
+        previous = PreviousEnrichment(path, ENRICHMENT, max_age_days=30)
+
+        assert row_hash(lead("Found")) in previous
+        # A lookup that found nothing is a result; one that failed is retried
+        assert row_hash(lead("Nothing")) in previous
+        assert row_hash(lead("Errored")) not in previous
+        assert row_hash(lead("Slow")) not in previous
+        assert previous.failed == 2
+        assert previous.stale == 0
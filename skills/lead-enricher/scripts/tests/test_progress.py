@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Unit tests for progress reporting and per-lead logs."""
+
+import asyncio
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metrics import FAILURE, SUCCESS, RunMetrics
+from progress import LeadLog, ProgressReporter, format_duration, log_detail
+
+
+class TestFormatDuration:
+    def test_units(self):
+        assert format_duration(42) == "42s"
+        assert format_duration(17 * 60 + 5) == "17m05s"
+        assert format_duration(3 * 3600 + 12 * 60) == "3h12m"
+
+
+class TestProgressReporter:
+    def test_line_contents(self):
+        metrics = RunMetrics()
+        metrics.record("company_search", SUCCESS, 0.1)
+        metrics.record("company_search", FAILURE, 0.1)
+        progress = ProgressReporter(100, metrics, stream=io.StringIO(), refresh=False)
+        progress.started -= 10
+        for _ in range(20):
+            progress.advance()
+
+        line = progress.line()
+        assert line.startswith("20/100 leads (20%)")
+        assert "2.0 leads/s" in line
+        assert "0.2 calls/s" in line
+        assert "errors 50.0%" in line
+        assert "ETA 40s" in line
+
+    def test_resumed_leads_do_not_inflate_rate(self):
+        progress = ProgressReporter(10, stream=io.StringIO(), refresh=False)
+        progress.started -= 10
+        for _ in range(5):
+            progress.advance(skipped=True)
+        progress.advance()
+
+        assert "0.1 leads/s" in progress.line()
+
+    def test_line_mode_prints_lines(self):
+        stream = io.StringIO()
+        progress = ProgressReporter(2, stream=stream, refresh=False, label="shard 1")
+        progress.advance()
+        progress.report()
+        progress.advance()
+        progress.finish()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("  [shard 1] 1/2 leads")
+        assert "done in" in lines[1]
+
+    def test_refresh_mode_rewrites_one_line(self):
+        stream = io.StringIO()
+        progress = ProgressReporter(2, stream=stream, refresh=True)
+        progress.report()
+        progress.advance()
+        progress.finish()
+
+        output = stream.getvalue()
+        assert output.count("\r") == 2
+        assert output.endswith("\n") and output.count("\n") == 1
+
+
+class TestLeadLog:
+    @pytest.mark.asyncio
+    async def test_details_are_tagged_across_tasks(self, tmp_path):
+        log = LeadLog(tmp_path / "run.log.jsonl")
+
+        async def lookup(stage):
+            await asyncio.sleep(0)
+            log_detail(stage, f"  [{stage}] looked up")
+
+        async def lead(lead_id):
+            with log.lead(lead_id):
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(lookup("company_search"))
+                    tg.create_task(lookup("linkedin_person"))
+
+        await asyncio.gather(lead("a"), lead("b"))
+        log.close()
+
+        records = [json.loads(line) for line in (tmp_path / "run.log.jsonl").read_text().splitlines()]
+        assert len(records) == 4
+        assert sorted((r["lead"], r["stage"]) for r in records) == [
+            ("a", "company_search"), ("a", "linkedin_person"),
+            ("b", "company_search"), ("b", "linkedin_person"),
+        ]
+        assert records[0]["message"].startswith("[")
+
+    def test_without_log_prints(self, capsys):
+        log_detail("company_search", "  [Strategy 3] Searching")
+        assert capsys.readouterr().out == "  [Strategy 3] Searching\n"
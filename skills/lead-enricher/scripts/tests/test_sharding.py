@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Unit tests for byte-range sharding."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sharding import merge_shards, open_leads, shard_byte_ranges, shard_path_for
+
+HEADER = "full_name\tcompany_name\twork_phone_number\twork_email\n"
+
+
+def write_file(path, count):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADER)
+        for i in range(count):
+            # Varying row lengths and non-ASCII names
+            f.write(f"Jürgen {i}\tFirma {'x' * (i % 7)}{i}\t\tinfo@firma{i}.de\n")
+
+
+class TestShardByteRanges:
+    @pytest.mark.parametrize("shards", [1, 2, 3, 7, 50])
+    def test_ranges_cover_every_row_once_in_order(self, tmp_path, shards):
+        path = tmp_path / "leads.csv"
+        write_file(path, 23)
+
+        names = []
+        for byte_range in shard_byte_ranges(path, shards):
+            with open_leads(path, byte_range) as reader:
+                names.extend(row["full_name"] for row in reader)
+
+        assert names == [f"Jürgen {i}" for i in range(23)]
+
+    def test_contiguous_and_line_aligned(self, tmp_path):
+        path = tmp_path / "leads.csv"
+        write_file(path, 10)
+        ranges = shard_byte_ranges(path, 3)
+        data = path.read_bytes()
+
+        assert ranges[0][0] == len(HEADER.encode("utf-8"))
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[start - 1:start] == b"\n"
+
+    def test_header_only_file(self, tmp_path):
+        path = tmp_path / "leads.csv"
+        write_file(path, 0)
+        assert shard_byte_ranges(path, 4) == []
+
+
+class TestMergeShards:
+    def test_keeps_first_header_and_order(self, tmp_path):
+        shards = [tmp_path / f"s{i}.csv" for i in range(3)]
+        shards[0].write_text("a\tb\n1\t2\n")
+        shards[2].write_text("a\tb\n3\t4\n5\t6\n")  # shard 1 produced no file
+
+        assert merge_shards(shards, tmp_path / "out.csv") is True
+        assert (tmp_path / "out.csv").read_text() == "a\tb\n1\t2\n3\t4\n5\t6\n"
+
+    def test_no_shard_files(self, tmp_path):
+        assert merge_shards([tmp_path / "missing.csv"], tmp_path / "out.csv") is False
+        assert not (tmp_path / "out.csv").exists()
+
+    def test_shard_path(self):
+        assert shard_path_for(Path("/d/leads_enriched.csv"), 2) == Path("/d/leads_enriched.shard2.csv")
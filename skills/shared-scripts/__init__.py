@@ -2,9 +2,17 @@
 
 # Use absolute imports for pytest compatibility
 try:
-    from .brightdata_utils import get_api_key, LOCATION_MAP, create_client
-    __all__ = ["get_api_key", "LOCATION_MAP", "create_client"]
+    from .brightdata_utils import (
+        get_api_key, LOCATION_MAP, create_client, BrightDataSession, session_scope,
+    )
+    __all__ = [
+        "get_api_key", "LOCATION_MAP", "create_client", "BrightDataSession", "session_scope",
+    ]
 except ImportError:
     # When running as standalone scripts
-    from brightdata_utils import get_api_key, LOCATION_MAP, create_client
-    __all__ = ["get_api_key", "LOCATION_MAP", "create_client"]
+    from brightdata_utils import (
+        get_api_key, LOCATION_MAP, create_client, BrightDataSession, session_scope,
+    )
+    __all__ = [
+        "get_api_key", "LOCATION_MAP", "create_client", "BrightDataSession", "session_scope",
+    ]
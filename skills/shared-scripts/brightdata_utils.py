@@ -7,10 +7,19 @@ Used by:
 - distributor-inspector/scripts/search.py
 """
 
+import asyncio
 import json
 import os
+import time
+import warnings
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+
+from circuit_breaker import CLOSED
+from rate_limiter import classify_error
+from single_flight import SingleFlight
 
 # Country code to location name mapping
 LOCATION_MAP = {
@@ -72,6 +81,11 @@ LOCATION_MAP = {
     "ZA": "South Africa",
 }
 
+# Location name back to ISO code. The SDK resolves only a few dozen country
+# names and silently falls back to "us" for others ("Austria"), while any
+# two-letter code is passed through to Google as is.
+LOCATION_CODES = {name.lower(): code for code, name in LOCATION_MAP.items() if code != "UK"}
+
 
 def get_api_key(skill_name: Optional[str] = None) -> str:
     """
@@ -121,10 +135,17 @@ def get_api_key(skill_name: Optional[str] = None) -> str:
     return ""
 
 
+# Overrides the Bright Data API base URL, e.g. "http://127.0.0.1:8765"
+BASE_URL_ENV = "BRIGHTDATA_BASE_URL"
+
+
 async def create_client(api_key: str):
     """
     Create a Bright Data client with standard settings.
 
+    Requests go to the URL in the BRIGHTDATA_BASE_URL environment variable
+    instead of the Bright Data API when it is set.
+
     Args:
         api_key: Bright Data API key
 
@@ -133,11 +154,373 @@ async def create_client(api_key: str):
     """
     from brightdata import BrightDataClient
 
-    return BrightDataClient(
+    client = BrightDataClient(
         token=api_key,
         validate_token=False,
         auto_create_zones=False,
     )
+    base_url = os.environ.get(BASE_URL_ENV)
+    if base_url:
+        # Stand-in API server (benchmarks/mock_server.py); all SDK services
+        # share the client's engine
+        engine = getattr(client, "engine", None)
+        if hasattr(engine, "BASE_URL"):
+            engine.BASE_URL = base_url.rstrip("/")
+        else:
+            _warn_sdk_changed("client.engine.BASE_URL", f"{BASE_URL_ENV} is ignored")
+    return client
+
+
+# brightdata-sdk versions whose private client internals (engine._session,
+# engine.BASE_URL) create_client and enable_keepalive were verified against;
+# keep in sync with the pyproject.toml pins
+VERIFIED_SDK_VERSIONS = ">=2.5.2,<2.6"
+
+
+def _warn_sdk_changed(attribute: str, consequence: str) -> None:
+    warnings.warn(
+        f"brightdata-sdk has no {attribute} (verified with brightdata-sdk{VERIFIED_SDK_VERSIONS}); "
+        f"{consequence}",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+# Connection pool settings for the long-lived session
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 30
+DNS_CACHE_TTL = 300  # seconds
+
+# Retries for calls rejected with a rate-limit or server error
+MAX_THROTTLE_RETRIES = 3
+
+
+async def enable_keepalive(client) -> None:
+    """
+    Replace the SDK's force-close connector with a keep-alive connection pool.
+
+    The SDK closes every connection after each request, so each call pays
+    a fresh TCP + TLS handshake. For a long-lived client we reuse
+    connections instead. Warns and leaves the client as it is if the SDK
+    no longer keeps an aiohttp session in `engine._session`.
+
+    Args:
+        client: Entered BrightDataClient instance
+    """
+    import aiohttp
+
+    engine = getattr(client, "engine", None)
+    session = getattr(engine, "_session", None)
+    if session is None:
+        _warn_sdk_changed("client.engine._session", "connections are not kept alive")
+        return
+    if not isinstance(session, aiohttp.ClientSession):
+        return
+    if not getattr(session.connector, "force_close", False):
+        return
+
+    connector = aiohttp.TCPConnector(
+        limit=POOL_LIMIT,
+        limit_per_host=POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    engine._session = aiohttp.ClientSession(
+        connector=connector,
+        trust_env=True,
+        timeout=session.timeout,
+        headers=session.headers,
+    )
+    await session.close()
+
+
+class BrightDataSession:
+    """
+    Long-lived Bright Data client shared by all search and scrape calls of a run.
+
+    Opens one BrightDataClient with a keep-alive connection pool on the first
+    API call and closes it on exit, so per-call overhead is only the API
+    latency and runs answered entirely from the cache never load the SDK. When a
+    SerpCache is given, searches are answered from it before calling the API.
+    Searches and scrapes each go through their own AdaptiveRateLimiter when
+    given; throttled calls are retried after the limiter's backoff. With
+    `serp_breaker` and `scrape_breaker` (see circuit_breaker.py), calls to an
+    endpoint that keeps failing fail fast. Failures that count against a
+    breaker (connection errors, 5xx) are marked unavailable=True, with
+    circuit_open and retry_after seconds, so callers can retry them later
+    instead of recording them as results.
+    Identical searches and scrapes of the same URL that are already in
+    flight share one request instead of each calling the API. A ScrapeCache
+    given as `scrape_cache` is held for callers that cache extracted data.
+
+    Example:
+        >>> async with BrightDataSession(get_api_key()) as session:
+        ...     result = await session.search('"Acme GmbH"', "Germany", "de", 10)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        cache=None,
+        serp_limiter=None,
+        scrape_limiter=None,
+        scrape_cache=None,
+        serp_breaker=None,
+        scrape_breaker=None,
+    ):
+        self.api_key = api_key
+        self.cache = cache
+        self.serp_limiter = serp_limiter
+        self.scrape_limiter = scrape_limiter
+        self.scrape_cache = scrape_cache
+        self.serp_breaker = serp_breaker
+        self.scrape_breaker = scrape_breaker
+        self.search_flights = SingleFlight()
+        self.scrape_flights = SingleFlight()
+        self.client = None
+        self._client_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        if find_spec("brightdata") is None:
+            raise ImportError(
+                "brightdata-sdk not installed. Run: pip install brightdata-sdk"
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.client is not None:
+            client = self.client
+            self.client = None
+            await client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _get_client(self):
+        """Open the SDK client on the first API call (importing the SDK is slow)."""
+        async with self._client_lock:
+            if self.client is None:
+                client = await create_client(self.api_key)
+                await client.__aenter__()
+                try:
+                    await enable_keepalive(client)
+                except BaseException:
+                    await client.__aexit__(None, None, None)
+                    raise
+                self.client = client
+        return self.client
+
+    async def search(
+        self,
+        query: str,
+        location: str,
+        language: str = "en",
+        num_results: int = 10,
+        is_miss: Optional[Callable[[list], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """
+        Run a Google search and map results to title/url/snippet dicts.
+
+        Args:
+            is_miss: Predicate on the mapped results; True marks them as a
+                negative result, cached with the cache's shorter negative TTL
+            timeout: Seconds to wait, including rate-limit waits and retries
+                (default: no limit)
+
+        Returns:
+            Dict with success, query and results (cached=True when served
+            from the cache), or success=False and error (timed_out=True
+            when `timeout` ran out, unavailable=True when the SERP
+            endpoint is failing)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(query, location, language, num_results)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return {"success": True, "query": query, "results": cached, "cached": True}
+
+        request = (query, location, language, num_results)
+        flight = self.search_flights.do(
+            request, lambda: self._search(*request, cache_key=cache_key, is_miss=is_miss)
+        )
+        try:
+            # The shared call keeps running for other callers (and the cache)
+            result = await asyncio.wait_for(flight, timeout)
+        except asyncio.TimeoutError:
+            return timed_out(timeout, query=query)
+        # Coalesced callers each get their own dict
+        return dict(result)
+
+    async def _search(
+        self,
+        query: str,
+        location: str,
+        language: str,
+        num_results: int,
+        cache_key: Optional[str] = None,
+        is_miss: Optional[Callable[[list], bool]] = None,
+    ) -> dict:
+        client = await self._get_client()
+        results, error, unavailable = await self._request(
+            self.serp_limiter,
+            self.serp_breaker,
+            lambda: client.search.google(
+                query=query,
+                location=LOCATION_CODES.get(location.lower(), location),
+                language=language,
+                num_results=num_results,
+            ),
+        )
+        if results is None or not results.success:
+            if results is not None:
+                error = f"Search failed: {results.error}"
+            failed = {"error": error, "success": False, "query": query}
+            if unavailable:
+                failed.update(self._unavailable(self.serp_breaker))
+            return failed
+
+        mapped = []
+        for item in results.data or []:
+            mapped.append(
+                {
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "snippet": item.get("description", ""),
+                }
+            )
+
+        if cache_key is not None:
+            self.cache.put(cache_key, mapped, negative=bool(is_miss and is_miss(mapped)))
+
+        return {"success": True, "query": query, "results": mapped}
+
+    async def scrape(self, url: str, timeout: Optional[float] = None) -> dict:
+        """
+        Scrape a URL and return its raw content.
+
+        Concurrent calls for the same URL share one in-flight request.
+
+        Args:
+            timeout: Seconds to wait, including rate-limit waits and retries
+                (default: no limit)
+
+        Returns:
+            Dict with success and data (HTML), or success=False and error
+            (timed_out=True when `timeout` ran out, unavailable=True when
+            the scrape endpoint is failing)
+        """
+        flight = self.scrape_flights.do(url, lambda: self._scrape(url))
+        try:
+            return await asyncio.wait_for(flight, timeout)
+        except asyncio.TimeoutError:
+            return timed_out(timeout, url=url)
+
+    async def _scrape(self, url: str) -> dict:
+        client = await self._get_client()
+        result, error, unavailable = await self._request(
+            self.scrape_limiter, self.scrape_breaker, lambda: client.scrape_url(url)
+        )
+        if result is None or not result.success:
+            if result is not None:
+                error = f"Scrape failed: {result.error}"
+            failed = {"error": error, "success": False, "url": url}
+            if unavailable:
+                failed.update(self._unavailable(self.scrape_breaker))
+            return failed
+
+        return {"success": True, "url": url, "data": result.data}
+
+    async def _request(self, limiter, breaker, call: Callable[[], Awaitable]) -> tuple:
+        """
+        Send an SDK request under a rate limiter, retrying throttled attempts.
+
+        Rate-limit and server errors are reported to the limiter, which
+        backs off before the retry. Without a limiter the call is made once.
+        Attempts that raise or hit a server error count as failures of the
+        circuit breaker, if given; no attempt is sent while its circuit is
+        open.
+
+        Returns:
+            Tuple of (sdk_result, error, unavailable). sdk_result is None if
+            the call raised or was refused; error holds the last error
+            message, if any; unavailable is True if the breaker refused
+            the attempt or the last attempt counted as a breaker failure.
+            Without a breaker every failure is an ordinary error.
+        """
+        result, error, endpoint_failed = None, None, False
+        for _ in range(MAX_THROTTLE_RETRIES + 1):
+            if breaker is not None and not breaker.allow():
+                retry = breaker.retry_after()
+                error = f"{breaker.name} endpoint unavailable (circuit open, retry in {retry:.0f}s)"
+                return None, error, True
+            if limiter is not None:
+                await limiter.acquire()
+
+            sent_at = time.monotonic()
+            try:
+                result = await call()
+            except Exception as e:
+                result, error = None, str(e)
+            else:
+                if result.success:
+                    if limiter is not None:
+                        limiter.on_success()
+                    if breaker is not None:
+                        breaker.on_success()
+                    return result, None, False
+                error = str(result.error)
+
+            signal = classify_error(error)
+            endpoint_failed = result is None or signal == "server_error"
+            if breaker is not None:
+                # Any other answer shows the endpoint is up
+                if endpoint_failed:
+                    if breaker.on_failure():
+                        break
+                else:
+                    breaker.on_success()
+            if limiter is None or signal is None:
+                break
+            if signal == "rate_limited":
+                limiter.on_rate_limited(sent_at=sent_at)
+            else:
+                limiter.on_server_error()
+
+        return result, error, breaker is not None and endpoint_failed
+
+    @staticmethod
+    def _unavailable(breaker) -> dict:
+        """Fields marking a failure counted by `breaker`."""
+        return {
+            "unavailable": True,
+            "circuit_open": breaker.state != CLOSED,
+            "retry_after": breaker.retry_after(),
+        }
+
+
+def timed_out(timeout: float, **fields) -> dict:
+    """Failed result of a call that ran out of time."""
+    return {"error": f"Timed out after {timeout:.1f}s", "success": False, "timed_out": True, **fields}
+
+
+@asynccontextmanager
+async def session_scope(
+    session: Optional[BrightDataSession],
+    api_key_getter: Callable[[], str],
+):
+    """
+    Yield the injected session, or a one-off session when none was given.
+
+    The API key is only read when a one-off session has to be opened.
+
+    Args:
+        session: Shared BrightDataSession, or None
+        api_key_getter: Callable returning the API key
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with BrightDataSession(api_key_getter()) as one_off:
+        yield one_off
 
 
 def country_to_location(country_code: str) -> str:
@@ -148,6 +531,7 @@ def country_to_location(country_code: str) -> str:
         country_code: 2-letter country code (e.g., "DE", "US")
 
     Returns:
-        Location name (e.g., "Germany", "United States")
+        Location name (e.g., "Germany", "United States"); codes not in
+        LOCATION_MAP are returned unchanged, which the SDK accepts as is
     """
     return LOCATION_MAP.get(country_code.upper(), country_code)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Circuit breakers for Bright Data endpoints.
+
+Used by:
+- shared-scripts/brightdata_utils.py (BrightDataSession)
+
+During a Bright Data incident every call still waits for its own failure,
+and the retries only add load to the failing endpoint. Each endpoint class
+(SERP searches, page scrapes) gets its own breaker. After a burst of
+consecutive failures its circuit opens and calls fail fast. Once the open
+period is over the circuit is half-open: one probe call at a time is let
+through. A probe that succeeds closes the circuit; one that fails opens it
+again for twice as long.
+
+Breakers live in one process; worker processes of a sharded run each
+track the endpoints on their own.
+"""
+
+import time
+from typing import Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Consecutive failed calls that open the circuit
+FAILURE_THRESHOLD = 5
+
+# First open period (seconds, doubled per failed probe)
+OPEN_SECONDS = 30.0
+MAX_OPEN_SECONDS = 300.0
+
+# Seconds callers wait while another call probes a half-open circuit
+PROBE_POLL = 1.0
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an endpoint is down, and probe it to notice recovery.
+
+    Example:
+        >>> breaker = CircuitBreaker("SERP")
+        >>> if not breaker.allow():
+        ...     return {"error": "Circuit open", "success": False}
+        >>> try:
+        ...     result = await client.search.google(...)
+        ... except Exception:
+        ...     breaker.on_failure()
+        ... else:
+        ...     breaker.on_success()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        open_seconds: float = OPEN_SECONDS,
+        max_open_seconds: float = MAX_OPEN_SECONDS,
+    ):
+        """
+        Args:
+            name: Endpoint class for messages (e.g. "SERP")
+            failure_threshold: Consecutive failures that open the circuit
+            open_seconds: How long the circuit first stays open
+            max_open_seconds: Upper bound for the doubled open period
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.failures = 0
+        self.opened_count = 0
+
+        self._open_for = open_seconds
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN or HALF_OPEN."""
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() < self._opened_at + self._open_for:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self) -> bool:
+        """
+        Decide whether a call may be sent now.
+
+        Returns:
+            True while closed, and for a single probe at a time while
+            half-open; False while open
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+
+        now = time.monotonic()
+        # A probe that never reported back (e.g. cancelled) expires
+        if self._probe_started is not None and now - self._probe_started < self._open_for:
+            return False
+        self._probe_started = now
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until a call may be allowed again (0.0 while closed)."""
+        state = self.state
+        if state == CLOSED:
+            return 0.0
+        if state == HALF_OPEN:
+            return PROBE_POLL
+        return self._opened_at + self._open_for - time.monotonic()
+
+    def on_success(self) -> None:
+        """Record a call the endpoint answered; closes the circuit."""
+        self.failures = 0
+        self._opened_at = None
+        self._probe_started = None
+        self._open_for = self.open_seconds
+
+    def on_failure(self) -> bool:
+        """
+        Record a failed call; opens the circuit after a burst of them.
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        self.failures += 1
+        state = self.state
+        if state == HALF_OPEN:
+            # Failed probe: stay away for longer
+            self._open(min(self.max_open_seconds, self._open_for * 2))
+            return True
+        if state == CLOSED and self.failures >= self.failure_threshold:
+            self.opened_count += 1
+            self._open(self.open_seconds)
+            return True
+        return False
+
+    def _open(self, seconds: float) -> None:
+        self._opened_at = time.monotonic()
+        self._open_for = seconds
+        self._probe_started = None
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Country lookup tables: ITU calling codes and country-code TLDs.
+
+Used by:
+- shared-scripts/brightdata_utils.py
+- lead-enricher/scripts/enrich.py
+
+Calling codes are compiled once into a digit trie, so a phone number
+resolves to its country by longest-prefix match ("+1 416 ..." is Canada,
+"+1 212 ..." the United States, "+420 ..." Czechia rather than Romania).
+"""
+
+from typing import Optional
+
+# ITU-T E.164 country calling codes (ISO 3166-1 alpha-2)
+CALLING_CODES = {
+    # Zone 1: North American Numbering Plan (US unless the area code says otherwise)
+    "1": "US",
+    "1242": "BS", "1246": "BB", "1264": "AI", "1268": "AG", "1284": "VG",
+    "1340": "VI", "1345": "KY", "1441": "BM", "1473": "GD", "1649": "TC",
+    "1658": "JM", "1664": "MS", "1670": "MP", "1671": "GU", "1684": "AS",
+    "1721": "SX", "1758": "LC", "1767": "DM", "1784": "VC", "1787": "PR",
+    "1809": "DO", "1829": "DO", "1849": "DO", "1868": "TT", "1869": "KN",
+    "1876": "JM", "1939": "PR",
+    # Zone 2: Africa and North Atlantic
+    "20": "EG", "211": "SS", "212": "MA", "213": "DZ", "216": "TN", "218": "LY",
+    "220": "GM", "221": "SN", "222": "MR", "223": "ML", "224": "GN", "225": "CI",
+    "226": "BF", "227": "NE", "228": "TG", "229": "BJ", "230": "MU", "231": "LR",
+    "232": "SL", "233": "GH", "234": "NG", "235": "TD", "236": "CF", "237": "CM",
+    "238": "CV", "239": "ST", "240": "GQ", "241": "GA", "242": "CG", "243": "CD",
+    "244": "AO", "245": "GW", "246": "IO", "248": "SC", "249": "SD", "250": "RW",
+    "251": "ET", "252": "SO", "253": "DJ", "254": "KE", "255": "TZ", "256": "UG",
+    "257": "BI", "258": "MZ", "260": "ZM", "261": "MG", "262": "RE", "263": "ZW",
+    "264": "NA", "265": "MW", "266": "LS", "267": "BW", "268": "SZ", "269": "KM",
+    "27": "ZA", "290": "SH", "291": "ER", "297": "AW", "298": "FO", "299": "GL",
+    # Zones 3-4: Europe
+    "30": "GR", "31": "NL", "32": "BE", "33": "FR", "34": "ES", "350": "GI",
+    "351": "PT", "352": "LU", "353": "IE", "354": "IS", "355": "AL", "356": "MT",
+    "357": "CY", "358": "FI", "359": "BG", "36": "HU", "370": "LT", "371": "LV",
+    "372": "EE", "373": "MD", "374": "AM", "375": "BY", "376": "AD", "377": "MC",
+    "378": "SM", "379": "VA", "380": "UA", "381": "RS", "382": "ME", "383": "XK",
+    "385": "HR", "386": "SI", "387": "BA", "389": "MK", "39": "IT",
+    "40": "RO", "41": "CH", "420": "CZ", "421": "SK", "423": "LI", "43": "AT",
+    "44": "GB", "45": "DK", "46": "SE", "47": "NO", "48": "PL", "49": "DE",
+    # Zone 5: Latin America
+    "500": "FK", "501": "BZ", "502": "GT", "503": "SV", "504": "HN", "505": "NI",
+    "506": "CR", "507": "PA", "508": "PM", "509": "HT", "51": "PE", "52": "MX",
+    "53": "CU", "54": "AR", "55": "BR", "56": "CL", "57": "CO", "58": "VE",
+    "590": "GP", "591": "BO", "592": "GY", "593": "EC", "594": "GF", "595": "PY",
+    "596": "MQ", "597": "SR", "598": "UY", "599": "CW",
+    # Zone 6: Southeast Asia and Oceania
+    "60": "MY", "61": "AU", "62": "ID", "63": "PH", "64": "NZ", "65": "SG",
+    "66": "TH", "670": "TL", "672": "NF", "673": "BN", "674": "NR", "675": "PG",
+    "676": "TO", "677": "SB", "678": "VU", "679": "FJ", "680": "PW", "681": "WF",
+    "682": "CK", "683": "NU", "685": "WS", "686": "KI", "687": "NC", "688": "TV",
+    "689": "PF", "690": "TK", "691": "FM", "692": "MH",
+    # Zone 7: Russia and Kazakhstan
+    "7": "RU", "76": "KZ", "77": "KZ",
+    # Zone 8: East Asia
+    "81": "JP", "82": "KR", "84": "VN", "850": "KP", "852": "HK", "853": "MO",
+    "855": "KH", "856": "LA", "86": "CN", "880": "BD", "886": "TW",
+    # Zone 9: West, Central and South Asia
+    "90": "TR", "91": "IN", "92": "PK", "93": "AF", "94": "LK", "95": "MM",
+    "960": "MV", "961": "LB", "962": "JO", "963": "SY", "964": "IQ", "965": "KW",
+    "966": "SA", "967": "YE", "968": "OM", "970": "PS", "971": "AE", "972": "IL",
+    "973": "BH", "974": "QA", "975": "BT", "976": "MN", "977": "NP", "98": "IR",
+    "992": "TJ", "993": "TM", "994": "AZ", "995": "GE", "996": "KG", "998": "UZ",
+}
+
+# Canadian area codes within NANP
+CANADA_AREA_CODES = {
+    "204", "226", "236", "249", "250", "263", "289", "306", "343", "354",
+    "365", "367", "368", "382", "403", "416", "418", "428", "431", "437",
+    "438", "450", "468", "474", "506", "514", "519", "548", "579", "581",
+    "584", "587", "604", "613", "639", "647", "672", "683", "705", "709",
+    "742", "753", "778", "780", "782", "807", "819", "825", "867", "873",
+    "879", "902", "905",
+}
+CALLING_CODES.update({"1" + area: "CA" for area in CANADA_AREA_CODES})
+
+# ccTLDs that differ from the ISO code
+CCTLD_ALIASES = {"uk": "GB"}
+
+# ccTLDs widely used as generic TLDs ("acme.io"); these only count as a
+# country under a second-level label such as "com.co"
+VANITY_TLDS = {"ac", "ai", "cc", "co", "fm", "gg", "io", "ly", "me", "sh", "to", "tv", "ws"}
+SECOND_LEVEL_LABELS = {"ac", "co", "com", "edu", "gov", "net", "org"}
+
+# Digit strings without "+" or "00" only count as international numbers
+# at these lengths (E.164 allows at most 15 digits); shorter ones are
+# usually national numbers whose leading digits look like a calling code
+MIN_INTERNATIONAL_DIGITS = 11
+MAX_INTERNATIONAL_DIGITS = 15
+
+# NANP numbers are always 1 + three-digit area code + seven digits
+NANP_DIGITS = 11
+
+_TERMINAL = ""
+
+
+def _build_trie(codes: dict[str, str]) -> dict:
+    root: dict = {}
+    for prefix, country in codes.items():
+        node = root
+        for digit in prefix:
+            node = node.setdefault(digit, {})
+        node[_TERMINAL] = country
+    return root
+
+
+_CALLING_CODE_TRIE = _build_trie(CALLING_CODES)
+
+CCTLD_COUNTRIES = {code.lower(): code for code in set(CALLING_CODES.values())}
+CCTLD_COUNTRIES.update(CCTLD_ALIASES)
+
+
+def calling_code_country(digits: str) -> Optional[str]:
+    """
+    Longest-prefix match of a digit string against the calling-code trie.
+
+    Args:
+        digits: Phone number digits starting with the country code
+
+    Returns:
+        ISO country code, or None if no calling code matches
+    """
+    node = _CALLING_CODE_TRIE
+    country = None
+    for digit in digits:
+        node = node.get(digit)
+        if node is None:
+            break
+        country = node.get(_TERMINAL, country)
+    return country
+
+
+def _plausible_international(digits: str) -> bool:
+    if digits.startswith("1"):
+        return len(digits) == NANP_DIGITS
+    return MIN_INTERNATIONAL_DIGITS <= len(digits) <= MAX_INTERNATIONAL_DIGITS
+
+
+def country_from_phone(phone: str) -> Optional[str]:
+    """
+    Detect the country of a phone number from its calling code.
+
+    "+49 30 ..." and "0049 30 ..." resolve through the calling code.
+    Digit strings stored without the "+" ("49 30 1234567") are only
+    trusted at a plausible international length, so national numbers
+    such as "(415) 555-1234" or "030 1234567" are not placed.
+
+    Returns:
+        ISO country code, or None for national or unparseable numbers
+    """
+    if not phone:
+        return None
+    stripped = phone.strip()
+    digits = "".join(c for c in stripped if c.isdigit())
+
+    if stripped.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0") or not _plausible_international(digits):
+        return None
+
+    return calling_code_country(digits)
+
+
+def country_from_domain(domain: str) -> Optional[str]:
+    """
+    Detect the country of a domain from its ccTLD.
+
+    Args:
+        domain: Host or email domain (e.g., "acme.co.uk")
+
+    Returns:
+        ISO country code, or None for generic TLDs (".com", plain ".io")
+    """
+    if not domain:
+        return None
+    labels = domain.strip().lower().rstrip(".").split(".")
+    tld = labels[-1]
+    if tld in VANITY_TLDS and not (len(labels) > 2 and labels[-2] in SECOND_LEVEL_LABELS):
+        return None
+    return CCTLD_COUNTRIES.get(tld)
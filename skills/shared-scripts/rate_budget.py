@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Rate budgets shared between worker processes.
+
+Used by:
+- lead-enricher/scripts/enrich.py (--workers)
+
+The parent hosts AdaptiveRateLimiters in a RateBudgetManager and workers
+reach them through RemoteRateLimiter, so all workers draw from one
+budget. Kept apart from rate_limiter.py because multiprocessing.managers
+is slow to import and single-process callers never need it.
+"""
+
+import asyncio
+from multiprocessing.managers import BaseManager
+from typing import Optional
+
+from rate_limiter import AdaptiveRateLimiter
+
+
+class RateBudgetManager(BaseManager):
+    """
+    Manager process hosting AdaptiveRateLimiters shared by worker processes.
+
+    Example:
+        >>> with RateBudgetManager() as manager:
+        ...     serp = manager.AdaptiveRateLimiter(DEFAULT_SERP_RATE)
+        ...     # pass `serp` to workers and wrap it in RemoteRateLimiter there
+    """
+
+
+RateBudgetManager.register("AdaptiveRateLimiter", AdaptiveRateLimiter)
+
+
+class RemoteRateLimiter:
+    """
+    Async limiter interface over an AdaptiveRateLimiter hosted by a manager.
+
+    Token requests go to the shared limiter; waits happen locally so the
+    manager is never blocked. Every call to the manager is a blocking IPC
+    round-trip, so all of them run in a thread: acquire awaits its answer,
+    while success and rate-limit feedback is queued and sent in order by a
+    background task (see flush). rate_limited_count counts this worker's
+    rate-limit responses only.
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._lock = asyncio.Lock()
+        self._feedback: Optional[asyncio.Queue] = None
+        self._sender: Optional[asyncio.Task] = None
+        self.rate_limited_count = 0
+
+    async def acquire(self) -> None:
+        """Wait until the shared budget allows a request."""
+        async with self._lock:
+            while (wait := await asyncio.to_thread(self._proxy.try_acquire)) > 0:
+                await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        self._send("on_success")
+
+    def on_rate_limited(
+        self, retry_after: Optional[float] = None, sent_at: Optional[float] = None
+    ) -> None:
+        self.rate_limited_count += 1
+        # time.monotonic() is system-wide, so sent_at is valid in the manager
+        self._send("on_rate_limited", retry_after, sent_at)
+
+    def on_server_error(self) -> None:
+        self._send("on_server_error")
+
+    async def flush(self) -> None:
+        """Wait until all queued feedback has reached the shared limiter."""
+        if self._feedback is not None:
+            await self._feedback.join()
+
+    def _send(self, method: str, *args) -> None:
+        """Queue a feedback call for the shared limiter without blocking the loop."""
+        if self._sender is None:
+            self._feedback = asyncio.Queue()
+            self._sender = asyncio.get_running_loop().create_task(self._send_feedback())
+        self._feedback.put_nowait((method, args))
+
+    async def _send_feedback(self) -> None:
+        while True:
+            method, args = await self._feedback.get()
+            try:
+                await asyncio.to_thread(getattr(self._proxy, method), *args)
+            except Exception:
+                # Feedback is advisory; a lost update only delays adaptation
+                pass
+            finally:
+                self._feedback.task_done()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Adaptive token-bucket rate limiting for Bright Data calls.
+
+Used by:
+- shared-scripts/brightdata_utils.py (BrightDataSession)
+
+Each endpoint class (SERP searches, page scrapes) gets its own limiter.
+The limiter starts at a configured rate and adapts to what the provider
+actually allows: it halves its rate and pauses with jittered exponential
+backoff when a rate-limit response comes back, and grows the rate again
+by a fraction of itself while calls succeed. Rate-limit responses to
+requests that were already in flight when the rate was cut belong to the
+same congestion event and do not cut it again.
+
+For multi-process runs see rate_budget.py, which shares limiters between
+worker processes.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Optional
+
+DEFAULT_SERP_RATE = 5.0  # requests per second
+DEFAULT_SCRAPE_RATE = 2.0
+
+# Rate may grow up to this multiple of the starting rate while calls succeed
+MAX_RATE_FACTOR = 2.0
+MIN_RATE = 0.2
+
+# Backoff after a rate-limit or server error (seconds, doubled per repeat)
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+# Successful calls needed before the rate is raised again
+RECOVERY_STREAK = 10
+RECOVERY_FACTOR = 1.25  # rate multiplier per recovery
+
+RATE_LIMIT_PATTERN = re.compile(r"\b429\b|rate.?limit|too many requests", re.IGNORECASE)
+SERVER_ERROR_PATTERN = re.compile(r"\bHTTP 5\d\d\b|service unavailable|bad gateway", re.IGNORECASE)
+
+
+def classify_error(error: str) -> Optional[str]:
+    """
+    Classify an API error message as a throttling signal.
+
+    Args:
+        error: Error message from a failed search or scrape
+
+    Returns:
+        "rate_limited", "server_error", or None for other errors
+    """
+    if not error:
+        return None
+    if RATE_LIMIT_PATTERN.search(error):
+        return "rate_limited"
+    if SERVER_ERROR_PATTERN.search(error):
+        return "server_error"
+    return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Async token bucket whose rate follows the provider's rate-limit signals.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter(rate=5.0)
+        >>> await limiter.acquire()
+        >>> sent_at = time.monotonic()
+        >>> result = await client.search.google(...)
+        >>> if classify_error(result.error) == "rate_limited":
+        ...     limiter.on_rate_limited(sent_at=sent_at)
+        ... else:
+        ...     limiter.on_success()
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        min_rate: float = MIN_RATE,
+    ):
+        self.initial_rate = rate
+        self.rate = rate
+        self.max_rate = max_rate if max_rate is not None else rate * MAX_RATE_FACTOR
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.rate_limited_count = 0
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Last rate cut and the end of its pause (one congestion event)
+        self._last_decrease = float("-inf")
+        self._decrease_paused_until = 0.0
+        self._backoff_level = 0
+        self._success_streak = 0
+        self._lock = asyncio.Lock()
+        # Guards bucket state when a manager serves several workers at once
+        self._state_lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available and no backoff pause is active.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds to wait before retrying
+        """
+        with self._state_lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent (respecting any backoff pause)."""
+        async with self._lock:
+            while (wait := self.try_acquire()) > 0:
+                await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Record a successful call; raise the rate after a streak."""
+        with self._state_lock:
+            self._backoff_level = 0
+            self._success_streak += 1
+            if self._success_streak >= RECOVERY_STREAK and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate * RECOVERY_FACTOR)
+                self._success_streak = 0
+
+    def on_rate_limited(
+        self,
+        retry_after: Optional[float] = None,
+        sent_at: Optional[float] = None,
+    ) -> float:
+        """
+        Record a rate-limit response: halve the rate and pause.
+
+        A response that arrives during the pause of the last rate cut, or
+        whose request was sent before that cut, is part of the same
+        congestion event: it does not cut the rate or grow the backoff again.
+
+        Args:
+            retry_after: Server-provided wait in seconds, if known
+            sent_at: time.monotonic() when the request was sent, if known
+
+        Returns:
+            Pause length in seconds
+        """
+        with self._state_lock:
+            self.rate_limited_count += 1
+            now = time.monotonic()
+            in_flight = sent_at is not None and sent_at <= self._last_decrease
+            if now < self._decrease_paused_until or in_flight:
+                if retry_after is not None:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                return max(0.0, self._paused_until - now)
+
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self._last_decrease = now
+            pause = self._pause(retry_after)
+            self._decrease_paused_until = self._paused_until
+            return pause
+
+    def on_server_error(self) -> float:
+        """
+        Record a transient server error: pause without cutting the rate.
+
+        Returns:
+            Pause length in seconds
+        """
+        with self._state_lock:
+            return self._pause(None)
+
+    def _pause(self, retry_after: Optional[float]) -> float:
+        self._success_streak = 0
+        if retry_after is None:
+            backoff = min(MAX_BACKOFF, BASE_BACKOFF * (2 ** self._backoff_level))
+            # Jitter so concurrent workers do not retry in lockstep
+            retry_after = backoff * (0.5 + random.random())
+            self._backoff_level += 1
+
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        return retry_after
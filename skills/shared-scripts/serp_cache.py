@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for Bright Data SERP responses.
+
+Used by:
+- shared-scripts/serp_search.py
+- lead-enricher/scripts/enrich.py
+
+Responses are stored in a SQLite database keyed on
+(query, location, language, num_results). Entries expire after a TTL and
+the least recently used entries are evicted once the database grows past
+a size limit.
+
+ScrapeCache keeps data extracted from scraped pages (e.g. LinkedIn company
+facts) in the same database, keyed by canonical URL, with a TTL in weeks.
+
+Responses the caller marks as negative (the search ran but found nothing
+usable, e.g. no LinkedIn page for a sole trader) expire after a separate,
+shorter TTL, so they are retried sooner than positive hits.
+
+Cache hits never write: access times are kept in memory and written with
+the next put, eviction or close, so a hit does not wait on the database
+lock held by another worker process.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".claude" / "serp-cache"
+CACHE_FILENAME = "serp_cache.sqlite3"
+DEFAULT_TTL_DAYS = 7.0
+DEFAULT_NEGATIVE_TTL_DAYS = 1.0
+DEFAULT_SCRAPE_TTL_DAYS = 28.0
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200 MB of cached payloads
+
+# Check the size limit every N writes instead of on every write
+EVICTION_CHECK_INTERVAL = 100
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def make_cache_key(query: str, location: str, language: str, num_results: int) -> str:
+    """
+    Build a stable cache key for a SERP request.
+
+    Args:
+        query: Search query string
+        location: Location name (e.g., "Germany")
+        language: Language code
+        num_results: Number of results requested
+
+    Returns:
+        Hex digest identifying the request
+    """
+    raw = json.dumps([query, location, language, int(num_results)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SerpCache:
+    """
+    SQLite-backed SERP response cache with TTL and size-based eviction.
+
+    Example:
+        >>> cache = SerpCache(ttl_days=7)
+        >>> key = cache.make_key('"Acme"', "Germany", "de", 10)
+        >>> cache.put(key, [{"title": "Acme", "url": "https://acme.de", "snippet": ""}])
+        >>> cache.get(key)
+        [{'title': 'Acme', 'url': 'https://acme.de', 'snippet': ''}]
+        >>> cache.put(other_key, [], negative=True)  # expires after negative_ttl_days
+    """
+
+    make_key = staticmethod(make_cache_key)
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        negative_ttl_days: float = DEFAULT_NEGATIVE_TTL_DAYS,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl_days * SECONDS_PER_DAY
+        self.negative_ttl = negative_ttl_days * SECONDS_PER_DAY
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._writes = 0
+        # Access times of hits not yet written (key -> time)
+        self._accessed: dict[str, float] = {}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / CACHE_FILENAME
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS serp_responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                negative INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(serp_responses)")}
+        if "negative" not in columns:
+            # Databases created before negative caching
+            self._conn.execute(
+                "ALTER TABLE serp_responses ADD COLUMN negative INTEGER NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_serp_accessed ON serp_responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[list]:
+        """
+        Return cached results for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            List of result dicts, or None
+        """
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT payload, created_at, negative FROM serp_responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or now - row[1] > (self.negative_ttl if row[2] else self.ttl):
+            self.misses += 1
+            return None
+
+        self._accessed[key] = now
+        self.hits += 1
+        if row[2]:
+            self.negative_hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, results: list, negative: bool = False) -> None:
+        """
+        Store results for a key, replacing any existing entry.
+
+        Args:
+            key: Cache key from make_cache_key
+            results: List of result dicts
+            negative: Results held nothing usable; expire after negative_ttl
+        """
+        now = time.time()
+        payload = json.dumps(results, ensure_ascii=False)
+        self._write_accessed()
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO serp_responses
+                (key, payload, size, created_at, accessed_at, negative)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (key, payload, len(payload), now, now, int(negative)),
+        )
+        self._conn.commit()
+
+        self._writes += 1
+        if self._writes % EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then least recently used ones over the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        # Recency decides what goes, so pending access times count
+        self._write_accessed()
+        removed = self._conn.execute(
+            """
+            DELETE FROM serp_responses
+            WHERE (negative = 0 AND created_at < ?) OR (negative = 1 AND created_at < ?)
+            """,
+            (now - self.ttl, now - self.negative_ttl),
+        ).rowcount
+
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM serp_responses"
+        ).fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            freed = 0
+            stale_keys = []
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM serp_responses ORDER BY accessed_at ASC"
+            ):
+                if freed >= excess:
+                    break
+                stale_keys.append((key,))
+                freed += size
+            self._conn.executemany("DELETE FROM serp_responses WHERE key = ?", stale_keys)
+            removed += len(stale_keys)
+
+        self._conn.commit()
+        return removed
+
+    def _write_accessed(self) -> None:
+        """Write pending access times; the caller commits."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE serp_responses SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0-1)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for run summaries."""
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+    def close(self) -> None:
+        """Write pending access times and close the database connection."""
+        if self._accessed:
+            try:
+                self._write_accessed()
+                self._conn.commit()
+            except sqlite3.OperationalError:
+                # Database locked for too long; recency is only a hint
+                pass
+        self._conn.close()
+
+
+class ScrapeCache:
+    """
+    SQLite-backed cache of data extracted from scraped pages, keyed by URL.
+
+    Shares the database file with SerpCache; expired entries are dropped
+    periodically.
+
+    Example:
+        >>> cache = ScrapeCache(ttl_days=28)
+        >>> cache.put("https://www.linkedin.com/company/acme", {"employee_count": "51-200"})
+        >>> cache.get("https://www.linkedin.com/company/acme")
+        {'employee_count': '51-200'}
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: float = DEFAULT_SCRAPE_TTL_DAYS,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl_days * SECONDS_PER_DAY
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / CACHE_FILENAME
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scraped_pages (
+                url TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Return cached data for a URL, or None if missing or expired.
+
+        Args:
+            url: Canonical page URL
+
+        Returns:
+            Extracted data dict, or None
+        """
+        row = self._conn.execute(
+            "SELECT payload, created_at FROM scraped_pages WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url: str, data: dict) -> None:
+        """
+        Store extracted data for a URL, replacing any existing entry.
+
+        Args:
+            url: Canonical page URL
+            data: JSON-serializable extracted data
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scraped_pages (url, payload, created_at) VALUES (?, ?, ?)",
+            (url, json.dumps(data, ensure_ascii=False), time.time()),
+        )
+        self._conn.commit()
+
+        self._writes += 1
+        if self._writes % EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = self._conn.execute(
+            "DELETE FROM scraped_pages WHERE created_at < ?", (time.time() - self.ttl,)
+        ).rowcount
+        self._conn.commit()
+        return removed
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for run summaries."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Local Unix-socket daemon for serp_search.py.
+
+Used by:
+- shared-scripts/serp_search.py (--serve, and forwarding of CLI calls)
+
+Skills run serp_search.py once per query, so every call pays interpreter
+startup, the SDK import, config reading and a fresh client. With
+`serp_search.py --serve` running, one process keeps a warm client, the
+SERP cache and the rate limiter; later serp_search.py calls send their
+command to it and print its answer. When no daemon is listening the
+caller runs the search itself.
+
+Protocol: the client connects, writes one JSON object on a line and reads
+one JSON value on a line back. A `null` answer means the daemon declined
+the request and the client should run it in-process.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+DEFAULT_SOCKET = Path.home() / ".claude" / "serp-search.sock"
+
+# Seconds to wait for a daemon to accept a connection
+CONNECT_TIMEOUT = 1.0
+# Upper bound for one message (batch results can be large)
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+async def forward(socket_path: Path, request: dict) -> Optional[dict]:
+    """
+    Send a request to a running daemon.
+
+    Returns:
+        The daemon's response, or None if no daemon is listening on
+        `socket_path` or it declined the request
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(str(socket_path), limit=MAX_MESSAGE_BYTES),
+            CONNECT_TIMEOUT,
+        )
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+    except OSError:
+        return None
+    finally:
+        writer.close()
+
+    # Empty when the daemon exited mid-request
+    return json.loads(line) if line else None
+
+
+async def is_listening(socket_path: Path) -> bool:
+    """True if a daemon accepts connections on `socket_path`."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(str(socket_path)), CONNECT_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def serve(
+    socket_path: Path,
+    handler: Callable[[dict], Awaitable[Optional[dict]]],
+    stop: Optional[asyncio.Event] = None,
+    ready: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Answer requests with `handler` until `stop` is set.
+
+    Requests are handled concurrently. A stale socket file left by a
+    crashed daemon is replaced; the socket is only accessible to the
+    current user and removed on exit.
+
+    Args:
+        socket_path: Unix socket to listen on
+        handler: Coroutine mapping a request to its response (None to decline)
+        stop: Event ending the server (default: SIGINT or SIGTERM)
+        ready: Called once the socket accepts connections
+
+    Raises:
+        RuntimeError: If another daemon is listening on `socket_path`
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        if await is_listening(socket_path):
+            raise RuntimeError(f"serp_search daemon already running on {socket_path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                response = await handler(json.loads(line))
+            except Exception as e:
+                response = {"error": str(e), "success": False}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        except (OSError, ValueError):
+            # Client went away, or sent more than MAX_MESSAGE_BYTES
+            pass
+        finally:
+            writer.close()
+
+    loop = asyncio.get_running_loop()
+    signals = ()
+    if stop is None:
+        stop = asyncio.Event()
+        signals = (signal.SIGINT, signal.SIGTERM)
+        for sig in signals:
+            loop.add_signal_handler(sig, stop.set)
+
+    server = await asyncio.start_unix_server(
+        handle, path=str(socket_path), limit=MAX_MESSAGE_BYTES
+    )
+    try:
+        os.chmod(socket_path, 0o600)
+        if ready is not None:
+            ready()
+        async with server:
+            await stop.wait()
+    finally:
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+        socket_path.unlink(missing_ok=True)
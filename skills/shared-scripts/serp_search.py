@@ -27,6 +27,14 @@ Usage Examples:
   # Batch search (JSON queries)
   python3 serp_search.py --batch '["query1", "query2"]' "US" "en" "10"
 
+  # Bypass the on-disk SERP cache (~/.claude/serp-cache/)
+  python3 serp_search.py --no-cache "cleaning robot distributor France" "FR" "fr" "20"
+
+  # Keep a warm client, cache and rate limiter in a daemon
+  # (~/.claude/serp-search.sock); the commands above are forwarded to it
+  # while it runs and executed in-process otherwise (or with --no-daemon)
+  python3 serp_search.py --serve &
+
 Output:
   JSON to stdout with results or error
 """
@@ -35,18 +43,32 @@ import argparse
 import asyncio
 import json
 import sys
+from importlib.util import find_spec
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
-from brightdata_utils import get_api_key, country_to_location
+from brightdata_utils import (
+    BrightDataSession,
+    country_to_location,
+    get_api_key,
+    session_scope,
+)
+from rate_limiter import DEFAULT_SERP_RATE, AdaptiveRateLimiter
+from serp_cache import DEFAULT_CACHE_DIR, DEFAULT_TTL_DAYS, SerpCache
+from serp_daemon import DEFAULT_SOCKET, forward, serve
+
+# Parsed arguments that select and parameterize a search (see run_command)
+COMMAND_FIELDS = (
+    "query", "country", "language", "num_results", "batch",
+    "linkedin_company", "linkedin_person", "skill",
+)
 
 
 def ensure_sdk_installed():
-    """Ensure brightdata-sdk is installed."""
-    try:
-        import brightdata
-    except ImportError:
+    """Ensure brightdata-sdk is installed (without importing it)."""
+    if find_spec("brightdata") is None:
         print(
             json.dumps(
                 {
@@ -65,6 +87,7 @@ async def search_google(
     language: str = "en",
     num_results: int = 20,
     skill_name: str = "lead-enricher",
+    session: Optional[BrightDataSession] = None,
 ) -> dict:
     """
     Search Google using Bright Data SERP API.
@@ -75,68 +98,32 @@ async def search_google(
         language: Language code (default: en)
         num_results: Number of results to return (default: 20)
         skill_name: Skill name for config lookup (default: lead-enricher)
+        session: Shared BrightDataSession (default: open a one-off session)
 
     Returns:
         Dict with search results or error
     """
-    try:
-        from brightdata import BrightDataClient
-    except ImportError:
-        return {
-            "error": "brightdata-sdk not installed. Run: pip install brightdata-sdk",
-            "success": False,
-            "query": query,
-        }
-
-    try:
-        api_key = get_api_key(skill_name)
-    except ValueError as e:
-        return {"error": str(e), "success": False, "query": query}
-
     location = country_to_location(country_code)
 
     try:
-        async with BrightDataClient(
-            token=api_key,
-            validate_token=False,
-            auto_create_zones=False,
-        ) as client:
-            results = await client.search.google(
-                query=query,
-                location=location,
-                language=language,
-                num_results=num_results,
-            )
-
-            if not results.success:
-                return {
-                    "error": f"Search failed: {results.error}",
-                    "success": False,
-                    "query": query,
-                }
-
-            mapped_results = []
-            for item in results.data:
-                mapped_results.append(
-                    {
-                        "title": item.get("title", ""),
-                        "url": item.get("url", ""),
-                        "snippet": item.get("description", ""),
-                    }
-                )
-
-            return {
-                "success": True,
-                "query": query,
-                "country": country_code,
-                "language": language,
-                "count": len(mapped_results),
-                "results": mapped_results,
-            }
-
+        async with session_scope(session, lambda: get_api_key(skill_name)) as active:
+            result = await active.search(query, location, language, num_results)
     except Exception as e:
         return {"error": str(e), "success": False, "query": query}
 
+    if not result.get("success"):
+        return result
+
+    mapped_results = result["results"]
+    return {
+        "success": True,
+        "query": query,
+        "country": country_code,
+        "language": language,
+        "count": len(mapped_results),
+        "results": mapped_results,
+    }
+
 
 async def search_linkedin_company(
     company_name: str,
@@ -144,6 +131,7 @@ async def search_linkedin_company(
     language: str = "en",
     num_results: int = 10,
     skill_name: str = "lead-enricher",
+    session: Optional[BrightDataSession] = None,
 ) -> dict:
     """
     Search for company's LinkedIn page.
@@ -154,12 +142,15 @@ async def search_linkedin_company(
         language: Language code
         num_results: Number of results to return
         skill_name: Skill name for config lookup
+        session: Shared BrightDataSession (optional)
 
     Returns:
         Dict with LinkedIn URL or error
     """
     query = f'"{company_name}" site:linkedin.com/company'
-    result = await search_google(query, country_code, language, num_results, skill_name)
+    result = await search_google(
+        query, country_code, language, num_results, skill_name, session=session
+    )
 
     if not result.get("success"):
         return result
@@ -188,6 +179,7 @@ async def search_linkedin_person(
     country_code: str = "DE",
     language: str = "en",
     skill_name: str = "lead-enricher",
+    session: Optional[BrightDataSession] = None,
 ) -> dict:
     """
     Search for person's LinkedIn profile.
@@ -198,12 +190,15 @@ async def search_linkedin_person(
         country_code: 2-letter country code
         language: Language code
         skill_name: Skill name for config lookup
+        session: Shared BrightDataSession (optional)
 
     Returns:
         Dict with LinkedIn URL or error
     """
     query = f'"{full_name}" "{company_name}" site:linkedin.com/in'
-    result = await search_google(query, country_code, language, 5, skill_name)
+    result = await search_google(
+        query, country_code, language, 5, skill_name, session=session
+    )
 
     if not result.get("success"):
         return result
@@ -234,9 +229,10 @@ async def search_batch(
     language: str = "en",
     num_results: int = 20,
     skill_name: str = "lead-enricher",
+    session: Optional[BrightDataSession] = None,
 ) -> dict:
     """
-    Search multiple queries in parallel.
+    Search multiple queries in parallel over one shared session.
 
     Args:
         queries: List of search queries
@@ -244,15 +240,22 @@ async def search_batch(
         language: Language code (default: en)
         num_results: Number of results per query (default: 20)
         skill_name: Skill name for config lookup
+        session: Shared BrightDataSession (default: open one for the batch)
 
     Returns:
         Dict with all search results
     """
-    tasks = [
-        search_google(q, country_code, language, num_results, skill_name)
-        for q in queries
-    ]
-    all_results = await asyncio.gather(*tasks)
+    try:
+        async with session_scope(session, lambda: get_api_key(skill_name)) as shared:
+            tasks = [
+                search_google(
+                    q, country_code, language, num_results, skill_name, session=shared
+                )
+                for q in queries
+            ]
+            all_results = await asyncio.gather(*tasks)
+    except Exception as e:
+        all_results = [{"error": str(e), "success": False, "query": q} for q in queries]
 
     return {
         "success": True,
@@ -282,6 +285,9 @@ Examples:
 
   # Batch search
   %(prog)s --batch '["query1", "query2"]' "US" "en" "10"
+
+  # Keep a warm daemon; later calls are forwarded to it
+  %(prog)s --serve &
         """,
     )
 
@@ -320,59 +326,214 @@ Examples:
         help="Skill name for config lookup (default: lead-enricher)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"SERP cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        metavar="DAYS",
+        help=f"Reuse cached results younger than this (default: {DEFAULT_TTL_DAYS:g} days)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Bright Data, ignoring the SERP cache",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a daemon answering serp_search.py calls over a Unix socket",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET,
+        help=f"Daemon socket path (default: {DEFAULT_SOCKET})",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in this process even if a daemon is running",
+    )
+
     args = parser.parse_args()
 
-    # Batch mode
+    if args.serve:
+        await serve_daemon(args)
+        return
+
     if args.batch:
         try:
-            queries = json.loads(args.batch)
+            args.batch = json.loads(args.batch)
         except json.JSONDecodeError:
             print(json.dumps({"error": "Invalid JSON for queries", "success": False}))
             sys.exit(1)
+    elif not (args.linkedin_company or args.linkedin_person or args.query):
+        print(
+            json.dumps(
+                {
+                    "error": "Usage: serp_search.py <query> [country] [language] [num_results]",
+                    "example": 'python serp_search.py "cleaning robot distributor" "FR" "fr" "20"',
+                }
+            )
+        )
+        sys.exit(1)
+
+    result = None
+    if not args.no_daemon:
+        result = await forward(args.socket, daemon_request(args))
+    if result is None:
+        result = await run_locally(args)
+
+    print(json.dumps(result, indent=2))
+
+
+async def run_locally(args: argparse.Namespace) -> dict:
+    """Run the search selected by parsed CLI arguments in this process."""
+    cache = None if args.no_cache else SerpCache(args.cache_dir, args.cache_ttl)
+    try:
+        async with BrightDataSession(
+            get_api_key(args.skill),
+            cache=cache,
+            serp_limiter=AdaptiveRateLimiter(DEFAULT_SERP_RATE),
+        ) as session:
+            return await run_command(args, session)
+    except Exception as e:
+        return {"error": str(e), "success": False}
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def cache_settings(args: argparse.Namespace) -> Optional[dict]:
+    """SERP cache a CLI call uses (None for --no-cache); the daemon must match it."""
+    if args.no_cache:
+        return None
+    return {"dir": str(Path(args.cache_dir).expanduser().resolve()), "ttl_days": args.cache_ttl}
+
+
+def daemon_request(args: argparse.Namespace) -> dict:
+    """Request sent to the daemon for parsed CLI arguments."""
+    return {
+        "command": {field: getattr(args, field) for field in COMMAND_FIELDS},
+        "cache": cache_settings(args),
+    }
+
+
+class SearchDaemon:
+    """
+    State kept warm by --serve: the SERP cache, one rate limiter and one
+    open session per API key, shared by all forwarded calls.
+
+    Calls made with different cache settings than the daemon's are
+    declined, so the caller runs them in-process.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.cache_settings = cache_settings(args)
+        self.cache = None if args.no_cache else SerpCache(args.cache_dir, args.cache_ttl)
+        self.limiter = AdaptiveRateLimiter(DEFAULT_SERP_RATE)
+        self.api_keys: dict[str, str] = {}
+        self.sessions: dict[str, BrightDataSession] = {}
+        self._stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    async def handle(self, request: dict) -> Optional[dict]:
+        """Run a forwarded call; None to decline it."""
+        if request.get("cache") != self.cache_settings:
+            return None
+        command = argparse.Namespace(**request["command"])
+        session = await self.session_for(command.skill)
+        return await run_command(command, session)
+
+    async def session_for(self, skill: str) -> BrightDataSession:
+        """Open session for the API key configured for `skill`."""
+        async with self._lock:
+            api_key = self.api_keys.get(skill)
+            if api_key is None:
+                api_key = get_api_key(skill)
+                if api_key:
+                    # Unconfigured skills are looked up again next time
+                    self.api_keys[skill] = api_key
+            session = self.sessions.get(api_key)
+            if session is None:
+                session = BrightDataSession(
+                    api_key, cache=self.cache, serp_limiter=self.limiter
+                )
+                await self._stack.enter_async_context(session)
+                self.sessions[api_key] = session
+            return session
+
+    async def close(self) -> None:
+        await self._stack.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
 
-        result = await search_batch(
-            queries, args.country, args.language, args.num_results, args.skill
+async def serve_daemon(args: argparse.Namespace) -> None:
+    """Run the --serve daemon until interrupted."""
+    daemon = SearchDaemon(args)
+    try:
+        await serve(
+            args.socket,
+            daemon.handle,
+            ready=lambda: print(f"serp_search daemon listening on {args.socket}", file=sys.stderr),
+        )
+    except RuntimeError as e:
+        print(json.dumps({"error": str(e), "success": False}), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        await daemon.close()
+
+
+async def run_command(args: argparse.Namespace, session: BrightDataSession) -> dict:
+    """
+    Run the search selected by parsed CLI arguments on a shared session.
+
+    Args:
+        args: Parsed arguments (batch already decoded to a list)
+        session: Open BrightDataSession
+
+    Returns:
+        Result dict to print as JSON
+    """
+    # Batch mode
+    if args.batch:
+        return await search_batch(
+            args.batch, args.country, args.language, args.num_results, args.skill,
+            session=session,
         )
-        print(json.dumps(result, indent=2))
-        return
 
     # LinkedIn company search
     if args.linkedin_company:
-        result = await search_linkedin_company(
+        return await search_linkedin_company(
             args.linkedin_company,
             args.country,
             args.language,
             args.num_results,
             args.skill,
+            session=session,
         )
-        print(json.dumps(result, indent=2))
-        return
 
     # LinkedIn person search
     if args.linkedin_person:
         full_name, company_name = args.linkedin_person
-        result = await search_linkedin_person(
-            full_name, company_name, args.country, args.language, args.skill
+        return await search_linkedin_person(
+            full_name, company_name, args.country, args.language, args.skill,
+            session=session,
         )
-        print(json.dumps(result, indent=2))
-        return
 
     # General web search
-    if not args.query:
-        print(
-            json.dumps(
-                {
-                    "error": "Usage: serp_search.py <query> [country] [language] [num_results]",
-                    "example": 'python serp_search.py "cleaning robot distributor" "FR" "fr" "20"',
-                }
-            )
-        )
-        sys.exit(1)
-
-    result = await search_google(
-        args.query, args.country, args.language, args.num_results, args.skill
+    return await search_google(
+        args.query, args.country, args.language, args.num_results, args.skill,
+        session=session,
     )
-    print(json.dumps(result, indent=2))
 
 
 if __name__ == "__main__":
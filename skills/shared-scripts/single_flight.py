@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Collapse concurrent identical async calls into one in-flight call.
+
+Used by:
+- shared-scripts/brightdata_utils.py (BrightDataSession)
+
+While a call for a key is running, later callers for the same key wait for
+that call and share its result instead of issuing their own. Once it
+finishes the key is forgotten; caching finished results is left to the
+caches.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of concurrent coroutine calls.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> results = await asyncio.gather(
+        ...     flights.do(url, lambda: fetch(url)),
+        ...     flights.do(url, lambda: fetch(url)),  # waits for the first fetch
+        ... )
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() for a key, or join the call already running for it.
+
+        A waiter that is cancelled does not cancel the shared call for the
+        other waiters.
+
+        Args:
+            key: Identifies equivalent calls
+            factory: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            Result of the shared call (exceptions propagate to every waiter)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved if every waiter went away
+            task.exception()
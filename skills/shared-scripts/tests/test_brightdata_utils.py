@@ -5,12 +5,28 @@ import json
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from brightdata_utils import get_api_key, country_to_location, LOCATION_MAP
+from brightdata_utils import (
+    BrightDataSession,
+    get_api_key,
+    country_to_location,
+    session_scope,
+    LOCATION_MAP,
+)
+
+
+def make_mock_client(results=None, scrape_result=None):
+    """Build a mocked BrightDataClient usable as an async context manager."""
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.search.google = AsyncMock(return_value=results)
+    mock_client.scrape_url = AsyncMock(return_value=scrape_result)
+    return mock_client
 
 
 class TestGetApiKey:
@@ -136,4 +152,257 @@ class TestLocationMapCompleteness:
         """Tier 2 countries should be in the map."""
         tier2 = ["AT", "NL", "BE", "ES", "SE", "PL", "IE", "SG", "TH", "MY", "AU", "NZ", "AE", "US", "CA"]
         for country in tier2:
-            assert country in LOCATION_MAP, f"Tier 2 country {country} missing from LOCATION_MAP"
\ No newline at end of file
+            assert country in LOCATION_MAP, f"Tier 2 country {country} missing from LOCATION_MAP"
+
+
+class TestBrightDataSession:
+    """Tests for the long-lived BrightDataSession."""
+
+    @pytest.mark.asyncio
+    async def test_search_maps_results(self):
+        """Search results are mapped to title/url/snippet."""
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = [
+            {"title": "Acme", "url": "https://acme.de", "description": "Acme GmbH"},
+        ]
+        mock_client = make_mock_client(results=mock_results)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                result = await session.search('"Acme"', "Germany", "de", 10)
+
+        assert result["success"] is True
+        assert result["results"] == [
+            {"title": "Acme", "url": "https://acme.de", "snippet": "Acme GmbH"},
+        ]
+        mock_client.search.google.assert_awaited_once_with(
+            query='"Acme"', location="DE", language="de", num_results=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_passes_iso_code_to_sdk(self):
+        """Location names the SDK does not know are sent as ISO codes."""
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = []
+        mock_client = make_mock_client(results=mock_results)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                await session.search("q", "Austria")
+                await session.search("q", "LU")
+
+        locations = [c.kwargs["location"] for c in mock_client.search.google.await_args_list]
+        assert locations == ["AT", "LU"]
+
+    @pytest.mark.asyncio
+    async def test_one_client_for_many_calls(self):
+        """All calls on a session reuse the same client."""
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = []
+        mock_client = make_mock_client(results=mock_results)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client) as client_cls:
+            async with BrightDataSession("test_key") as session:
+                for i in range(5):
+                    await session.search(f"query {i}", "Germany")
+
+        assert client_cls.call_count == 1
+        assert mock_client.search.google.await_count == 5
+        mock_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scrape_failure_returns_error(self):
+        """Failed scrapes return success=False with the SDK error."""
+        scrape_result = MagicMock()
+        scrape_result.success = False
+        scrape_result.error = "blocked"
+        mock_client = make_mock_client(scrape_result=scrape_result)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                result = await session.scrape("https://linkedin.com/company/acme")
+
+        assert result["success"] is False
+        assert "blocked" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_session_scope_reuses_injected_session(self):
+        """session_scope yields the injected session without reading a key."""
+        session = BrightDataSession("test_key")
+        api_key_getter = MagicMock(return_value="unused")
+
+        async with session_scope(session, api_key_getter) as active:
+            assert active is session
+
+        api_key_getter.assert_not_called()
+
+
+class TestSearchCoalescing:
+    """Identical in-flight searches share a single request."""
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_collapse(self):
+        import asyncio
+
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = [{"title": "Acme", "url": "https://acme.de", "description": ""}]
+        mock_client = make_mock_client(results=mock_results)
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(0.02)
+            return mock_results
+
+        mock_client.search.google = AsyncMock(side_effect=slow_search)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                results = await asyncio.gather(
+                    session.search('"Acme"', "Germany", "de", 10),
+                    session.search('"Acme"', "Germany", "de", 10),
+                    session.search('"Acme"', "Germany", "de", 5),
+                )
+                later = await session.search('"Acme"', "Germany", "de", 10)
+
+        # Two distinct in-flight requests, plus one after the first finished
+        assert mock_client.search.google.await_count == 3
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert later["success"] is True
+        assert session.search_flights.shared == 1
+
+
+class TestScrapeDeduplication:
+    """Concurrent scrapes of one URL share a single request."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scrapes_collapse(self):
+        import asyncio
+
+        scrape_result = MagicMock()
+        scrape_result.success = True
+        scrape_result.data = "<html></html>"
+        mock_client = make_mock_client(scrape_result=scrape_result)
+
+        async def slow_scrape(url):
+            await asyncio.sleep(0.02)
+            return scrape_result
+
+        mock_client.scrape_url = AsyncMock(side_effect=slow_scrape)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                results = await asyncio.gather(
+                    *(session.scrape("https://www.linkedin.com/company/acme") for _ in range(3)),
+                    session.scrape("https://www.linkedin.com/company/other"),
+                )
+
+        assert mock_client.scrape_url.await_count == 2
+        assert all(r["success"] for r in results)
+        assert session.scrape_flights.shared == 2
+
+
+class TestCallTimeout:
+    """A timed-out caller gives up without cancelling the shared call."""
+
+    @pytest.mark.asyncio
+    async def test_timed_out_search_leaves_shared_call_running(self):
+        import asyncio
+
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = [{"title": "Acme", "url": "https://acme.de", "description": ""}]
+        mock_client = make_mock_client(results=mock_results)
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(0.05)
+            return mock_results
+
+        mock_client.search.google = AsyncMock(side_effect=slow_search)
+
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key") as session:
+                hurried, patient = await asyncio.gather(
+                    session.search('"Acme"', "Germany", "de", 10, timeout=0.01),
+                    session.search('"Acme"', "Germany", "de", 10),
+                )
+                scraped = await session.scrape("https://www.linkedin.com/company/acme", timeout=0)
+
+        assert hurried["success"] is False
+        assert hurried["timed_out"] is True
+        assert hurried["query"] == '"Acme"'
+        assert patient["success"] is True
+        assert mock_client.search.google.await_count == 1
+        assert scraped["timed_out"] is True
+
+
+class TestCreateClient:
+    """Tests for create_client."""
+
+    @pytest.mark.asyncio
+    async def test_base_url_override(self, monkeypatch):
+        """BRIGHTDATA_BASE_URL points every SDK service at another server."""
+        pytest.importorskip("brightdata")
+        from brightdata_utils import create_client
+
+        monkeypatch.setenv("BRIGHTDATA_BASE_URL", "http://127.0.0.1:8765/")
+        client = await create_client("test-api-key-0123456789")
+
+        assert client.engine.BASE_URL == "http://127.0.0.1:8765"
+
+    @pytest.mark.asyncio
+    async def test_default_base_url(self, monkeypatch):
+        pytest.importorskip("brightdata")
+        from brightdata.core.engine import AsyncEngine
+        from brightdata_utils import create_client
+
+        monkeypatch.delenv("BRIGHTDATA_BASE_URL", raising=False)
+        client = await create_client("test-api-key-0123456789")
+
+        assert client.engine.BASE_URL == AsyncEngine.BASE_URL
+
+
+    @pytest.mark.asyncio
+    async def test_warns_when_base_url_cannot_be_set(self, monkeypatch):
+        pytest.importorskip("brightdata")
+        from types import SimpleNamespace
+        from brightdata_utils import create_client
+
+        monkeypatch.setenv("BRIGHTDATA_BASE_URL", "http://127.0.0.1:8765/")
+        with patch("brightdata.BrightDataClient", return_value=SimpleNamespace()):
+            with pytest.warns(RuntimeWarning, match="BASE_URL"):
+                await create_client("test-api-key-0123456789")
+
+
+class TestEnableKeepalive:
+    """Tests for enable_keepalive."""
+
+    @pytest.mark.asyncio
+    async def test_warns_without_sdk_session(self):
+        from types import SimpleNamespace
+        from brightdata_utils import enable_keepalive
+
+        with pytest.warns(RuntimeWarning, match="engine._session"):
+            await enable_keepalive(SimpleNamespace(engine=SimpleNamespace()))
+
+    @pytest.mark.asyncio
+    async def test_replaces_force_close_connector(self):
+        """A force-close session is swapped for a keep-alive pool."""
+        import aiohttp
+        from brightdata_utils import enable_keepalive
+
+        client = MagicMock()
+        client.engine._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(force_close=True),
+            headers={"Authorization": "Bearer test"},
+        )
+
+        await enable_keepalive(client)
+        session = client.engine._session
+
+        assert session.connector.force_close is False
+        assert session.headers["Authorization"] == "Bearer test"
+        await session.close()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Unit tests for circuit_breaker.py and its use in BrightDataSession."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import circuit_breaker
+from brightdata_utils import BrightDataSession
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for circuit_breaker."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker("SERP", failure_threshold=3, open_seconds=30)
+        breaker.on_failure()
+        breaker.on_failure()
+        breaker.on_success()
+        for _ in range(2):
+            assert breaker.on_failure() is False
+        assert breaker.state == CLOSED
+
+        assert breaker.on_failure() is True
+
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after() == 30
+        assert breaker.opened_count == 1
+
+    def test_half_open_lets_one_probe_through(self, clock):
+        breaker = CircuitBreaker("SERP", failure_threshold=1, open_seconds=30)
+        breaker.on_failure()
+        clock.value += 30
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.on_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_doubles_open_period(self, clock):
+        breaker = CircuitBreaker("SERP", failure_threshold=1, open_seconds=30, max_open_seconds=50)
+        breaker.on_failure()
+        clock.value += 30
+        assert breaker.allow()
+
+        breaker.on_failure()
+        assert breaker.state == OPEN
+        assert breaker.retry_after() == 50
+
+        clock.value += 50
+        breaker.on_success()
+        breaker.on_failure()
+        # Closing resets the open period
+        assert breaker.retry_after() == 30
+
+    def test_lost_probe_expires(self, clock):
+        breaker = CircuitBreaker("scrape", failure_threshold=1, open_seconds=10)
+        breaker.on_failure()
+        clock.value += 10
+        assert breaker.allow()
+
+        clock.value += 10
+        assert breaker.allow()
+
+
+class TestSessionCircuitBreaker:
+    """BrightDataSession stops calling a failing endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_while_open_and_recovers(self, clock):
+        ok = MagicMock(success=True, data=[{"title": "Acme", "url": "https://acme.de", "description": ""}])
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(side_effect=[OSError("Cannot connect to host")] * 3 + [ok])
+        mock_client.scrape_url = AsyncMock(return_value=MagicMock(success=True, data="<html></html>"))
+
+        serp_breaker = CircuitBreaker("SERP", failure_threshold=3, open_seconds=30)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession(
+                "test_key", serp_breaker=serp_breaker, scrape_breaker=CircuitBreaker("scrape")
+            ) as session:
+                failed = [await session.search(f'"Acme {i}"', "Germany") for i in range(5)]
+                scraped = await session.scrape("https://www.linkedin.com/company/acme")
+                clock.value += 30
+                recovered = await session.search('"Acme"', "Germany")
+
+        assert mock_client.search.google.await_count == 4
+        # Every endpoint failure is unavailable; only the later ones see the open circuit
+        assert [r["unavailable"] for r in failed] == [True] * 5
+        assert [r["circuit_open"] for r in failed] == [False, False, True, True, True]
+        assert "Cannot connect" in failed[0]["error"]
+        assert "circuit open" in failed[-1]["error"]
+        assert failed[-1]["retry_after"] == 30
+        # The scrape endpoint has its own breaker
+        assert scraped["success"] is True
+        assert recovered["success"] is True
+        assert serp_breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, clock):
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(
+            return_value=MagicMock(success=False, error="HTTP 401: invalid token")
+        )
+
+        serp_breaker = CircuitBreaker("SERP", failure_threshold=2)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", serp_breaker=serp_breaker) as session:
+                results = [await session.search('"Acme"', "Germany") for _ in range(3)]
+
+        assert mock_client.search.google.await_count == 3
+        assert not any(r.get("unavailable") for r in results)
+        assert serp_breaker.state == CLOSED
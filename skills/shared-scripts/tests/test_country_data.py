@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Unit tests for calling-code and ccTLD country lookup."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from country_data import calling_code_country, country_from_domain, country_from_phone
+
+
+class TestCallingCodeCountry:
+    def test_longest_prefix_wins(self):
+        assert calling_code_country("420123456789") == "CZ"
+        assert calling_code_country("40123456789") == "RO"
+
+    def test_nanp_area_codes(self):
+        assert calling_code_country("14165551234") == "CA"
+        assert calling_code_country("12125551234") == "US"
+        assert calling_code_country("18765551234") == "JM"
+
+    def test_kazakhstan_within_zone_7(self):
+        assert calling_code_country("77011234567") == "KZ"
+        assert calling_code_country("74951234567") == "RU"
+
+    def test_no_match(self):
+        assert calling_code_country("0301234567") is None
+
+
+class TestCountryFromPhone:
+    def test_plus_prefix(self):
+        assert country_from_phone("+49-30-1234567") == "DE"
+        assert country_from_phone("+352 26 12 34") == "LU"
+
+    def test_double_zero_prefix(self):
+        assert country_from_phone("0043 1 234 5678") == "AT"
+
+    def test_number_without_plus(self):
+        assert country_from_phone("4930123456789") == "DE"
+        assert country_from_phone("49 30 1234567") == "DE"
+        assert country_from_phone("1 416 555 1234") == "CA"
+
+    def test_short_number_without_plus_ignored(self):
+        assert country_from_phone("4930123456") is None
+        assert country_from_phone("1234567") is None
+
+    def test_nanp_national_numbers_ignored(self):
+        assert country_from_phone("(415) 555-1234") is None
+        assert country_from_phone("(212) 555-1234") is None
+        assert country_from_phone("555 123 4567") is None
+        assert country_from_phone("1 212 555 12345") is None
+
+    def test_trunk_prefix_ignored(self):
+        assert country_from_phone("030 1234567") is None
+        assert country_from_phone("0664 1302708") is None
+
+    def test_empty(self):
+        assert country_from_phone("") is None
+
+
+class TestCountryFromDomain:
+    def test_cctld(self):
+        assert country_from_domain("reha360.de") == "DE"
+        assert country_from_domain("acme.se") == "SE"
+
+    def test_uk_alias(self):
+        assert country_from_domain("acme.co.uk") == "GB"
+
+    def test_generic_tld(self):
+        assert country_from_domain("acme.com") is None
+
+    def test_vanity_tld(self):
+        assert country_from_domain("acme.io") is None
+        assert country_from_domain("acme.co") is None
+        assert country_from_domain("acme.com.co") == "CO"
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Unit tests for rate_limiter.py."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from brightdata_utils import BrightDataSession
+from rate_budget import RateBudgetManager, RemoteRateLimiter
+from rate_limiter import AdaptiveRateLimiter, classify_error
+
+
+class TestClassifyError:
+    """Tests for classify_error."""
+
+    def test_rate_limit_signals(self):
+        assert classify_error("HTTP 429: Too Many Requests") == "rate_limited"
+        assert classify_error("Rate limit exceeded") == "rate_limited"
+
+    def test_server_errors(self):
+        assert classify_error("HTTP 503: Service Unavailable") == "server_error"
+
+    def test_other_errors(self):
+        assert classify_error("HTTP 401: invalid token") is None
+        assert classify_error("") is None
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_enforces_rate(self):
+        limiter = AdaptiveRateLimiter(rate=50.0, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        # 1 burst token + 5 tokens at 50/s
+        assert time.monotonic() - start >= 0.09
+
+    def test_rate_limited_halves_rate_and_pauses(self):
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        pause = limiter.on_rate_limited()
+
+        assert limiter.rate == 2.0
+        assert limiter.rate_limited_count == 1
+        assert 0.5 <= pause <= 1.5
+
+    def test_backoff_grows_and_respects_retry_after(self):
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        first = limiter.on_server_error()
+        second = limiter.on_server_error()
+
+        assert 0.5 <= first <= 1.5
+        assert 1.0 <= second <= 3.0
+        assert limiter.on_rate_limited(retry_after=7.0) == 7.0
+        assert limiter.rate == 2.0  # server errors do not cut the rate
+
+    def test_rate_never_below_minimum(self):
+        limiter = AdaptiveRateLimiter(rate=1.0, min_rate=0.5)
+        for _ in range(10):
+            limiter.on_rate_limited(retry_after=0)
+        assert limiter.rate == 0.5
+
+    def test_recovers_after_success_streak(self):
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        limiter.on_rate_limited(retry_after=0)
+        for _ in range(40):
+            limiter.on_success()
+        assert 2.0 < limiter.rate <= limiter.max_rate
+
+
+    def test_burst_of_429s_is_one_congestion_event(self):
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        sent_at = time.monotonic()
+        pauses = [limiter.on_rate_limited(sent_at=sent_at) for _ in range(20)]
+
+        assert limiter.rate == 2.0
+        assert limiter.rate_limited_count == 20
+        assert 0.5 <= pauses[0] <= 1.5
+        assert max(pauses[1:]) <= pauses[0]
+
+    def test_in_flight_429_after_pause_is_coalesced(self):
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        sent_at = time.monotonic()
+        limiter.on_rate_limited(retry_after=0, sent_at=sent_at)
+        # Sent before the cut, answered after its pause ended
+        limiter.on_rate_limited(retry_after=0, sent_at=sent_at)
+        assert limiter.rate == 2.0
+
+        # A request sent after the cut is a new congestion event
+        limiter.on_rate_limited(retry_after=0, sent_at=time.monotonic())
+        assert limiter.rate == 1.0
+
+    def test_recovery_proportional_to_rate(self):
+        limiter = AdaptiveRateLimiter(rate=4.0, min_rate=0.2)
+        for _ in range(5):
+            limiter.on_rate_limited(retry_after=0)
+        assert limiter.rate == 0.2
+
+        successes = 0
+        while limiter.rate < 4.0:
+            limiter.on_success()
+            successes += 1
+        assert successes < 200
+
+
+class TestSessionThrottling:
+    """BrightDataSession retries throttled calls through its limiter."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self):
+        throttled = MagicMock(success=False, error="HTTP 429: Too Many Requests")
+        ok = MagicMock(success=True, data=[{"title": "Acme", "url": "https://acme.de", "description": ""}])
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(side_effect=[throttled, ok])
+
+        limiter = AdaptiveRateLimiter(rate=100.0)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", serp_limiter=limiter) as session:
+                with patch("rate_limiter.BASE_BACKOFF", 0.01):
+                    result = await session.search('"Acme"', "Germany")
+
+        assert result["success"] is True
+        assert mock_client.search.google.await_count == 2
+        assert limiter.rate_limited_count == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self):
+        failed = MagicMock(success=False, error="HTTP 401: invalid token")
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=failed)
+
+        limiter = AdaptiveRateLimiter(rate=100.0)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", serp_limiter=limiter) as session:
+                result = await session.search('"Acme"', "Germany")
+
+        assert result["success"] is False
+        assert "401" in result["error"]
+        assert mock_client.search.google.await_count == 1
+
+
+class TestSharedBudget:
+    """Limiters hosted by RateBudgetManager are shared across clients."""
+
+    def test_try_acquire_consumes_tokens(self):
+        limiter = AdaptiveRateLimiter(rate=1.0, burst=2)
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() > 0
+
+    @pytest.mark.asyncio
+    async def test_remote_limiters_draw_from_one_bucket(self):
+        with RateBudgetManager() as manager:
+            shared = manager.AdaptiveRateLimiter(1.0, 2)
+            first, second = RemoteRateLimiter(shared), RemoteRateLimiter(shared)
+
+            await first.acquire()
+            await second.acquire()
+            # Both burst tokens are gone for every client
+            assert shared.try_acquire() > 0
+
+            first.on_rate_limited(retry_after=30)
+            await first.flush()
+            assert second.rate_limited_count == 0
+            assert first.rate_limited_count == 1
+            assert shared.try_acquire() > 20
+
+    @pytest.mark.asyncio
+    async def test_remote_feedback_does_not_block_loop(self):
+        class SlowProxy:
+            def __init__(self):
+                self.calls = []
+
+            def on_success(self):
+                time.sleep(0.1)
+                self.calls.append("on_success")
+
+            def on_rate_limited(self, retry_after, sent_at):
+                self.calls.append("on_rate_limited")
+
+        proxy = SlowProxy()
+        limiter = RemoteRateLimiter(proxy)
+        start = time.monotonic()
+        limiter.on_success()
+        limiter.on_rate_limited()
+        assert time.monotonic() - start < 0.05
+
+        await limiter.flush()
+        assert proxy.calls == ["on_success", "on_rate_limited"]
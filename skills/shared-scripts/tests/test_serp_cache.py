@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Unit tests for serp_cache.py."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import serp_cache
+from brightdata_utils import BrightDataSession
+from serp_cache import ScrapeCache, SerpCache, make_cache_key
+
+RESULTS = [{"title": "Acme", "url": "https://acme.de", "snippet": "Acme GmbH"}]
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_same_request_same_key(self):
+        assert make_cache_key('"Acme"', "Germany", "de", 10) == make_cache_key('"Acme"', "Germany", "de", 10)
+
+    def test_each_field_changes_key(self):
+        base = make_cache_key('"Acme"', "Germany", "de", 10)
+        assert make_cache_key('"Acme AG"', "Germany", "de", 10) != base
+        assert make_cache_key('"Acme"', "Austria", "de", 10) != base
+        assert make_cache_key('"Acme"', "Germany", "en", 10) != base
+        assert make_cache_key('"Acme"', "Germany", "de", 5) != base
+
+
+class TestSerpCache:
+    """Tests for SerpCache."""
+
+    def test_round_trip_and_hit_rate(self, tmp_path):
+        cache = SerpCache(tmp_path)
+        key = cache.make_key('"Acme"', "Germany", "de", 10)
+
+        assert cache.get(key) is None
+        cache.put(key, RESULTS)
+        assert cache.get(key) == RESULTS
+        assert cache.stats() == {"hits": 1, "negative_hits": 0, "misses": 1, "hit_rate": 0.5}
+
+    def test_persists_across_instances(self, tmp_path):
+        key = make_cache_key('"Acme"', "Germany", "de", 10)
+        first = SerpCache(tmp_path)
+        first.put(key, RESULTS)
+        first.close()
+
+        assert SerpCache(tmp_path).get(key) == RESULTS
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = SerpCache(tmp_path, ttl_days=1)
+        key = cache.make_key('"Acme"', "Germany", "de", 10)
+        cache.put(key, RESULTS)
+
+        with patch.object(serp_cache.time, "time", return_value=time.time() + 2 * 86400):
+            assert cache.get(key) is None
+
+    def test_negative_entry_uses_shorter_ttl(self, tmp_path):
+        cache = SerpCache(tmp_path, ttl_days=7, negative_ttl_days=1)
+        hit = cache.make_key('"Acme"', "Germany", "de", 10)
+        miss = cache.make_key('"Nobody"', "Germany", "de", 10)
+        cache.put(hit, RESULTS)
+        cache.put(miss, [], negative=True)
+
+        assert cache.get(miss) == []
+        assert cache.negative_hits == 1
+        with patch.object(serp_cache.time, "time", return_value=time.time() + 2 * 86400):
+            assert cache.get(miss) is None
+            assert cache.get(hit) == RESULTS
+            cache.evict()
+        assert cache._conn.execute("SELECT COUNT(*) FROM serp_responses").fetchone()[0] == 1
+
+    def test_upgrades_database_without_negative_column(self, tmp_path):
+        import sqlite3
+        conn = sqlite3.connect(str(tmp_path / serp_cache.CACHE_FILENAME))
+        conn.execute(
+            "CREATE TABLE serp_responses (key TEXT PRIMARY KEY, payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO serp_responses VALUES ('k', '[]', 2, ?, ?)", (time.time(), time.time()))
+        conn.commit()
+        conn.close()
+
+        cache = SerpCache(tmp_path)
+        assert cache.get("k") == []
+        assert cache.negative_hits == 0
+
+    def test_evicts_least_recently_used_over_size_limit(self, tmp_path):
+        cache = SerpCache(tmp_path, max_bytes=250)
+        keys = [cache.make_key(f"q{i}", "Germany", "de", 10) for i in range(4)]
+        for key in keys:
+            cache.put(key, RESULTS)
+        # Touch the first entry so the second becomes least recently used
+        cache.get(keys[0])
+
+        cache.evict()
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == RESULTS
+
+
+    def test_hits_do_not_write_until_close(self, tmp_path):
+        import sqlite3
+
+        cache = SerpCache(tmp_path)
+        key = cache.make_key('"Acme"', "Germany", "de", 10)
+        cache.put(key, RESULTS)
+
+        def accessed_at():
+            with sqlite3.connect(str(cache.path)) as conn:
+                return conn.execute(
+                    "SELECT accessed_at FROM serp_responses WHERE key = ?", (key,)
+                ).fetchone()[0]
+
+        stored = accessed_at()
+
+        time.sleep(0.01)
+        assert cache.get(key) == RESULTS
+        assert cache._conn.in_transaction is False
+        assert accessed_at() == stored
+
+        cache.close()
+        assert accessed_at() > stored
+
+
+class TestScrapeCache:
+    """Tests for ScrapeCache."""
+
+    URL = "https://www.linkedin.com/company/acme"
+
+    def test_round_trip(self, tmp_path):
+        cache = ScrapeCache(tmp_path)
+        assert cache.get(self.URL) is None
+        cache.put(self.URL, {"employee_count": "51-200", "industry": None})
+        assert cache.get(self.URL) == {"employee_count": "51-200", "industry": None}
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+    def test_shares_database_with_serp_cache(self, tmp_path):
+        serp = SerpCache(tmp_path)
+        scrape = ScrapeCache(tmp_path)
+        scrape.put(self.URL, {"followers": "1234"})
+        assert scrape.path == serp.path
+        assert serp.get(self.URL) is None
+
+    def test_expires_after_ttl(self, tmp_path):
+        cache = ScrapeCache(tmp_path, ttl_days=28)
+        cache.put(self.URL, {"followers": "1234"})
+
+        with patch.object(serp_cache.time, "time", return_value=time.time() + 27 * 86400):
+            assert cache.get(self.URL) == {"followers": "1234"}
+        with patch.object(serp_cache.time, "time", return_value=time.time() + 29 * 86400):
+            assert cache.get(self.URL) is None
+            assert cache.evict() == 1
+
+
+class TestSessionCache:
+    """BrightDataSession answers repeated searches from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_search_is_served_from_cache(self, tmp_path):
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = [{"title": "Acme", "url": "https://acme.de", "description": "Acme GmbH"}]
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=mock_results)
+
+        cache = SerpCache(tmp_path)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", cache=cache) as session:
+                first = await session.search('"Acme"', "Germany", "de", 10)
+                second = await session.search('"Acme"', "Germany", "de", 10)
+
+        assert mock_client.search.google.await_count == 1
+        assert second["cached"] is True
+        assert second["results"] == first["results"] == RESULTS
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(self, tmp_path):
+        mock_results = MagicMock()
+        mock_results.success = False
+        mock_results.error = "timeout"
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=mock_results)
+
+        cache = SerpCache(tmp_path)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", cache=cache) as session:
+                await session.search('"Acme"', "Germany", "de", 10)
+                await session.search('"Acme"', "Germany", "de", 10)
+
+        assert mock_client.search.google.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_miss_predicate_marks_entry_negative(self, tmp_path):
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = []
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=mock_results)
+
+        cache = SerpCache(tmp_path, negative_ttl_days=1)
+        with patch("brightdata.BrightDataClient", return_value=mock_client):
+            async with BrightDataSession("test_key", cache=cache) as session:
+                await session.search('"Nobody"', "Germany", is_miss=lambda items: not items)
+                again = await session.search('"Nobody"', "Germany", is_miss=lambda items: not items)
+
+        assert again["cached"] is True
+        assert cache.negative_hits == 1
+        with patch.object(serp_cache.time, "time", return_value=time.time() + 2 * 86400):
+            assert cache.get(cache.make_key('"Nobody"', "Germany", "en", 10)) is None
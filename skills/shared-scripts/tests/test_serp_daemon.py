@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Unit tests for serp_daemon.py and the serp_search.py daemon mode."""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import serp_search
+from serp_daemon import forward, serve
+
+
+@asynccontextmanager
+async def running_daemon(socket_path, handler):
+    """Serve `handler` on `socket_path` for the duration of the block."""
+    stop = asyncio.Event()
+    ready = asyncio.Event()
+    task = asyncio.create_task(serve(socket_path, handler, stop=stop, ready=ready.set))
+    await asyncio.wait_for(ready.wait(), 5)
+    try:
+        yield
+    finally:
+        stop.set()
+        await task
+
+
+def cli_args(tmp_path, *argv) -> argparse.Namespace:
+    """Namespace as parsed by serp_search.main for `argv`."""
+    args = argparse.Namespace(
+        query=None, country="US", language="en", num_results=20, batch=None,
+        linkedin_company=None, linkedin_person=None, skill="lead-enricher",
+        cache_dir=tmp_path / "cache", cache_ttl=7.0, no_cache=False,
+    )
+    for name, value in zip(argv[::2], argv[1::2]):
+        setattr(args, name, value)
+    return args
+
+
+class TestTransport:
+    @pytest.mark.asyncio
+    async def test_no_daemon(self, tmp_path):
+        assert await forward(tmp_path / "missing.sock", {"command": {}}) is None
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+
+        async def handler(request):
+            return {"success": True, "echo": request, "blob": "x" * 200_000}
+
+        async with running_daemon(socket_path, handler):
+            assert socket_path.stat().st_mode & 0o777 == 0o600
+            responses = await asyncio.gather(*(forward(socket_path, {"n": i}) for i in range(5)))
+
+        assert [r["echo"]["n"] for r in responses] == list(range(5))
+        assert len(responses[0]["blob"]) == 200_000
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_declined_and_failed_requests(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+
+        async def handler(request):
+            if request["kind"] == "decline":
+                return None
+            raise RuntimeError("boom")
+
+        async with running_daemon(socket_path, handler):
+            assert await forward(socket_path, {"kind": "decline"}) is None
+            assert await forward(socket_path, {"kind": "fail"}) == {"error": "boom", "success": False}
+
+    @pytest.mark.asyncio
+    async def test_stale_socket_replaced(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+        socket_path.write_text("")
+
+        async def handler(request):
+            return {"success": True}
+
+        async with running_daemon(socket_path, handler):
+            assert await forward(socket_path, {}) == {"success": True}
+
+    @pytest.mark.asyncio
+    async def test_second_daemon_refused(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+
+        async def handler(request):
+            return {"success": True}
+
+        async with running_daemon(socket_path, handler):
+            with pytest.raises(RuntimeError):
+                await serve(socket_path, handler, stop=asyncio.Event())
+            assert await forward(socket_path, {}) == {"success": True}
+
+
+class TestSearchDaemon:
+    @pytest.mark.asyncio
+    async def test_calls_share_one_client(self, tmp_path):
+        mock_results = MagicMock(success=True, data=[
+            {"title": "Acme | LinkedIn", "url": "https://linkedin.com/company/acme", "description": ""},
+        ])
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=mock_results)
+
+        daemon = serp_search.SearchDaemon(cli_args(tmp_path))
+        with patch.object(serp_search, "get_api_key", return_value="test-key") as get_key, \
+                patch("brightdata.BrightDataClient", return_value=mock_client) as client_cls:
+            for company in ("Acme", "Beta", "Acme"):
+                request = serp_search.daemon_request(cli_args(tmp_path, "linkedin_company", company))
+                result = await daemon.handle(json.loads(json.dumps(request)))
+                assert result["success"] is True
+            await daemon.close()
+
+        assert client_cls.call_count == 1
+        assert get_key.call_count == 1
+        # The repeated company is answered from the daemon's cache
+        assert mock_client.search.google.await_count == 2
+        mock_client.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_declines_other_cache_settings(self, tmp_path):
+        daemon = serp_search.SearchDaemon(cli_args(tmp_path))
+        request = serp_search.daemon_request(
+            cli_args(tmp_path, "query", "acme", "no_cache", True)
+        )
+
+        assert await daemon.handle(request) is None
+        await daemon.close()
+
+
+class TestCliForwarding:
+    @pytest.mark.asyncio
+    async def test_forwards_to_running_daemon(self, tmp_path, capsys):
+        socket_path = tmp_path / "d.sock"
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            return {"success": True, "linkedin_url": "https://linkedin.com/in/jdoe"}
+
+        argv = ["serp_search.py", "--socket", str(socket_path), "--cache-dir", str(tmp_path / "cache"),
+                "--linkedin-person", "John Doe", "Acme Corp", "DE"]
+        async with running_daemon(socket_path, handler):
+            with patch.object(sys, "argv", argv), \
+                    patch.object(serp_search, "run_locally", AsyncMock()) as run_locally:
+                await serp_search.main()
+
+        run_locally.assert_not_awaited()
+        assert requests[0]["command"]["linkedin_person"] == ["John Doe", "Acme Corp"]
+        assert requests[0]["cache"]["dir"] == str((tmp_path / "cache").resolve())
+        assert json.loads(capsys.readouterr().out)["linkedin_url"] == "https://linkedin.com/in/jdoe"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_daemon(self, tmp_path, capsys):
+        argv = ["serp_search.py", "--socket", str(tmp_path / "d.sock"), "acme"]
+        local = AsyncMock(return_value={"success": True, "results": []})
+        with patch.object(sys, "argv", argv), patch.object(serp_search, "run_locally", local):
+            await serp_search.main()
+
+        local.assert_awaited_once()
+        assert json.loads(capsys.readouterr().out)["success"] is True
@@ -193,6 +193,25 @@ class TestSearchBatch:
         assert result["total_queries"] == 3
         assert len(result["results_by_query"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_batch_search_shares_one_client(self):
+        """Batch search opens a single client for all queries."""
+        mock_results = MagicMock()
+        mock_results.success = True
+        mock_results.data = []
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.search.google = AsyncMock(return_value=mock_results)
+
+        with patch.object(serp_search, "get_api_key", return_value="test_key"):
+            with patch("brightdata.BrightDataClient", return_value=mock_client) as client_cls:
+                await serp_search.search_batch(["query 1", "query 2", "query 3"], "US", "en", 10)
+
+        assert client_cls.call_count == 1
+        assert mock_client.search.google.await_count == 3
+
 
 class TestCountryToLocationDelegation:
     """Tests for country_to_location delegation in serp_search."""
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Unit tests for single_flight.py."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"value": 1} for r in results)
+        assert flights.shared == 4
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_key_is_forgotten_after_completion(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flights.do("k", fetch) == 1
+        assert await flights.do("k", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_waiter(self):
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", fail), flights.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flights.do("k", fetch))
+        second = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
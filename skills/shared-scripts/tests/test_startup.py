@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Import-time checks for the serp_search.py CLI (run as a subprocess per query)."""
+
+import json
+import os
+import subprocess
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from brightdata_utils import country_to_location
+from serp_cache import SerpCache
+
+# Modules a lookup must not load unless it calls the API or runs workers
+HEAVY_MODULES = ("brightdata", "aiohttp", "multiprocessing.managers")
+
+# Cumulative import time of serp_search, in microseconds
+IMPORT_BUDGET_US = 100_000
+
+
+def import_times(args: list[str], env: dict = None) -> tuple[dict, subprocess.CompletedProcess]:
+    """
+    Run Python with -X importtime.
+
+    Returns:
+        Tuple of (module -> cumulative import microseconds, completed process)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        timeout=60,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times, proc
+
+
+class TestStartup:
+    def test_import_skips_heavy_modules(self):
+        times, proc = import_times(["-c", "import serp_search; serp_search.ensure_sdk_installed()"])
+
+        assert proc.returncode == 0, proc.stderr
+        assert "serp_search" in times
+        assert [m for m in HEAVY_MODULES if m in times] == []
+
+    @pytest.mark.benchmark
+    def test_import_time_budget(self):
+        # Timing depends on the machine, so this only runs with -m benchmark;
+        # test_import_skips_heavy_modules is the gating check. Best of three.
+        best = min(
+            import_times(["-c", "import serp_search"])[0]["serp_search"] for _ in range(3)
+        )
+        assert best < IMPORT_BUDGET_US
+
+    @pytest.mark.skipif(find_spec("brightdata") is None, reason="brightdata-sdk not installed")
+    def test_cached_lookup_never_loads_sdk(self, tmp_path):
+        query = "cleaning robot distributor France"
+        cache = SerpCache(tmp_path)
+        results = [{"title": "Acme", "url": "https://acme.fr/", "snippet": ""}]
+        cache.put(cache.make_key(query, country_to_location("FR"), "fr", 20), results)
+        cache.close()
+
+        times, proc = import_times(
+            ["serp_search.py", "--cache-dir", str(tmp_path), query, "FR", "fr", "20"],
+            env={"BRIGHTDATA_SERP_API_KEY": "test-api-key-0123456789"},
+        )
+
+        assert json.loads(proc.stdout)["results"] == results
+        assert [m for m in HEAVY_MODULES if m in times] == []